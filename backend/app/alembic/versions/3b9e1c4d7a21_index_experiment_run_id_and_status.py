@@ -0,0 +1,27 @@
+"""Index experiment run_id and status
+
+Revision ID: 3b9e1c4d7a21
+Revises: 10f709793126
+Create Date: 2024-11-04 10:12:41.518203
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3b9e1c4d7a21"
+down_revision: Union[str, None] = "10f709793126"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f("ix_experiment_run_id"), "experiment", ["run_id"], unique=False)
+    op.create_index(op.f("ix_experiment_status"), "experiment", ["status"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_experiment_status"), table_name="experiment")
+    op.drop_index(op.f("ix_experiment_run_id"), table_name="experiment")
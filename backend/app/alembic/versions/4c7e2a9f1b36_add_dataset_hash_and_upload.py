@@ -0,0 +1,50 @@
+"""Add dataset sha256/size and dataset_upload
+
+Revision ID: 4c7e2a9f1b36
+Revises: 9e4b7d2a6c18
+Create Date: 2024-11-22 10:37:52.184903
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4c7e2a9f1b36"
+down_revision: Union[str, None] = "9e4b7d2a6c18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("dataset", sa.Column("sha256", sa.String(length=64), nullable=True))
+    op.add_column("dataset", sa.Column("size", sa.BigInteger(), nullable=True))
+    op.create_index(op.f("ix_dataset_sha256"), "dataset", ["sha256"], unique=False)
+    op.create_table(
+        "dataset_upload",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("description", sa.String(length=500), nullable=True),
+        sa.Column("file_name", sa.String(length=255), nullable=False),
+        sa.Column("size", sa.BigInteger(), nullable=True),
+        sa.Column("sha256", sa.String(length=64), nullable=True),
+        sa.Column("status", sa.String(length=2), nullable=False),
+        sa.Column("dataset_id", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.TIMESTAMP(), nullable=False),
+        sa.Column("created_by", sa.String(length=40), nullable=True),
+        sa.Column("updated_at", sa.TIMESTAMP(), nullable=True),
+        sa.Column("updated_by", sa.String(length=40), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["dataset_id"],
+            ["dataset.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("dataset_upload")
+    op.drop_index(op.f("ix_dataset_sha256"), table_name="dataset")
+    op.drop_column("dataset", "size")
+    op.drop_column("dataset", "sha256")
@@ -0,0 +1,38 @@
+"""Index experiment foreign keys and metric values
+
+Revision ID: 5e8a3f61c9d2
+Revises: c41d7e9b2f05
+Create Date: 2024-11-11 16:22:09.771350
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e8a3f61c9d2"
+down_revision: Union[str, None] = "c41d7e9b2f05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f("ix_experiment_model_id"), "experiment", ["model_id"], unique=False)
+    op.create_index(op.f("ix_hyperparameter_experiment_id"), "hyperparameter", ["experiment_id"], unique=False)
+    op.create_index(op.f("ix_experiment_log_experiment_id"), "experiment_log", ["experiment_id"], unique=False)
+    op.create_index(op.f("ix_resource_usage_experiment_id"), "resource_usage", ["experiment_id"], unique=False)
+    op.create_index(
+        "ix_metric_experiment_id_metric_name_value",
+        "metric",
+        ["experiment_id", "metric_name", "metric_value"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_metric_experiment_id_metric_name_value", table_name="metric")
+    op.drop_index(op.f("ix_resource_usage_experiment_id"), table_name="resource_usage")
+    op.drop_index(op.f("ix_experiment_log_experiment_id"), table_name="experiment_log")
+    op.drop_index(op.f("ix_hyperparameter_experiment_id"), table_name="hyperparameter")
+    op.drop_index(op.f("ix_experiment_model_id"), table_name="experiment")
@@ -0,0 +1,55 @@
+"""Add pipeline_cache_invalidation
+
+Revision ID: 6d3a9c5e8f21
+Revises: 4c7e2a9f1b36
+Create Date: 2024-11-22 16:48:09.327415
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6d3a9c5e8f21"
+down_revision: Union[str, None] = "4c7e2a9f1b36"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "pipeline_cache_invalidation",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("dataset_id", sa.Integer(), nullable=True),
+        sa.Column("model_registry_id", sa.Integer(), nullable=True),
+        sa.Column("reason", sa.String(length=500), nullable=True),
+        sa.Column("created_at", sa.TIMESTAMP(), nullable=False),
+        sa.Column("created_by", sa.String(length=40), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["dataset_id"],
+            ["dataset.id"],
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["model_registry_id"],
+            ["model_registry.id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_pipeline_cache_invalidation_dataset_id"), "pipeline_cache_invalidation", ["dataset_id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_pipeline_cache_invalidation_model_registry_id"),
+        "pipeline_cache_invalidation",
+        ["model_registry_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_pipeline_cache_invalidation_model_registry_id"), table_name="pipeline_cache_invalidation")
+    op.drop_index(op.f("ix_pipeline_cache_invalidation_dataset_id"), table_name="pipeline_cache_invalidation")
+    op.drop_table("pipeline_cache_invalidation")
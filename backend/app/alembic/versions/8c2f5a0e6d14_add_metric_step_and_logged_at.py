@@ -0,0 +1,27 @@
+"""Add metric step and logged_at
+
+Revision ID: 8c2f5a0e6d14
+Revises: 3b9e1c4d7a21
+Create Date: 2024-11-06 14:03:27.902114
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8c2f5a0e6d14"
+down_revision: Union[str, None] = "3b9e1c4d7a21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("metric", sa.Column("step", sa.BigInteger(), nullable=True))
+    op.add_column("metric", sa.Column("logged_at", sa.TIMESTAMP(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("metric", "logged_at")
+    op.drop_column("metric", "step")
@@ -0,0 +1,25 @@
+"""Add model_registry artifact_sha256
+
+Revision ID: 9e4b7d2a6c18
+Revises: d8a1c6f4e2b7
+Create Date: 2024-11-21 14:02:17.550384
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9e4b7d2a6c18"
+down_revision: Union[str, None] = "d8a1c6f4e2b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("model_registry", sa.Column("artifact_sha256", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("model_registry", "artifact_sha256")
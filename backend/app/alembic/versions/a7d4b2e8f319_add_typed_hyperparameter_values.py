@@ -0,0 +1,88 @@
+"""Add typed hyperparameter values
+
+Revision ID: a7d4b2e8f319
+Revises: 5e8a3f61c9d2
+Create Date: 2024-11-13 11:05:48.336912
+
+"""
+import math
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7d4b2e8f319"
+down_revision: Union[str, None] = "5e8a3f61c9d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+hyperparameter = sa.table(
+    "hyperparameter",
+    sa.column("id", sa.BigInteger()),
+    sa.column("param_value", sa.String()),
+    sa.column("numeric_value", sa.Double()),
+    sa.column("categorical_value", sa.String()),
+)
+
+
+def _split_value(value: str) -> tuple[float | None, str | None]:
+    # db.models.experiment.split_hyperparameter_value 와 같은 규칙 (migration 시점의 규칙을 고정)
+    try:
+        number = float(value)
+    except ValueError:
+        return None, value[:255]
+    if math.isfinite(number):
+        return number, None
+    return None, value[:255]
+
+
+def upgrade() -> None:
+    op.add_column("hyperparameter", sa.Column("numeric_value", sa.Double(), nullable=True))
+    op.add_column("hyperparameter", sa.Column("categorical_value", sa.String(length=255), nullable=True))
+
+    # 기존 param_value 를 typed column 으로 backfill
+    connection = op.get_bind()
+    update = (
+        hyperparameter.update()
+        .where(hyperparameter.c.id == sa.bindparam("b_id"))
+        .values(numeric_value=sa.bindparam("b_numeric_value"), categorical_value=sa.bindparam("b_categorical_value"))
+    )
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(hyperparameter.c.id, hyperparameter.c.param_value)
+            .where(hyperparameter.c.id > last_id)
+            .order_by(hyperparameter.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        params = []
+        for row_id, param_value in rows:
+            numeric_value, categorical_value = _split_value(param_value)
+            params.append({"b_id": row_id, "b_numeric_value": numeric_value, "b_categorical_value": categorical_value})
+        connection.execute(update, params)
+        last_id = rows[-1][0]
+
+    op.create_index(
+        "ix_hyperparameter_param_type_id_numeric_value",
+        "hyperparameter",
+        ["param_type_id", "numeric_value", "experiment_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_hyperparameter_param_type_id_categorical_value",
+        "hyperparameter",
+        ["param_type_id", "categorical_value", "experiment_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_hyperparameter_param_type_id_categorical_value", table_name="hyperparameter")
+    op.drop_index("ix_hyperparameter_param_type_id_numeric_value", table_name="hyperparameter")
+    op.drop_column("hyperparameter", "categorical_value")
+    op.drop_column("hyperparameter", "numeric_value")
@@ -0,0 +1,189 @@
+"""Store experiment log as compressed chunks
+
+Revision ID: b3f7e1a9c5d2
+Revises: f5c9a2d7e613
+Create Date: 2024-11-19 15:12:40.803126
+
+"""
+import zlib
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b3f7e1a9c5d2"
+down_revision: Union[str, None] = "f5c9a2d7e613"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CHUNK_SIZE = 256 * 1024
+BACKFILL_BATCH_SIZE = 100
+
+experiment_log = sa.table(
+    "experiment_log",
+    sa.column("id", sa.BigInteger()),
+    sa.column("experiment_id", sa.BigInteger()),
+    sa.column("content", sa.Text()),
+    sa.column("created_at", sa.TIMESTAMP()),
+    sa.column("updated_at", sa.TIMESTAMP()),
+)
+
+experiment_log_chunk = sa.table(
+    "experiment_log_chunk",
+    sa.column("experiment_id", sa.BigInteger()),
+    sa.column("seq", sa.BigInteger()),
+    sa.column("byte_offset", sa.BigInteger()),
+    sa.column("line_offset", sa.BigInteger()),
+    sa.column("byte_count", sa.Integer()),
+    sa.column("line_count", sa.Integer()),
+    sa.column("content", sa.LargeBinary()),
+    sa.column("created_at", sa.TIMESTAMP()),
+    sa.column("updated_at", sa.TIMESTAMP()),
+)
+
+
+def _backfill_experiment(connection, experiment_id: int):
+    # experiment 의 기존 log row 를 id 순서로 이어 붙여 chunk 로 나눈다.
+    seq = byte_offset = line_offset = 0
+    buffer = bytearray()
+    created_at = updated_at = None
+
+    def write(data: bytes):
+        nonlocal seq, byte_offset, line_offset
+        line_count = data.count(b"\n")
+        connection.execute(
+            experiment_log_chunk.insert().values(
+                experiment_id=experiment_id,
+                seq=seq,
+                byte_offset=byte_offset,
+                line_offset=line_offset,
+                byte_count=len(data),
+                line_count=line_count,
+                content=zlib.compress(data),
+                created_at=created_at,
+                updated_at=updated_at,
+            )
+        )
+        seq += 1
+        byte_offset += len(data)
+        line_offset += line_count
+
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(
+                experiment_log.c.id, experiment_log.c.content, experiment_log.c.created_at, experiment_log.c.updated_at
+            )
+            .where(experiment_log.c.experiment_id == experiment_id, experiment_log.c.id > last_id)
+            .order_by(experiment_log.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        for _, content, row_created_at, row_updated_at in rows:
+            created_at = created_at or row_created_at
+            updated_at = row_updated_at or row_created_at
+            buffer += content.encode()
+            while len(buffer) >= CHUNK_SIZE:
+                write(bytes(buffer[:CHUNK_SIZE]))
+                del buffer[:CHUNK_SIZE]
+        last_id = rows[-1][0]
+    if buffer:
+        write(bytes(buffer))
+
+
+def upgrade() -> None:
+    op.create_table(
+        "experiment_log_chunk",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("experiment_id", sa.BigInteger(), nullable=False),
+        sa.Column("seq", sa.BigInteger(), nullable=False),
+        sa.Column("byte_offset", sa.BigInteger(), nullable=False),
+        sa.Column("line_offset", sa.BigInteger(), nullable=False),
+        sa.Column("byte_count", sa.Integer(), nullable=False),
+        sa.Column("line_count", sa.Integer(), nullable=False),
+        sa.Column("content", sa.LargeBinary(length=16777215), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(), nullable=False),
+        sa.Column("created_by", sa.String(length=40), nullable=True),
+        sa.Column("updated_at", sa.TIMESTAMP(), nullable=True),
+        sa.Column("updated_by", sa.String(length=40), nullable=True),
+        sa.Column("deleted_at", sa.TIMESTAMP(), nullable=True),
+        sa.Column("deleted_by", sa.String(length=40), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["experiment_id"],
+            ["experiment.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("experiment_id", "seq", name="uq_experiment_log_chunk_experiment_id_seq"),
+    )
+    op.create_index(
+        "ix_experiment_log_chunk_experiment_id_byte_offset",
+        "experiment_log_chunk",
+        ["experiment_id", "byte_offset"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_experiment_log_chunk_experiment_id_line_offset",
+        "experiment_log_chunk",
+        ["experiment_id", "line_offset", "seq"],
+        unique=False,
+    )
+
+    connection = op.get_bind()
+    experiment_ids = connection.execute(
+        sa.select(experiment_log.c.experiment_id).distinct().order_by(experiment_log.c.experiment_id)
+    ).scalars()
+    for experiment_id in list(experiment_ids):
+        _backfill_experiment(connection, experiment_id)
+
+    op.drop_index(op.f("ix_experiment_log_experiment_id"), table_name="experiment_log")
+    op.drop_table("experiment_log")
+
+
+def downgrade() -> None:
+    op.create_table(
+        "experiment_log",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("experiment_id", sa.BigInteger(), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(), nullable=False),
+        sa.Column("created_by", sa.String(length=40), nullable=True),
+        sa.Column("updated_at", sa.TIMESTAMP(), nullable=True),
+        sa.Column("updated_by", sa.String(length=40), nullable=True),
+        sa.Column("deleted_at", sa.TIMESTAMP(), nullable=True),
+        sa.Column("deleted_by", sa.String(length=40), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["experiment_id"],
+            ["experiment.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_experiment_log_experiment_id"), "experiment_log", ["experiment_id"], unique=False)
+
+    # experiment 별 chunk 를 하나의 log row 로 되돌린다.
+    connection = op.get_bind()
+    experiment_ids = connection.execute(
+        sa.select(experiment_log_chunk.c.experiment_id).distinct().order_by(experiment_log_chunk.c.experiment_id)
+    ).scalars()
+    for experiment_id in list(experiment_ids):
+        rows = connection.execute(
+            sa.select(
+                experiment_log_chunk.c.content, experiment_log_chunk.c.created_at, experiment_log_chunk.c.updated_at
+            )
+            .where(experiment_log_chunk.c.experiment_id == experiment_id)
+            .order_by(experiment_log_chunk.c.seq)
+        ).all()
+        content = b"".join(zlib.decompress(row.content) for row in rows)
+        connection.execute(
+            experiment_log.insert().values(
+                experiment_id=experiment_id,
+                content=content.decode(errors="replace"),
+                created_at=rows[0].created_at,
+                updated_at=rows[-1].updated_at,
+            )
+        )
+
+    op.drop_index("ix_experiment_log_chunk_experiment_id_line_offset", table_name="experiment_log_chunk")
+    op.drop_index("ix_experiment_log_chunk_experiment_id_byte_offset", table_name="experiment_log_chunk")
+    op.drop_table("experiment_log_chunk")
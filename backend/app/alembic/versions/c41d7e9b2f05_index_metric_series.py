@@ -0,0 +1,27 @@
+"""Index metric series
+
+Revision ID: c41d7e9b2f05
+Revises: 8c2f5a0e6d14
+Create Date: 2024-11-08 09:41:55.207836
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c41d7e9b2f05"
+down_revision: Union[str, None] = "8c2f5a0e6d14"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_metric_experiment_id_metric_name_step", "metric", ["experiment_id", "metric_name", "step"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_metric_experiment_id_metric_name_step", table_name="metric")
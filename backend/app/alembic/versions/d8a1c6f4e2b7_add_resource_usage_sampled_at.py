@@ -0,0 +1,40 @@
+"""Add resource_usage sampled_at
+
+Revision ID: d8a1c6f4e2b7
+Revises: b3f7e1a9c5d2
+Create Date: 2024-11-20 10:36:52.419067
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d8a1c6f4e2b7"
+down_revision: Union[str, None] = "b3f7e1a9c5d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+resource_usage = sa.table(
+    "resource_usage",
+    sa.column("created_at", sa.TIMESTAMP()),
+    sa.column("sampled_at", sa.TIMESTAMP()),
+)
+
+
+def upgrade() -> None:
+    op.add_column("resource_usage", sa.Column("sampled_at", sa.TIMESTAMP(), nullable=True))
+    # 기존 row 는 생성 시각을 수집 시각으로 본다.
+    op.execute(resource_usage.update().values(sampled_at=resource_usage.c.created_at))
+    op.create_index(
+        "ix_resource_usage_experiment_id_sampled_at", "resource_usage", ["experiment_id", "sampled_at"], unique=False
+    )
+    # (experiment_id, sampled_at) index 가 foreign key index 를 대신한다.
+    op.drop_index(op.f("ix_resource_usage_experiment_id"), table_name="resource_usage")
+
+
+def downgrade() -> None:
+    op.create_index(op.f("ix_resource_usage_experiment_id"), "resource_usage", ["experiment_id"], unique=False)
+    op.drop_index("ix_resource_usage_experiment_id_sampled_at", table_name="resource_usage")
+    op.drop_column("resource_usage", "sampled_at")
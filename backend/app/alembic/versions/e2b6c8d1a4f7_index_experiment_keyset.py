@@ -0,0 +1,30 @@
+"""Index experiment keyset pagination
+
+Revision ID: e2b6c8d1a4f7
+Revises: a7d4b2e8f319
+Create Date: 2024-11-15 13:47:30.614208
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2b6c8d1a4f7"
+down_revision: Union[str, None] = "a7d4b2e8f319"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_experiment_created_at_id", "experiment", ["created_at", "id"], unique=False)
+    # status 단독 index 는 (status, created_at, id) 의 prefix 로 대체한다.
+    op.create_index("ix_experiment_status_created_at_id", "experiment", ["status", "created_at", "id"], unique=False)
+    op.drop_index("ix_experiment_status", table_name="experiment")
+
+
+def downgrade() -> None:
+    op.create_index("ix_experiment_status", "experiment", ["status"], unique=False)
+    op.drop_index("ix_experiment_status_created_at_id", table_name="experiment")
+    op.drop_index("ix_experiment_created_at_id", table_name="experiment")
@@ -0,0 +1,34 @@
+"""Add reference_version
+
+Revision ID: f5c9a2d7e613
+Revises: e2b6c8d1a4f7
+Create Date: 2024-11-18 10:28:14.092551
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f5c9a2d7e613"
+down_revision: Union[str, None] = "e2b6c8d1a4f7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+REFERENCE_NAMES = ["model_format", "model_provider", "model_type", "hyperparameter_type", "image_registry"]
+
+
+def upgrade() -> None:
+    reference_version = op.create_table(
+        "reference_version",
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.Column("updated_at", sa.TIMESTAMP(), nullable=True),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    op.bulk_insert(reference_version, [{"name": name, "version": 0} for name in REFERENCE_NAMES])
+
+
+def downgrade() -> None:
+    op.drop_table("reference_version")
@@ -1,4 +1,4 @@
-from config.db.session import SessionLocal
+from config.db.session import AsyncSessionLocal, SessionLocal
 from fastapi import Depends
 
 
@@ -13,4 +13,14 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception as e:
+            await db.rollback()
+            raise e
+
+
 SessionDepends = Depends(get_db)
+AsyncSessionDepends = Depends(get_async_db)
@@ -1,5 +1,6 @@
 from config.settings import get_settings
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 settings = get_settings()
@@ -8,9 +9,28 @@ engine = create_engine(
     settings.get_db_uri,
     echo=False,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-    pool_timeout=30,
-    pool_recycle=1800,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# sqlite(aiosqlite) 는 QueuePool 설정을 사용하지 않는다.
+async_pool_options = (
+    {}
+    if settings.DB_ASYNC_TYPE.startswith("sqlite")
+    else dict(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+    )
+)
+async_engine = create_async_engine(
+    settings.get_async_db_uri,
+    echo=False,
+    pool_pre_ping=True,
+    **async_pool_options,
+)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
@@ -20,6 +20,51 @@ class Settings(BaseSettings):
     KUBEFLOW_USERNAME: str
     KUBEFLOW_PASSWORD: str
     KUBEFLOW_NAMESPACE: str
+    KUBEFLOW_CLIENT_POOL_SIZE: int = 16  # 동시에 유지할 KubeflowManager 최대 개수
+    KUBEFLOW_CLIENT_IDLE_TIMEOUT: int = 1800  # 미사용 KubeflowManager 정리 기준 (seconds)
+    KUBEFLOW_AUTH_SESSION_TTL: int = 3600  # Dex session cookie 재사용 시간 (seconds)
+    KUBEFLOW_AUTH_SESSION_REFRESH_MARGIN: int = 300  # 만료 전 background 갱신 시작 시점 (seconds)
+    KUBEFLOW_RESOURCE_INDEX_TTL: int = 300  # pipeline/experiment 이름 -> ID index 유지 시간 (seconds)
+    PIPELINE_COMPILE_CACHE_SIZE: int = 64  # 메모리에 유지할 compile 결과(IR) 개수
+    RUN_SUBMIT_CONCURRENCY: int = 4  # 동시에 KFP로 run을 제출하는 worker 수
+    RUN_SUBMIT_QUEUE_SIZE: int = 1000  # 대기 가능한 run 제출 요청 수
+    SWEEP_MAX_RUNS: int = 1000  # parameter sweep 요청 1건으로 생성할 수 있는 run 수 상한
+    RUN_WATCHER_MIN_INTERVAL: float = 2  # run 상태 polling 최소 간격 (seconds)
+    RUN_WATCHER_MAX_INTERVAL: float = 30  # 변화가 없을 때 늘려가는 polling 최대 간격 (seconds)
+    RUN_WATCHER_IDLE_TIMEOUT: float = 120  # 구독/조회가 없을 때 watcher 종료까지의 시간 (seconds)
+    RUN_LOG_CONTAINER: str = "main"  # log 를 읽을 pipeline task pod 의 container
+    RUN_LOG_TASK_CACHE_TTL: float = 10  # 실행 중인 run 의 task(pod) 목록 재사용 시간 (seconds)
+    RUN_LOG_POLL_INTERVAL: float = 2  # follow 모드에서 새 log 를 확인하는 간격 (seconds)
+    RUN_LOG_PAGE_MAX_BYTES: int = 1024 * 1024  # run log 조회 1회에 반환하는 log 의 bytes 상한
+    EXPERIMENT_SYNC_ENABLED: bool = False  # KFP run 상태를 experiment table 에 동기화 (worker 여러 개면 하나에서만 켠다)
+    EXPERIMENT_SYNC_BATCH_SIZE: int = 500  # experiment 상태 동기화 시 UPDATE 1회(executemany)에 묶는 run 수
+    EXPERIMENT_SYNC_FLUSH_INTERVAL: float = 1  # run 상태 변경을 모아서 DB 에 쓰는 간격 (seconds)
+    METRIC_BATCH_MAX_POINTS: int = 10000  # metric 수집 요청 1건에 담을 수 있는 point 수 상한
+    METRIC_FLUSH_SIZE: int = 5000  # buffer 에 이만큼 쌓이면 바로 INSERT 한다 (INSERT 1회에 묶는 row 수)
+    METRIC_FLUSH_INTERVAL: float = 1  # buffer 를 주기적으로 비우는 간격 (seconds)
+    METRIC_BUFFER_MAX_POINTS: int = 200000  # DB 쓰기가 밀릴 때 buffer 에 쌓아둘 수 있는 point 수 상한
+    METRIC_FLUSH_MAX_RETRIES: int = 60  # DB 연결 실패 시 buffer 의 row 를 버리기 전까지 다시 시도하는 flush 횟수
+    METRIC_SERIES_MAX_POINTS: int = 5000  # metric series 조회 시 반환할 수 있는 point 수 상한
+    KATIB_TRIAL_POLL_INTERVAL: float = 15  # Katib trial 결과를 확인하는 간격 (seconds)
+    REFERENCE_CACHE_CHECK_INTERVAL: float = 5  # reference table cache 의 version 확인 간격 (seconds)
+    EXPERIMENT_LOG_CHUNK_SIZE: int = 256 * 1024  # experiment log chunk 1개의 압축 전 크기 (bytes)
+    RESOURCE_SAMPLER_ENABLED: bool = False  # 실행 중인 experiment 의 resource 사용량 수집 (worker 여러 개면 하나에서만 켠다)
+    RESOURCE_SAMPLER_SOURCE: str = "kubernetes"  # 사용량을 읽을 곳 (kubernetes: metrics.k8s.io, fake: test 용)
+    RESOURCE_SAMPLE_INTERVAL: float = 10  # resource 사용량 수집 간격 (seconds)
+    RESOURCE_FLUSH_INTERVAL: float = 60  # 수집한 사용량을 DB 에 쓰는 간격 (seconds)
+    RESOURCE_RING_SIZE: int = 360  # run 별로 buffer 에 유지하는 sample 수 (가득 차면 바로 flush)
+    ARTIFACT_CACHE_DIR: str = "/tmp/aipaas/artifacts"  # model artifact cache 경로 (worker 간 공유, PVC 권장)
+    ARTIFACT_CACHE_MAX_BYTES: int = 50 * 1024**3  # artifact cache 의 disk 사용량 상한 (bytes)
+    INFERENCE_MAX_BATCH_SIZE: int = 32  # forward 1회에 묶는 추론 입력 수
+    INFERENCE_MAX_WAIT: float = 0.01  # batch 를 채우기 위해 입력이 기다리는 최대 시간 (seconds)
+    INFERENCE_MAX_QUEUE: int = 1024  # model 별로 대기 가능한 추론 입력 수 (넘으면 503)
+    INFERENCE_REQUEST_MAX_INPUTS: int = 64  # 추론 요청 1건에 담을 수 있는 입력 수 상한
+    INFERENCE_NUM_THREADS: int = 0  # forward 에 사용할 torch thread 수 (0: torch 기본값)
+    MODEL_MEMORY_BUDGET: int = 8 * 1024**3  # 추론용으로 memory 에 올려두는 model 크기 합의 상한 (bytes)
+    MODEL_PINNED_REGISTRY_IDS: list[int] = []  # 시작할 때 올려두고 내리지 않는 model registry id (예: [1, 2])
+    DATASET_STORE_DIR: str = "/tmp/aipaas/datasets/store"  # upload 한 dataset 을 저장하는 경로 (PVC 권장)
+    DATASET_CACHE_DIR: str = "/tmp/aipaas/datasets/cache"  # url 로 등록한 dataset 의 local cache 경로
+    DATASET_CACHE_MAX_BYTES: int = 100 * 1024**3  # dataset cache 의 disk 사용량 상한 (bytes)
 
     DB_TYPE: str
     DB_NAME: str
@@ -27,6 +72,11 @@ class Settings(BaseSettings):
     DB_PASSWORD: str
     DB_HOST: str
     DB_PORT: str
+    DB_ASYNC_TYPE: str = "mysql+aiomysql"  # async engine driver (test 에서는 sqlite+aiosqlite)
+    DB_POOL_SIZE: int = 10  # connection pool 에 유지하는 connection 수
+    DB_MAX_OVERFLOW: int = 20  # pool 이 가득 찼을 때 추가로 열 수 있는 connection 수
+    DB_POOL_TIMEOUT: int = 30  # pool 에서 connection 을 기다리는 시간 (seconds)
+    DB_POOL_RECYCLE: int = 1800  # connection 재생성 주기 (seconds)
 
     # class Config:
     #     env_file = ".env"
@@ -36,6 +86,13 @@ class Settings(BaseSettings):
         """Environment variables로부터 DB 정보를 받아와 URI를 반환"""
         return f"{self.DB_TYPE}://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
+    @property
+    def get_async_db_uri(self) -> str:
+        """async driver 를 사용하는 DB URI를 반환 (sqlite 는 DB_NAME 을 file 경로로 사용)"""
+        if self.DB_ASYNC_TYPE.startswith("sqlite"):
+            return f"{self.DB_ASYNC_TYPE}:///{self.DB_NAME}"
+        return f"{self.DB_ASYNC_TYPE}://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+
 
 @lru_cache
 def get_settings():
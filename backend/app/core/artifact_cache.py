@@ -0,0 +1,278 @@
+import asyncio
+import hashlib
+import logging
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+import urllib.request
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable
+from urllib.parse import urlparse
+
+from config.settings import get_settings
+from db.models import ModelRegistry
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+READ_BLOCK_SIZE = 1024 * 1024
+
+# 이 시간 동안 사용되지 않은 다른 process 의 tmp directory 는 종료된 process 가 남긴 것으로 보고 지운다. (seconds)
+STALE_STAGING_AGE = 24 * 60 * 60
+
+# uri 의 artifact 를 dest 경로에 file 또는 directory 로 받는다.
+Fetcher = Callable[[str, Path], None]
+
+
+class ArtifactIntegrityError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class CachedArtifact:
+    sha256: str
+    path: Path  # artifact file 또는 directory
+    size: int  # bytes
+
+
+def fetch_local(uri: str, dest: Path):
+    """file:// 또는 local 경로 (PVC 등 mount 된 경로)"""
+    source = Path(urlparse(uri).path if uri.startswith("file://") else uri)
+    if source.is_dir():
+        shutil.copytree(source, dest)
+    else:
+        shutil.copyfile(source, dest)
+
+
+def fetch_http(uri: str, dest: Path):
+    with urllib.request.urlopen(uri) as response, open(dest, "wb") as f:
+        shutil.copyfileobj(response, f, READ_BLOCK_SIZE)
+
+
+FETCHERS: dict[str, Fetcher] = {"": fetch_local, "file": fetch_local, "http": fetch_http, "https": fetch_http}
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(READ_BLOCK_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def content_digest(path: Path) -> tuple[str, int]:
+    """artifact 의 (sha256, size).
+
+    file 은 내용의 sha256 (sha256sum 과 같다), directory 는 상대 경로 순으로 정렬한 "경로\\0file sha256\\n" 목록의 sha256.
+    """
+    if path.is_file():
+        return file_sha256(path), path.stat().st_size
+    digest = hashlib.sha256()
+    size = 0
+    for file in sorted(p for p in path.rglob("*") if p.is_file()):
+        digest.update(f"{file.relative_to(path).as_posix()}\0{file_sha256(file)}\n".encode())
+        size += file.stat().st_size
+    return digest.hexdigest(), size
+
+
+def content_size(path: Path) -> int:
+    if path.is_file():
+        return path.stat().st_size
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+class ArtifactCache:
+    """Content-addressed local cache of model artifacts with a disk budget and LRU eviction.
+
+    An artifact (a file or a directory) is stored as ``objects/<sha256>/<name>``. Downloads go to
+    the process's own ``tmp/<host>-<pid>/`` and are renamed into place once hashed, so a partially
+    written artifact is never visible, and several worker processes can share the same ``root``;
+    staging directories of other processes are only removed once unused for ``STALE_STAGING_AGE``.
+    Lookups by a known hash do not touch the source at all; concurrent ``get`` calls for the same
+    artifact share one download.
+    When the cache grows past ``max_bytes`` the least recently used artifacts are deleted (an
+    artifact that is already open or memory-mapped stays readable until it is closed); with
+    ``max_bytes=None`` nothing is ever evicted, which makes it a durable content-addressed store.
+    """
+
+    def __init__(self, root: Path, max_bytes: int | None, fetchers: dict[str, Fetcher] = FETCHERS):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.fetchers = fetchers
+        self._objects = self.root / "objects"
+        self._tmp = self.root / "tmp" / f"{socket.gethostname()}-{os.getpid()}"
+        self._objects.mkdir(parents=True, exist_ok=True)
+        self._tmp.mkdir(parents=True, exist_ok=True)
+        self._entries: OrderedDict[str, int] = OrderedDict()  # sha256 -> size, 오래 사용하지 않은 순
+        self._inflight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._scan()
+
+    @property
+    def size(self) -> int:
+        with self._lock:
+            return sum(self._entries.values())
+
+    def get(self, uri: str, sha256: str | None = None) -> CachedArtifact:
+        """artifact 를 cache 에서 찾고, 없으면 uri 에서 받아 저장한다.
+
+        sha256 이 주어지면 받은 내용과 비교해 다르면 ``ArtifactIntegrityError`` 를 낸다.
+        """
+        if sha256 is not None:
+            artifact = self.lookup(sha256)
+            if artifact is not None:
+                return artifact
+
+        key = sha256 or uri
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        if not owner:
+            return future.result()
+
+        try:
+            artifact = self._download(uri, sha256)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(artifact)
+            return artifact
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def lookup(self, sha256: str) -> CachedArtifact | None:
+        directory = self._objects / sha256
+        children = list(directory.iterdir()) if directory.is_dir() else []
+        if len(children) != 1:
+            with self._lock:
+                self._entries.pop(sha256, None)
+            return None
+        with self._lock:
+            size = self._entries.get(sha256)
+        if size is None:
+            # 다른 worker process 가 추가한 artifact
+            size = content_size(children[0])
+        self._touch(sha256, size)
+        return CachedArtifact(sha256=sha256, path=children[0], size=size)
+
+    def evict(self, sha256: str):
+        with self._lock:
+            self._entries.pop(sha256, None)
+        shutil.rmtree(self._objects / sha256, ignore_errors=True)
+
+    def put(self, source: Path, name: str, sha256: str | None = None) -> CachedArtifact:
+        """local file 또는 directory 를 cache 로 옮긴다. source 는 cache 와 같은 filesystem 에 있어야 한다.
+
+        hash 가 sha256 과 다르면 source 를 그대로 두고 ``ArtifactIntegrityError`` 를 낸다.
+        """
+        digest, size = content_digest(source)
+        if sha256 is not None and digest != sha256:
+            raise ArtifactIntegrityError(f"Artifact {name} has sha256 {digest}, expected {sha256}")
+        staging = Path(tempfile.mkdtemp(dir=self._tmp))
+        try:
+            os.rename(source, staging / name)
+            return self._store(staging, name, str(source), digest, size)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def _download(self, uri: str, sha256: str | None) -> CachedArtifact:
+        fetcher = self.fetchers.get(urlparse(uri).scheme)
+        if fetcher is None:
+            raise ValueError(f"Unsupported artifact uri: {uri}")
+
+        staging = Path(tempfile.mkdtemp(dir=self._tmp))
+        try:
+            name = Path(urlparse(uri).path.rstrip("/")).name or "artifact"
+            fetcher(uri, staging / name)
+            digest, size = content_digest(staging / name)
+            if sha256 is not None and digest != sha256:
+                raise ArtifactIntegrityError(f"Artifact {uri} has sha256 {digest}, expected {sha256}")
+            return self._store(staging, name, uri, digest, size)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def _store(self, staging: Path, name: str, source: str, digest: str, size: int) -> CachedArtifact:
+        # hash 를 확인한 staging/name 을 objects/<sha256> 로 옮긴다.
+        try:
+            os.rename(staging, self._objects / digest)
+        except OSError:
+            # 같은 내용이 이미 cache 에 있다.
+            artifact = self.lookup(digest)
+            if artifact is None:
+                raise
+            return artifact
+
+        logger.info(f"Cached artifact {source} ({size} bytes) as {digest}")
+        self._touch(digest, size)
+        self._evict_over_budget(keep=digest)
+        return CachedArtifact(sha256=digest, path=self._objects / digest / name, size=size)
+
+    def _touch(self, sha256: str, size: int):
+        with self._lock:
+            self._entries[sha256] = size
+            self._entries.move_to_end(sha256)
+        try:
+            os.utime(self._objects / sha256)
+        except OSError:
+            pass
+
+    def _evict_over_budget(self, keep: str):
+        if self.max_bytes is None:
+            return
+        evicted = []
+        with self._lock:
+            total = sum(self._entries.values())
+            for sha256 in list(self._entries):
+                if total <= self.max_bytes:
+                    break
+                if sha256 == keep:
+                    continue
+                total -= self._entries.pop(sha256)
+                evicted.append(sha256)
+        for sha256 in evicted:
+            logger.info(f"Evicting artifact {sha256} from cache")
+            shutil.rmtree(self._objects / sha256, ignore_errors=True)
+
+    def _scan(self):
+        # 이전 process 가 남긴 미완료 download 를 지우고, 기존 artifact 를 마지막 사용 시각 순으로 읽는다.
+        # 같은 host/pid 의 directory 는 이전 process 의 것이고, 다른 process 의 것은 오래된 것만 지운다.
+        for staging in self._tmp.iterdir():
+            shutil.rmtree(staging, ignore_errors=True)
+        stale_before = time.time() - STALE_STAGING_AGE
+        for staging in self._tmp.parent.iterdir():
+            try:
+                if staging != self._tmp and staging.stat().st_mtime < stale_before:
+                    shutil.rmtree(staging, ignore_errors=True)
+            except FileNotFoundError:
+                pass
+        directories = sorted((d for d in self._objects.iterdir() if d.is_dir()), key=lambda d: d.stat().st_mtime)
+        for directory in directories:
+            children = list(directory.iterdir())
+            if len(children) == 1:
+                self._entries[directory.name] = content_size(children[0])
+
+
+async def fetch_registry_artifact(db: AsyncSession, registry: ModelRegistry) -> CachedArtifact:
+    """ModelRegistry 의 artifact(model_uri) 를 cache 에서 가져온다. 처음 받은 artifact 의 hash 는 registry 에 기록한다."""
+    artifact = await asyncio.to_thread(get_artifact_cache().get, registry.model_uri, registry.artifact_sha256)
+    if registry.artifact_sha256 is None:
+        registry.artifact_sha256 = artifact.sha256
+        await db.commit()
+    return artifact
+
+
+@lru_cache
+def get_artifact_cache() -> ArtifactCache:
+    settings = get_settings()
+    return ArtifactCache(root=Path(settings.ARTIFACT_CACHE_DIR), max_bytes=settings.ARTIFACT_CACHE_MAX_BYTES)
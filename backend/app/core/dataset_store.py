@@ -0,0 +1,139 @@
+import asyncio
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import AsyncIterable
+
+from config.settings import get_settings
+from core.artifact_cache import ArtifactCache, CachedArtifact
+from db.models import Dataset, DatasetUpload
+from schemas.dataset import DatasetUploadStatus
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+class DatasetUploadOffsetError(Exception):
+    pass
+
+
+class DatasetUploadArea:
+    """Staging files of resumable dataset uploads, one per ``dataset_upload`` row.
+
+    A chunk is appended at the offset the client says it starts at, and the staging file size is
+    the offset to resume from: after a dropped connection the client reads it back and sends the
+    rest. What was received before the drop is kept. Appends to the same upload are serialized by
+    locking its ``dataset_upload`` row.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def path(self, upload_id: int) -> Path:
+        return self.root / str(upload_id)
+
+    def offset(self, upload_id: int) -> int:
+        try:
+            return self.path(upload_id).stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    async def append(self, db: AsyncSession, upload: DatasetUpload, offset: int, body: AsyncIterable[bytes]) -> int:
+        """body 를 offset 위치부터 이어 쓰고 새 offset 을 반환한다. commit 은 호출한 쪽에서 한다."""
+        await lock_upload(db, upload.id)
+        current = self.offset(upload.id)
+        if offset != current:
+            raise DatasetUploadOffsetError(f"Upload {upload.id} is at offset {current}, not {offset}")
+
+        buffer = bytearray()
+        with open(self.path(upload.id), "ab") as f:
+            try:
+                async for data in body:
+                    if upload.size is not None and current + len(buffer) + len(data) > upload.size:
+                        buffer += data[: upload.size - current - len(buffer)]
+                        raise ValueError(f"Upload {upload.id} is larger than {upload.size} bytes")
+                    buffer += data
+                    if len(buffer) >= WRITE_BUFFER_SIZE:
+                        await asyncio.to_thread(f.write, buffer)
+                        current += len(buffer)
+                        buffer = bytearray()
+            finally:
+                # 연결이 끊겨도 받은 데까지는 남겨서 이어 보낼 수 있게 한다.
+                if buffer:
+                    await asyncio.to_thread(f.write, buffer)
+                    current += len(buffer)
+        return current
+
+    def discard(self, upload_id: int):
+        self.path(upload_id).unlink(missing_ok=True)
+
+
+async def lock_upload(db: AsyncSession, upload_id: int):
+    await db.execute(select(DatasetUpload.id).where(DatasetUpload.id == upload_id).with_for_update())
+
+
+async def complete_upload(db: AsyncSession, upload: DatasetUpload) -> Dataset:
+    """받은 file 을 hash 해서 dataset store 로 옮기고 dataset 을 등록한다."""
+    area = get_dataset_upload_area()
+    await lock_upload(db, upload.id)
+    received = area.offset(upload.id)
+    if upload.size is not None and received != upload.size:
+        raise ValueError(f"Upload {upload.id} has {received} of {upload.size} bytes")
+    area.path(upload.id).touch()  # 빈 dataset
+
+    # hash 가 다르면 받은 file 과 upload 상태를 그대로 둔다. (받은 내용을 잃지 않고, 취소는 client 가 정한다)
+    artifact = await asyncio.to_thread(get_dataset_store().put, area.path(upload.id), upload.file_name, upload.sha256)
+
+    dataset = Dataset(
+        name=upload.name,
+        url=artifact.path.as_uri(),
+        description=upload.description,
+        sha256=artifact.sha256,
+        size=artifact.size,
+    )
+    db.add(dataset)
+    await db.flush()
+    upload.status = DatasetUploadStatus.COMPLETED.value
+    upload.dataset_id = dataset.id
+    await db.commit()
+    await db.refresh(dataset)
+    return dataset
+
+
+async def fetch_dataset(db: AsyncSession, dataset: Dataset) -> CachedArtifact:
+    """dataset 의 local 경로. 같은 sha256 의 내용이 store 나 cache 에 있으면 다시 받지 않는다.
+
+    sha256/size 가 없는 dataset 은 받은 내용으로 기록하고 commit 한다.
+    """
+    artifact = None
+    if dataset.sha256 is not None:
+        artifact = await asyncio.to_thread(get_dataset_store().lookup, dataset.sha256)
+    if artifact is None:
+        artifact = await asyncio.to_thread(get_dataset_cache().get, dataset.url, dataset.sha256)
+    if dataset.sha256 is None or dataset.size is None:
+        dataset.sha256 = artifact.sha256
+        dataset.size = artifact.size
+        await db.commit()
+    return artifact
+
+
+@lru_cache
+def get_dataset_store() -> ArtifactCache:
+    """upload 한 dataset 을 보관하는 content-addressed store (S3 등 object storage 대신 사용, eviction 없음)"""
+    return ArtifactCache(root=Path(get_settings().DATASET_STORE_DIR), max_bytes=None)
+
+
+@lru_cache
+def get_dataset_upload_area() -> DatasetUploadArea:
+    # store 와 같은 filesystem 에 두어야 완료 시 복사 없이 rename 으로 옮길 수 있다.
+    return DatasetUploadArea(root=Path(get_settings().DATASET_STORE_DIR) / "uploads")
+
+
+@lru_cache
+def get_dataset_cache() -> ArtifactCache:
+    settings = get_settings()
+    return ArtifactCache(root=Path(settings.DATASET_CACHE_DIR), max_bytes=settings.DATASET_CACHE_MAX_BYTES)
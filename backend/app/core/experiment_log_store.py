@@ -0,0 +1,214 @@
+import asyncio
+import logging
+import zlib
+from functools import lru_cache
+from typing import AsyncIterable, AsyncIterator, Callable
+
+from config.db.session import AsyncSessionLocal
+from config.settings import get_settings
+from db.models import ExperimentLogChunk, ExperimentModel
+from schemas.experiment import ExperimentLogInfoSchema
+from sqlalchemy import Row, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+_chunk = ExperimentLogChunk.__table__
+
+READ_BATCH_CHUNKS = 4  # 읽기 시 query 1회로 가져오는 chunk 수
+
+
+class ExperimentLogStore:
+    """Append-only experiment log stored as zlib-compressed chunks of ``chunk_size`` raw bytes.
+
+    Every chunk records the byte and line (newline) offset it starts at, so a byte range, a line
+    range or a tail is resolved with an index seek to the first chunk and then read chunk by chunk.
+    An append rewrites only the last chunk while it is smaller than ``chunk_size`` and inserts the
+    rest as new chunks; appends to the same experiment are serialized by locking its ``experiment``
+    row. Reads open a short session per batch of chunks, so a slow client does not hold a connection.
+    """
+
+    def __init__(self, session_factory: Callable[[], AsyncSession], chunk_size: int):
+        self._session_factory = session_factory
+        self.chunk_size = chunk_size
+
+    async def info(self, db: AsyncSession, experiment_id: int) -> ExperimentLogInfoSchema:
+        last = await self._last_chunk(db, experiment_id)
+        if last is None:
+            return ExperimentLogInfoSchema(chunks=0, total_bytes=0, line_count=0)
+        return ExperimentLogInfoSchema(
+            chunks=last.seq + 1,
+            total_bytes=last.byte_offset + last.byte_count,
+            line_count=last.line_offset + last.line_count,
+            updated_at=last.updated_at,
+        )
+
+    async def append(self, db: AsyncSession, experiment_id: int, body: AsyncIterable[bytes]) -> ExperimentLogInfoSchema:
+        """body 를 log 끝에 이어 붙인다. commit 은 호출한 쪽에서 한다."""
+        # 같은 experiment 의 append 는 experiment row lock 으로 순서대로 처리한다.
+        await db.execute(select(ExperimentModel.id).where(ExperimentModel.id == experiment_id).with_for_update())
+        last = await self._last_chunk(db, experiment_id)
+
+        buffer = bytearray()
+        seq = byte_offset = line_offset = 0
+        rewrite = False
+        if last is not None and last.byte_count < self.chunk_size:
+            # 덜 찬 마지막 chunk 는 이어 붙여서 다시 쓴다.
+            buffer += await self._content(db, experiment_id, last.seq)
+            seq, byte_offset, line_offset = last.seq, last.byte_offset, last.line_offset
+            rewrite = True
+        elif last is not None:
+            seq = last.seq + 1
+            byte_offset = last.byte_offset + last.byte_count
+            line_offset = last.line_offset + last.line_count
+        tail_size = len(buffer)
+
+        async def write(data: bytes):
+            nonlocal seq, byte_offset, line_offset, rewrite
+            values = {
+                "byte_count": len(data),
+                "line_count": data.count(b"\n"),
+                "content": await asyncio.to_thread(zlib.compress, data),
+            }
+            if rewrite:
+                await db.execute(
+                    update(_chunk).where(_chunk.c.experiment_id == experiment_id, _chunk.c.seq == seq).values(**values)
+                )
+                rewrite = False
+            else:
+                await db.execute(
+                    insert(_chunk).values(
+                        experiment_id=experiment_id, seq=seq, byte_offset=byte_offset, line_offset=line_offset, **values
+                    )
+                )
+            seq += 1
+            byte_offset += values["byte_count"]
+            line_offset += values["line_count"]
+
+        async for data in body:
+            buffer += data
+            while len(buffer) >= self.chunk_size:
+                await write(bytes(buffer[: self.chunk_size]))
+                del buffer[: self.chunk_size]
+        if buffer and not (rewrite and len(buffer) == tail_size):
+            await write(bytes(buffer))
+        return await self.info(db, experiment_id)
+
+    async def locate(
+        self,
+        db: AsyncSession,
+        experiment_id: int,
+        byte_start: int | None = None,
+        byte_end: int | None = None,
+        line_start: int | None = None,
+        line_end: int | None = None,
+        tail: int | None = None,
+    ) -> tuple[int, int, int]:
+        """byte 범위, 줄 범위(0 부터, end 미포함) 또는 마지막 tail 줄을 (start, end, total_bytes) byte 범위로 바꾼다.
+
+        log 길이를 넘는 위치는 log 끝으로 맞춘다.
+        """
+        last = await self._last_chunk(db, experiment_id)
+        total = last.byte_offset + last.byte_count if last is not None else 0
+
+        if tail is not None:
+            if last is None:
+                return 0, 0, 0
+            # 줄바꿈으로 끝나지 않은 마지막 줄도 한 줄로 센다.
+            ends_with_newline = (await self._content(db, experiment_id, last.seq)).endswith(b"\n")
+            lines = last.line_offset + last.line_count + (0 if ends_with_newline else 1)
+            start = await self.line_position(db, experiment_id, max(lines - tail, 0))
+            # tail=0 이면 줄바꿈으로 끝나지 않은 마지막 줄 다음(log 끝)부터
+            return total if start is None else start, total, total
+
+        if line_start is not None or line_end is not None:
+            start = await self.line_position(db, experiment_id, line_start or 0)
+            end = await self.line_position(db, experiment_id, line_end) if line_end is not None else None
+            start = total if start is None else start
+            end = total if end is None else end
+            return start, max(start, end), total
+
+        start = min(byte_start or 0, total)
+        end = total if byte_end is None else min(byte_end, total)
+        return start, max(start, end), total
+
+    async def line_position(self, db: AsyncSession, experiment_id: int, line: int) -> int | None:
+        """line 번째 줄(0 부터)이 시작하는 byte 위치. log 의 줄바꿈 수보다 크면 None."""
+        if line == 0:
+            return 0
+        # line 번째 줄바꿈이 들어 있는 chunk
+        row = (
+            await db.execute(
+                select(_chunk.c.byte_offset, _chunk.c.line_offset, _chunk.c.line_count, _chunk.c.content)
+                .where(_chunk.c.experiment_id == experiment_id, _chunk.c.line_offset < line)
+                .order_by(_chunk.c.line_offset.desc(), _chunk.c.seq.desc())
+                .limit(1)
+            )
+        ).first()
+        if row is None or row.line_offset + row.line_count < line:
+            return None
+        data = zlib.decompress(row.content)
+        position = -1
+        for _ in range(line - row.line_offset):
+            position = data.index(b"\n", position + 1)
+        return row.byte_offset + position + 1
+
+    async def iter_bytes(self, experiment_id: int, start: int, end: int) -> AsyncIterator[bytes]:
+        """[start, end) byte 범위를 chunk 단위로 압축을 풀어 내보낸다."""
+        if start >= end:
+            return
+        async with self._session_factory() as db:
+            seq = await db.scalar(
+                select(_chunk.c.seq)
+                .where(_chunk.c.experiment_id == experiment_id, _chunk.c.byte_offset <= start)
+                .order_by(_chunk.c.byte_offset.desc())
+                .limit(1)
+            )
+        seq = seq or 0
+        while True:
+            async with self._session_factory() as db:
+                rows = (
+                    await db.execute(
+                        select(_chunk.c.seq, _chunk.c.byte_offset, _chunk.c.content)
+                        .where(_chunk.c.experiment_id == experiment_id, _chunk.c.seq >= seq, _chunk.c.byte_offset < end)
+                        .order_by(_chunk.c.seq)
+                        .limit(READ_BATCH_CHUNKS)
+                    )
+                ).all()
+            for row in rows:
+                data = zlib.decompress(row.content)
+                data = data[max(start - row.byte_offset, 0) : end - row.byte_offset]
+                if data:
+                    yield data
+            if len(rows) < READ_BATCH_CHUNKS:
+                return
+            seq = rows[-1].seq + 1
+
+    async def _last_chunk(self, db: AsyncSession, experiment_id: int) -> Row | None:
+        return (
+            await db.execute(
+                select(
+                    _chunk.c.seq,
+                    _chunk.c.byte_offset,
+                    _chunk.c.line_offset,
+                    _chunk.c.byte_count,
+                    _chunk.c.line_count,
+                    _chunk.c.updated_at,
+                )
+                .where(_chunk.c.experiment_id == experiment_id)
+                .order_by(_chunk.c.seq.desc())
+                .limit(1)
+            )
+        ).first()
+
+    async def _content(self, db: AsyncSession, experiment_id: int, seq: int) -> bytes:
+        content = await db.scalar(
+            select(_chunk.c.content).where(_chunk.c.experiment_id == experiment_id, _chunk.c.seq == seq)
+        )
+        return zlib.decompress(content)
+
+
+@lru_cache
+def get_experiment_log_store() -> ExperimentLogStore:
+    settings = get_settings()
+    return ExperimentLogStore(session_factory=AsyncSessionLocal, chunk_size=settings.EXPERIMENT_LOG_CHUNK_SIZE)
@@ -0,0 +1,156 @@
+import logging
+import threading
+from functools import lru_cache
+from typing import Callable
+
+from config.db.session import SessionLocal
+from config.settings import get_settings
+from core.run_watcher import (
+    TERMINAL_RUN_STATES,
+    RunStatusWatcher,
+    get_run_status_watcher,
+)
+from db.models import ExperimentModel
+from schemas.experiment import ExperimentStatus
+from schemas.pipeline import RunStatusSchema
+from sqlalchemy import bindparam, update
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+_experiment = ExperimentModel.__table__
+
+# run_id 로 찾은 experiment 행의 상태를 갱신한다. (executemany 로 batch 단위 실행)
+UPDATE_EXPERIMENT_RUN_STATE = (
+    update(_experiment)
+    .where(_experiment.c.run_id == bindparam("b_run_id"))
+    .values(
+        status=bindparam("b_status"),
+        start_time=bindparam("b_start_time"),
+        end_time=bindparam("b_end_time"),
+    )
+)
+
+
+class ExperimentRunSync:
+    """Write-through copy of KFP run state into the ``experiment`` table.
+
+    Subscribes to a ``RunStatusWatcher`` and applies the runs that changed since the last poll as
+    batched ``UPDATE ... WHERE run_id = ?`` statements, so status reads and filters can be served
+    from the database. Changes are coalesced per run for ``flush_interval`` seconds; a failed flush
+    is retried with the next batch. A run is linked to its ``experiment`` row by ``attach`` when it
+    is submitted; runs without a row are ignored. Every running instance keeps the namespace watcher
+    polling, so only one worker starts it.
+    """
+
+    def __init__(
+        self,
+        watcher: RunStatusWatcher,
+        session_factory: Callable[[], Session],
+        batch_size: int,
+        flush_interval: float,
+    ):
+        self.watcher = watcher
+        self._session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending: dict[str, RunStatusSchema] = {}
+        self._lock = threading.Lock()
+        self._changed = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="experiment-run-sync", daemon=True)
+        self._thread.start()
+        self.watcher.subscribe(self._on_change)
+
+    def stop(self, timeout: float | None = None):
+        """Unsubscribe, flush what is pending and stop the worker."""
+        if self._thread is None:
+            return
+        self.watcher.unsubscribe(self._on_change)
+        self._stopping.set()
+        self._changed.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def flush(self) -> int:
+        """Write the pending run states. Returns the number of runs written."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+
+        rows = [self._to_row(run_status) for run_status in pending.values()]
+        try:
+            with self._session_factory() as session, session.begin():
+                for i in range(0, len(rows), self.batch_size):
+                    session.execute(UPDATE_EXPERIMENT_RUN_STATE, rows[i : i + self.batch_size])
+        except Exception:
+            logger.exception(f"Failed to sync {len(rows)} run states into experiment")
+            with self._lock:
+                # 실패한 변경은 그 사이 들어온 더 최신 상태가 없을 때만 다시 넣는다.
+                for run_id, run_status in pending.items():
+                    self._pending.setdefault(run_id, run_status)
+            return 0
+        return len(rows)
+
+    def attach(self, experiment_id: int, run_status: RunStatusSchema):
+        """experiment 행에 제출한 run 의 run_id 와 제출 시점의 상태를 기록한다. 이후 변경은 watcher 를 통해 반영된다."""
+        row = self._to_row(run_status)
+        with self._session_factory() as session, session.begin():
+            session.execute(
+                update(_experiment)
+                .where(_experiment.c.id == experiment_id)
+                .values(
+                    run_id=row["b_run_id"],
+                    status=row["b_status"],
+                    start_time=row["b_start_time"],
+                    end_time=row["b_end_time"],
+                )
+            )
+        if self._thread is not None:
+            # 기록하기 전에 watcher 가 이미 보고한 변경은 이 행에 반영되지 않았으므로 마지막 상태를 다시 쓴다.
+            latest = self.watcher.snapshot({run_status.run_id})
+            if latest:
+                self._on_change(latest)
+
+    def _on_change(self, statuses: list[RunStatusSchema]):
+        with self._lock:
+            for run_status in statuses:
+                self._pending[run_status.run_id] = run_status
+        self._changed.set()
+
+    def _run(self):
+        while not self._stopping.is_set():
+            self._changed.wait()
+            # 짧은 시간 동안 들어온 변경을 모아서 한 번에 쓴다.
+            self._stopping.wait(self.flush_interval)
+            self._changed.clear()
+            self.flush()
+        self.flush()
+
+    @staticmethod
+    def _to_row(run_status: RunStatusSchema) -> dict:
+        finished = run_status.state in TERMINAL_RUN_STATES
+        return {
+            "b_run_id": run_status.run_id,
+            "b_status": ExperimentStatus.from_run_state(run_status.state).value,
+            "b_start_time": run_status.created_at,
+            "b_end_time": run_status.finished_at if finished else None,
+        }
+
+
+@lru_cache
+def get_experiment_run_sync() -> ExperimentRunSync:
+    settings = get_settings()
+    return ExperimentRunSync(
+        watcher=get_run_status_watcher(settings.KUBEFLOW_NAMESPACE),
+        session_factory=SessionLocal,
+        batch_size=settings.EXPERIMENT_SYNC_BATCH_SIZE,
+        flush_interval=settings.EXPERIMENT_SYNC_FLUSH_INTERVAL,
+    )
@@ -0,0 +1,38 @@
+from pathlib import Path
+from typing import Any, Protocol
+
+
+class Predictor(Protocol):
+    def predict(self, inputs: list[Any]) -> list[Any]:
+        """입력 batch 를 한 번에 처리해 입력 순서대로 결과를 반환한다."""
+        ...
+
+    def memory_footprint(self) -> int:
+        """load 된 model 이 차지하는 memory (bytes)"""
+        ...
+
+
+class TransformersPredictor:
+    """transformers pipeline on CPU. ``predict`` pads a batch of inputs and runs one forward pass.
+
+    ``task`` is the pipeline task (``text-classification``, ``token-classification``, ...), taken
+    from the model's ``model_type`` name. Weights in safetensors format are memory-mapped from the
+    artifact cache.
+    """
+
+    def __init__(self, model_path: Path, task: str, num_threads: int = 0):
+        # torch/transformers import 는 수 초 걸리므로 model 을 처음 load 할 때 한다.
+        import torch
+        from transformers import pipeline
+
+        if num_threads > 0:
+            torch.set_num_threads(num_threads)
+        self.task = task
+        self._pipeline = pipeline(task, model=str(model_path), device="cpu")
+
+    def predict(self, inputs: list[Any]) -> list[Any]:
+        return list(self._pipeline(inputs, batch_size=len(inputs)))
+
+    def memory_footprint(self) -> int:
+        # parameter + buffer 크기 (mmap 된 weight 도 접근하면 RSS 에 포함된다)
+        return self._pipeline.model.get_memory_footprint()
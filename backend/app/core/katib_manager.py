@@ -0,0 +1,326 @@
+import logging
+import threading
+import time
+from functools import lru_cache
+from typing import Callable
+
+from config.db.session import SessionLocal
+from config.settings import get_settings
+from db.models import ExperimentModel, HyperparameterType, Hyperparamter, Metric
+from kubeflow.katib import (
+    KatibClient,
+    V1beta1AlgorithmSpec,
+    V1beta1EarlyStoppingSetting,
+    V1beta1EarlyStoppingSpec,
+    V1beta1Experiment,
+    V1beta1ExperimentSpec,
+    V1beta1FeasibleSpace,
+    V1beta1ObjectiveSpec,
+    V1beta1ParameterSpec,
+    V1beta1Trial,
+    V1beta1TrialParameterSpec,
+    V1beta1TrialTemplate,
+)
+from kubernetes.client import V1ObjectMeta
+from schemas.experiment import ExperimentStatus, RankOrder
+from schemas.katib import (
+    KatibBudgetSchema,
+    KatibExperimentRequestSchema,
+    KatibTrialSchema,
+    SearchSpaceSchema,
+)
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Katib Experiment 에 trial 결과를 기록할 experiment 를 label 로 남긴다.
+EXPERIMENT_ID_LABEL = "aipaas/experiment-id"
+
+# hyperparameter_type.param_type -> Katib parameterType (그 외는 categorical)
+KATIB_PARAMETER_TYPES = {"int": "int", "integer": "int", "float": "double", "double": "double"}
+
+TRIAL_STATUSES = {
+    "Created": ExperimentStatus.PENDING,
+    "Running": ExperimentStatus.RUNNING,
+    "Succeeded": ExperimentStatus.SUCCEEDED,
+    "EarlyStopped": ExperimentStatus.EARLY_STOPPED,
+    "Failed": ExperimentStatus.FAILED,
+    "MetricsUnavailable": ExperimentStatus.FAILED,
+    "Killed": ExperimentStatus.CANCELED,
+}
+FINISHED_TRIAL_STATUSES = frozenset(
+    status.value
+    for status in (
+        ExperimentStatus.SUCCEEDED,
+        ExperimentStatus.EARLY_STOPPED,
+        ExperimentStatus.FAILED,
+        ExperimentStatus.CANCELED,
+    )
+)
+
+
+def trial_condition(trial: V1beta1Trial) -> str | None:
+    """trial 의 마지막으로 True 가 된 condition type"""
+    conditions = [c for c in (trial.status.conditions if trial.status else None) or [] if c.status == "True"]
+    return conditions[-1].type if conditions else None
+
+
+def trial_metrics(trial: V1beta1Trial) -> dict[str, float]:
+    observation = trial.status.observation if trial.status else None
+    metrics = {}
+    for metric in (observation.metrics if observation else None) or []:
+        try:
+            metrics[metric.name] = float(metric.latest)
+        except (TypeError, ValueError):
+            # 아직 보고되지 않은 metric 은 "unavailable" 로 표시된다.
+            continue
+    return metrics
+
+
+class KatibManager:
+    """Hyperparameter search on Katib, with trial results written back to our tables.
+
+    Every trial is recorded as an ``experiment`` row (model/dataset/image copied from the experiment
+    the search was started for, ``run_id`` = trial name) with its parameter assignments in
+    ``hyperparameter`` and its final observation in ``metric``, so finished trials show up in the
+    leaderboard and hyperparameter search like any other experiment.
+
+    Args:
+        namespace (str): Namespace of the Katib Experiments.
+        katib_client (KatibClient | None): Client to use; created from the kube config on first use
+            when omitted (tests pass a fake here).
+        session_factory: Factory of the (sync) DB sessions the trial results are written with.
+        poll_interval (float): Seconds between trial polls while watching an Experiment.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        katib_client: KatibClient | None = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+        poll_interval: float = 15,
+    ):
+        self.namespace = namespace
+        self._katib_client = katib_client
+        self._session_factory = session_factory
+        self.poll_interval = poll_interval
+        self._watchers: dict[str, threading.Thread] = {}
+        self._lock = threading.Lock()
+        # watcher 와 조회 API 가 동시에 같은 trial 을 insert 하지 않도록 sync 를 직렬화한다.
+        self._sync_lock = threading.Lock()
+
+    @property
+    def katib_client(self) -> KatibClient:
+        if self._katib_client is None:
+            self._katib_client = KatibClient(namespace=self.namespace)
+        return self._katib_client
+
+    def build_parameters(self, session: Session, search_space: list[SearchSpaceSchema]) -> list[V1beta1ParameterSpec]:
+        """search space 를 hyperparameter_type 정의에 맞는 Katib parameter 로 변환"""
+        names = [space.name for space in search_space]
+        param_types = {
+            param_type.param_name: param_type.param_type
+            for param_type in session.scalars(
+                select(HyperparameterType).where(HyperparameterType.param_name.in_(names))
+            )
+        }
+        missing = [name for name in names if name not in param_types]
+        if missing:
+            raise ValueError(f"Unknown hyperparameter types: {', '.join(missing)}")
+
+        parameters = []
+        for space in search_space:
+            parameter_type = KATIB_PARAMETER_TYPES.get(param_types[space.name].lower(), "categorical")
+            if space.values is not None:
+                feasible_space = V1beta1FeasibleSpace(list=space.values)
+                if parameter_type != "categorical":
+                    parameter_type = "discrete"
+            elif parameter_type == "categorical":
+                raise ValueError(f"'{space.name}' is categorical and needs 'values'")
+            else:
+                cast = int if parameter_type == "int" else float
+                feasible_space = V1beta1FeasibleSpace(
+                    min=str(cast(space.min)),
+                    max=str(cast(space.max)),
+                    step=str(cast(space.step)) if space.step is not None else None,
+                )
+            parameters.append(
+                V1beta1ParameterSpec(name=space.name, parameter_type=parameter_type, feasible_space=feasible_space)
+            )
+        return parameters
+
+    def create_experiment(self, request: KatibExperimentRequestSchema) -> V1beta1Experiment:
+        with self._session_factory() as session:
+            parameters = self.build_parameters(session, request.search_space)
+
+        early_stopping = None
+        if request.early_stopping is not None:
+            # median stop: 같은 step 에서 완료된 trial 들의 median 보다 나쁜 trial 을 중단한다.
+            early_stopping = V1beta1EarlyStoppingSpec(
+                algorithm_name="medianstop",
+                algorithm_settings=[
+                    V1beta1EarlyStoppingSetting(
+                        name="min_trials_required", value=str(request.early_stopping.min_trials_required)
+                    ),
+                    V1beta1EarlyStoppingSetting(name="start_step", value=str(request.early_stopping.start_step)),
+                ],
+            )
+
+        experiment = V1beta1Experiment(
+            api_version="kubeflow.org/v1beta1",
+            kind="Experiment",
+            metadata=V1ObjectMeta(
+                name=request.name,
+                namespace=self.namespace,
+                labels={EXPERIMENT_ID_LABEL: str(request.experiment_id)},
+            ),
+            spec=V1beta1ExperimentSpec(
+                parallel_trial_count=request.parallel_trial_count,
+                max_trial_count=request.max_trial_count,
+                max_failed_trial_count=request.max_failed_trial_count,
+                objective=V1beta1ObjectiveSpec(
+                    type="maximize" if request.objective_order == RankOrder.DESC else "minimize",
+                    goal=request.objective_goal,
+                    objective_metric_name=request.objective_metric,
+                    additional_metric_names=request.additional_metrics or None,
+                ),
+                algorithm=V1beta1AlgorithmSpec(algorithm_name=request.algorithm),
+                early_stopping=early_stopping,
+                parameters=parameters,
+                trial_template=V1beta1TrialTemplate(
+                    primary_container_name=request.primary_container_name,
+                    trial_parameters=[
+                        V1beta1TrialParameterSpec(name=parameter.name, reference=parameter.name)
+                        for parameter in parameters
+                    ],
+                    trial_spec=request.trial_spec,
+                ),
+            ),
+        )
+        self.katib_client.create_experiment(experiment, namespace=self.namespace)
+        return experiment
+
+    def edit_budget(self, name: str, budget: KatibBudgetSchema):
+        self.katib_client.edit_experiment_budget(
+            name,
+            namespace=self.namespace,
+            max_trial_count=budget.max_trial_count,
+            parallel_trial_count=budget.parallel_trial_count,
+            max_failed_trial_count=budget.max_failed_trial_count,
+        )
+
+    def get_base_experiment_id(self, name: str) -> int | None:
+        experiment = self.katib_client.get_experiment(name, namespace=self.namespace)
+        labels = (experiment.metadata.labels if experiment.metadata else None) or {}
+        return int(labels[EXPERIMENT_ID_LABEL]) if EXPERIMENT_ID_LABEL in labels else None
+
+    def sync_trials(self, name: str, base_experiment_id: int) -> list[KatibTrialSchema]:
+        """Experiment 의 trial 을 experiment/hyperparameter/metric table 에 반영한다.
+
+        새 trial 은 experiment 행과 parameter 를, 종료된 trial 은 상태와 최종 metric 을 기록한다.
+        """
+        trials = self.katib_client.list_trials(name, namespace=self.namespace)
+        results = []
+        with self._sync_lock, self._session_factory() as session, session.begin():
+            base = session.get(ExperimentModel, base_experiment_id)
+            if base is None:
+                raise ValueError(f"Experiment {base_experiment_id} not found")
+            trial_names = [trial.metadata.name for trial in trials]
+            rows = {
+                row.run_id: row
+                for row in session.scalars(select(ExperimentModel).where(ExperimentModel.run_id.in_(trial_names)))
+            }
+            param_type_ids = {
+                param_name: param_type_id
+                for param_name, param_type_id in session.execute(
+                    select(HyperparameterType.param_name, HyperparameterType.id)
+                )
+            }
+
+            for trial in trials:
+                condition = trial_condition(trial)
+                status = TRIAL_STATUSES.get(condition, ExperimentStatus.UNKNOWN)
+                parameters = {
+                    assignment.name: assignment.value for assignment in trial.spec.parameter_assignments or []
+                }
+                metrics = trial_metrics(trial)
+
+                row = rows.get(trial.metadata.name)
+                if row is None:
+                    row = ExperimentModel(
+                        name=f"{name}/{trial.metadata.name}",
+                        model_id=base.model_id,
+                        dataset_id=base.dataset_id,
+                        image_registry_id=base.image_registry_id,
+                        run_id=trial.metadata.name,
+                        status=ExperimentStatus.PENDING.value,
+                    )
+                    for param_name, value in parameters.items():
+                        if param_name not in param_type_ids:
+                            # search 중에 hyperparameter_type 이 삭제되거나 이름이 바뀐 parameter 는 기록하지 않는다.
+                            logger.warning(
+                                f"Skipping parameter {param_name} of trial {trial.metadata.name}: unknown type"
+                            )
+                            continue
+                        hyper_param = Hyperparamter(param_type_id=param_type_ids[param_name])
+                        hyper_param.assign_value(value)
+                        row.hyper_param.append(hyper_param)
+                    session.add(row)
+
+                # 종료 상태로 바뀌는 시점에 한 번만 최종 metric 을 기록한다.
+                if status.value in FINISHED_TRIAL_STATUSES and row.status not in FINISHED_TRIAL_STATUSES:
+                    row.metric.extend(
+                        Metric(metric_name=metric_name, metric_value=value) for metric_name, value in metrics.items()
+                    )
+                row.status = status.value
+                if trial.status:
+                    row.start_time = trial.status.start_time
+                    row.end_time = trial.status.completion_time
+                session.flush()
+
+                results.append(
+                    KatibTrialSchema(
+                        name=trial.metadata.name,
+                        status=condition,
+                        parameters=parameters,
+                        metrics=metrics,
+                        experiment_id=row.id,
+                    )
+                )
+        return results
+
+    def watch(self, name: str, base_experiment_id: int):
+        """Experiment 가 끝날 때까지 background thread 에서 주기적으로 sync_trials 를 실행한다."""
+        with self._lock:
+            watcher = self._watchers.get(name)
+            if watcher is not None and watcher.is_alive():
+                return
+            watcher = threading.Thread(
+                target=self._watch, args=(name, base_experiment_id), name=f"katib-watch-{name}", daemon=True
+            )
+            self._watchers[name] = watcher
+            watcher.start()
+
+    def _watch(self, name: str, base_experiment_id: int):
+        while True:
+            time.sleep(self.poll_interval)
+            try:
+                experiment = self.katib_client.get_experiment(name, namespace=self.namespace)
+                self.sync_trials(name, base_experiment_id)
+            except Exception as e:
+                logger.warning(f"Failed to sync trials of Katib experiment {name}: {e}")
+                continue
+            # 종료 확인은 sync 이전의 상태로 하므로 마지막 trial 까지 반영된 후 멈춘다.
+            conditions = (experiment.status.conditions if experiment.status else None) or []
+            if any(c.type in ("Succeeded", "Failed") and c.status == "True" for c in conditions):
+                break
+        with self._lock:
+            self._watchers.pop(name, None)
+        logger.info(f"Stopped watching Katib experiment {name}")
+
+
+@lru_cache
+def get_katib_manager() -> KatibManager:
+    settings = get_settings()
+    return KatibManager(namespace=settings.KUBEFLOW_NAMESPACE, poll_interval=settings.KATIB_TRIAL_POLL_INTERVAL)
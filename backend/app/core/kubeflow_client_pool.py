@@ -0,0 +1,121 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, NamedTuple
+
+from config.settings import get_settings
+from core.kubeflow_manager import KubeflowManager
+from fastapi import Depends
+
+logger = logging.getLogger(__name__)
+
+
+class KubeflowClientKey(NamedTuple):
+    endpoint: str
+    username: str
+    namespace: str
+
+
+class _PoolEntry:
+    def __init__(self):
+        self.manager: KubeflowManager | None = None
+        self.last_used = time.monotonic()
+        # 같은 key에 대한 Dex 로그인은 한 번만 수행되도록 entry 단위로 잠근다.
+        self.lock = threading.Lock()
+
+
+class KubeflowClientPool:
+    """Process-wide pool of ``KubeflowManager`` instances.
+
+    Managers are reused per (endpoint, username, namespace) so that the Dex login and
+    ``kfp.Client`` construction are paid once instead of on every request.
+    The pool holds at most ``max_size`` managers (least recently used ones are evicted first)
+    and drops managers that were not used for ``idle_timeout`` seconds.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        idle_timeout: float,
+        factory: Callable[..., KubeflowManager] = KubeflowManager,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be greater than 0")
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._factory = factory
+        self._entries: OrderedDict[KubeflowClientKey, _PoolEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str, username: str, password: str, namespace: str) -> KubeflowManager:
+        key = KubeflowClientKey(endpoint=endpoint, username=username, namespace=namespace)
+        now = time.monotonic()
+
+        with self._lock:
+            self._evict_idle(now)
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _PoolEntry()
+            self._entries.move_to_end(key)
+            entry.last_used = now
+            self._evict_overflow()
+
+        with entry.lock:
+            if entry.manager is None or entry.manager.password != password:
+                try:
+                    entry.manager = self._factory(
+                        endpoint=endpoint, username=username, password=password, namespace=namespace
+                    )
+                except Exception:
+                    with self._lock:
+                        if self._entries.get(key) is entry and entry.manager is None:
+                            del self._entries[key]
+                    raise
+                logger.info(f"KubeflowManager created for {key}")
+            return entry.manager
+
+    def remove(self, endpoint: str, username: str, namespace: str):
+        with self._lock:
+            self._entries.pop(KubeflowClientKey(endpoint=endpoint, username=username, namespace=namespace), None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _evict_idle(self, now: float):
+        expired = [key for key, entry in self._entries.items() if now - entry.last_used > self.idle_timeout]
+        for key in expired:
+            del self._entries[key]
+            logger.info(f"KubeflowManager for {key} evicted after idle timeout")
+
+    def _evict_overflow(self):
+        while len(self._entries) > self.max_size:
+            key, _ = self._entries.popitem(last=False)
+            logger.info(f"KubeflowManager for {key} evicted (pool size limit: {self.max_size})")
+
+
+@lru_cache
+def get_kubeflow_client_pool() -> KubeflowClientPool:
+    settings = get_settings()
+    return KubeflowClientPool(
+        max_size=settings.KUBEFLOW_CLIENT_POOL_SIZE,
+        idle_timeout=settings.KUBEFLOW_CLIENT_IDLE_TIMEOUT,
+    )
+
+
+def get_kubeflow_manager() -> KubeflowManager:
+    settings = get_settings()
+    return get_kubeflow_client_pool().get(
+        endpoint=settings.KUBEFLOW_ENDPOINT,
+        username=settings.KUBEFLOW_USERNAME,
+        password=settings.KUBEFLOW_PASSWORD,
+        namespace=settings.KUBEFLOW_NAMESPACE,
+    )
+
+
+KubeflowManagerDepends = Depends(get_kubeflow_manager)
@@ -1,27 +1,46 @@
 import logging
-import os
+import tempfile
 import uuid
-from typing import Any
+from datetime import datetime
+from typing import Any, Callable
+from urllib.parse import urlsplit
 
 import kfp
+import kfp_server_api
+from config.settings import get_settings
+from core.kubeflow_resource_index import KubeflowResourceIndex, display_name_filter
+from core.pipeline_cache import apply_cache_policy
+from core.pipeline_compiler import CompiledPipeline, get_pipeline_compiler
 from kfp import dsl
-from kfp.compiler import Compiler
-from utils.authentication import get_istio_auth_session
+from kfp_server_api import ApiException
+from schemas.pipeline import PipelineCachePolicySchema
+from utils.authentication import IstioAuthSessionCache, get_istio_auth_session_cache
 
 logger = logging.getLogger(__name__)
 
 
 class KubeflowManager:
-    def __init__(self, endpoint: str, username: str, password: str, namespace: str):
+    LIST_PAGE_SIZE = 100
+
+    def __init__(
+        self,
+        endpoint: str,
+        username: str,
+        password: str,
+        namespace: str,
+        auth_session_cache: IstioAuthSessionCache | None = None,
+    ):
         self.endpoint = endpoint
         self.username = username
         self.password = password
         self.namespace = namespace
+        self.auth_session_cache = auth_session_cache or get_istio_auth_session_cache()
         self.auth_session = self._get_istio_auth_session()
         self.kfp_client = self._create_kfp_client()
+        self.resource_index = KubeflowResourceIndex(ttl=get_settings().KUBEFLOW_RESOURCE_INDEX_TTL)
 
     def _get_istio_auth_session(self):
-        return get_istio_auth_session(url=self.endpoint, username=self.username, password=self.password)
+        return self.auth_session_cache.get(url=self.endpoint, username=self.username, password=self.password)
 
     def _create_kfp_client(self):
         client = kfp.Client(
@@ -35,58 +54,137 @@ class KubeflowManager:
         # client._job_api.api_client.cookie = f"authservice_session={self.auth_session.session_cookie}"
         return client
 
+    def _set_auth_session(self, auth_session):
+        self.auth_session = auth_session
+        # 모든 kfp API 객체는 같은 ApiClient를 공유한다.
+        self.kfp_client._run_api.api_client.cookie = auth_session.session_cookie
+
+    def _sync_auth_session(self):
+        """Pick up a cookie refreshed in the background by the session cache."""
+        auth_session = self._get_istio_auth_session()
+        if auth_session.session_cookie != self.auth_session.session_cookie:
+            self._set_auth_session(auth_session)
+
+    @staticmethod
+    def _is_dex_location(location: str | None) -> bool:
+        return "/dex" in urlsplit(location or "").path
+
+    @classmethod
+    def _is_auth_failure(cls, error: ApiException) -> bool:
+        if error.status == 401:
+            return True
+        if error.status in (301, 302, 303, 307):
+            return cls._is_dex_location((error.headers or {}).get("Location"))
+        return False
+
+    def _was_redirected_to_login(self) -> bool:
+        """마지막 응답이 Dex 로그인 페이지로 redirect 된 것인지.
+
+        authservice는 만료된 cookie 요청을 Dex로 redirect 하는데, urllib3가 이를 따라가면 로그인 페이지
+        HTML(200)이 빈 응답 객체로 역직렬화되므로 예외 없이 끝난 호출도 redirect 기록의 Location을 확인한다.
+        last_response는 같은 ApiClient를 쓰는 thread 사이에서 덮어써질 수 있지만, 같은 cookie를 쓰는
+        동시 요청은 모두 같은 redirect를 받으므로 판단이 달라지지 않는다.
+        """
+        response = getattr(self.kfp_client._run_api.api_client, "last_response", None)
+        retries = getattr(getattr(response, "urllib3_response", None), "retries", None)
+        history = retries.history if retries is not None else ()
+        return any(self._is_dex_location(entry.redirect_location) for entry in history)
+
+    def _reauthenticate(self, reason: str):
+        logger.warning(f"Auth session rejected by {self.endpoint} ({reason}), re-authenticating")
+        self._set_auth_session(
+            self.auth_session_cache.refresh(
+                url=self.endpoint,
+                username=self.username,
+                password=self.password,
+                stale_cookie=self.auth_session.session_cookie,
+            )
+        )
+
+    def _call(self, func: Callable, *args, **kwargs):
+        """Call a kfp client method, re-authenticating once if the session was rejected."""
+        self._sync_auth_session()
+        try:
+            result = func(*args, **kwargs)
+        except ApiException as e:
+            if not self._is_auth_failure(e):
+                raise
+            self._reauthenticate(f"HTTP {e.status}")
+            return func(*args, **kwargs)
+        if self._was_redirected_to_login():
+            self._reauthenticate("redirected to Dex")
+            return func(*args, **kwargs)
+        return result
+
     # def get_session_cookie(self):
     #     cookie = self.auth_session.session_cookie.split("=")[-1]
     #     return cookie
 
     def get_kfp_client(self):
+        self._sync_auth_session()
         return self.kfp_client
 
-    def compile_pipeline(self, pipeline_func: callable, pipeline_name: str):
-        pipeline_filename = f"{pipeline_name}.yaml"
-        Compiler().compile(pipeline_func, pipeline_filename)
+    def compile_pipeline(self, pipeline_func: callable, pipeline_name: str | None = None) -> CompiledPipeline:
+        return get_pipeline_compiler().compile(pipeline_func, pipeline_name)
 
     def create_pipeline(self, pipeline_func: callable, pipeline_name: str):
-        pipeline_filename = f"{pipeline_name}.yaml"
-        Compiler().compile(pipeline_func, pipeline_filename)
-        self.kfp_client.upload_pipeline(pipeline_package_path=pipeline_filename, pipeline_name=pipeline_name)
-        os.remove(pipeline_filename)
+        compiled = self.compile_pipeline(pipeline_func)
+        self.resource_index.invalidate("pipeline", pipeline_name)
+        # upload API는 파일 경로만 받으므로, 요청마다 고유한 임시 파일을 사용한다.
+        with tempfile.NamedTemporaryFile("w", suffix=".yaml") as pipeline_file:
+            pipeline_file.write(compiled.package)
+            pipeline_file.flush()
+            pipeline = self._call(
+                self.kfp_client.upload_pipeline, pipeline_package_path=pipeline_file.name, pipeline_name=pipeline_name
+            )
+        self.resource_index.put("pipeline", pipeline_name, pipeline)
         logger.info(f"Pipeline {pipeline_name} created successfully")
 
+    def _find_by_display_name(self, kind: str, name: str, list_func: Callable, items_attr: str, **list_kwargs):
+        """name으로 KFP resource를 조회. index에 없으면 server-side filter로 조회 후 index에 저장."""
+        resource = self.resource_index.get(kind, name)
+        if resource is not None:
+            return resource
+
+        page_token = ""
+        while True:
+            response = self._call(
+                list_func,
+                page_token=page_token,
+                page_size=self.LIST_PAGE_SIZE,
+                filter=display_name_filter(name),
+                **list_kwargs,
+            )
+            for item in getattr(response, items_attr) or []:
+                if item.display_name == name:
+                    self.resource_index.put(kind, name, item)
+                    return item
+            page_token = response.next_page_token
+            if not page_token:
+                return None
+
     def get_pipeline_by_name(self, pipeline_name: str):
-        # pipelines = self.kfp_client.list_pipelines().pipelines
-        return next(
-            (
-                pipeline
-                for pipeline in self.kfp_client.list_pipelines().pipelines
-                if pipeline.display_name == pipeline_name
-            ),
-            None,
+        return self._find_by_display_name(
+            "pipeline", pipeline_name, self.kfp_client.list_pipelines, items_attr="pipelines"
         )
 
     def get_pipeline_id(self, pipeline_name: str):
-        return next(
-            (
-                pipeline.id
-                for pipeline in self.kfp_client.list_pipelines().pipelines
-                if pipeline.display_name == pipeline_name
-            ),
-            None,
-        )
+        pipeline = self.get_pipeline_by_name(pipeline_name)
+        return pipeline.pipeline_id if pipeline else None
 
     def create_experiment(self, experiment_name: str):
-        return self.kfp_client.create_experiment(name=experiment_name)
+        self.resource_index.invalidate("experiment", experiment_name)
+        experiment = self._call(self.kfp_client.create_experiment, name=experiment_name, namespace=self.namespace)
+        self.resource_index.put("experiment", experiment_name, experiment)
+        return experiment
 
     def get_experiment_by_name(self, *, experiment_name: str):
-        # experiments = self.kfp_client.list_experiments().experiments
-
-        return next(
-            (
-                experiment
-                for experiment in self.kfp_client.list_experiments().experiments
-                if experiment.display_name == experiment_name
-            ),
-            None,
+        return self._find_by_display_name(
+            "experiment",
+            experiment_name,
+            self.kfp_client.list_experiments,
+            items_attr="experiments",
+            namespace=self.namespace,
         )
 
     # TODO : 현재 pipeline_id에 해당하는 버전ID정보를 확인할수있는 방법을 찾아 다시 시도
@@ -103,29 +201,112 @@ class KubeflowManager:
     #     return run
 
     def list_pipelines(self):
-        return [p.name for p in self.kfp_client.list_pipelines().pipelines]
+        """전체 page를 순회하며 pipeline 이름 목록을 반환하고, 조회 결과로 index를 채운다."""
+        names = []
+        page_token = ""
+        while True:
+            response = self._call(self.kfp_client.list_pipelines, page_token=page_token, page_size=self.LIST_PAGE_SIZE)
+            for pipeline in response.pipelines or []:
+                self.resource_index.put("pipeline", pipeline.display_name, pipeline)
+                names.append(pipeline.display_name)
+            page_token = response.next_page_token
+            if not page_token:
+                return names
 
     def delete_pipeline(self, pipeline_name: str):
         pipeline = self.get_pipeline_by_name(pipeline_name=pipeline_name)
-        if pipeline.id:
-            self.kfp_client.delete_pipeline(pipeline_id=pipeline.id)
-            logger.info(f"Pipeline {pipeline_name} deleted successfully")
-        else:
+        if pipeline is None:
             logger.error(f"Pipeline {pipeline_name} not found")
+            return
+        try:
+            self._call(self.kfp_client.delete_pipeline, pipeline_id=pipeline.pipeline_id)
+        finally:
+            self.resource_index.invalidate("pipeline", pipeline_name)
+        logger.info(f"Pipeline {pipeline_name} deleted successfully")
 
     def list_runs(self, experiment_name: str):
         experiment = self.get_experiment_by_name(experiment_name=experiment_name)
-        runs = self.kfp_client.list_runs(experiment_id=experiment.id)
-        return [(run.id, run.name, run.status) for run in runs.runs]
+        runs = self._call(self.kfp_client.list_runs, experiment_id=experiment.experiment_id)
+        return [(run.run_id, run.display_name, run.state) for run in runs.runs or []]
+
+    def iter_runs(self, page_size: int | None = None, sort_by: str = ""):
+        """namespace의 모든 run을 page 단위로 순회"""
+        page_token = ""
+        while True:
+            response = self._call(
+                self.kfp_client.list_runs,
+                page_token=page_token,
+                page_size=page_size or self.LIST_PAGE_SIZE,
+                sort_by=sort_by,
+                namespace=self.namespace,
+            )
+            yield from response.runs or []
+            page_token = response.next_page_token
+            if not page_token:
+                return
 
     def get_run_logs(self, run_id: str):
-        run = self.kfp_client.get_run(run_id)
+        run = self._call(self.kfp_client.get_run, run_id)
         logs = {}
         for node in run.pipeline_runtime.workflow_manifest["status"]["nodes"].values():
             if "outputs" in node and "logs" in node["outputs"]:
                 logs[node["displayName"]] = node["outputs"]["logs"]
         return logs
 
+    def create_run(
+        self,
+        compiled: CompiledPipeline,
+        experiment_id: str,
+        run_name: str | None = None,
+        arguments: dict[str, Any] | None = None,
+        enable_caching: bool | None = None,
+        cache_policy: PipelineCachePolicySchema | None = None,
+        cache_salt: str = "",
+        pipeline_spec: dict | None = None,
+    ) -> kfp_server_api.V2beta1Run:
+        """Create a run directly from in-memory IR (no package file round trip).
+
+        ``cache_policy`` (with ``cache_salt`` from ``invalidation_salt``) takes precedence over ``enable_caching``.
+        ``pipeline_spec`` is IR of ``compiled`` with the cache policy already applied (``apply_cache_policy``)
+        and is submitted as is.
+        """
+        if pipeline_spec is None and cache_policy is not None:
+            pipeline_spec = apply_cache_policy(compiled, cache_policy, cache_salt)
+        elif pipeline_spec is None and enable_caching is not None:
+            pipeline_spec = compiled.override_caching_options(enable_caching)
+        elif pipeline_spec is None:
+            pipeline_spec = compiled.pipeline_spec
+        run_body = kfp_server_api.V2beta1Run(
+            experiment_id=experiment_id,
+            display_name=run_name or f"{compiled.name} {datetime.now().strftime('%Y-%m-%d %H-%M-%S')}",
+            pipeline_spec=pipeline_spec,
+            runtime_config=kfp_server_api.V2beta1RuntimeConfig(parameters=arguments or {}),
+        )
+        run = self._call(self.kfp_client._run_api.create_run, body=run_body)
+        logger.info(f"Pipeline {compiled.name} started. Run ID: {run.run_id}")
+        return run
+
+    def create_run_from_pipeline_func(
+        self,
+        pipeline_func: callable,
+        experiment_id: str,
+        arguments: dict[str, Any] | None = None,
+        enable_caching: bool | None = None,
+        cache_policy: PipelineCachePolicySchema | None = None,
+        cache_salt: str = "",
+    ) -> kfp_server_api.V2beta1Run:
+        return self.create_run(
+            self.compile_pipeline(pipeline_func),
+            experiment_id=experiment_id,
+            arguments=arguments,
+            enable_caching=enable_caching,
+            cache_policy=cache_policy,
+            cache_salt=cache_salt,
+        )
+
+    def get_run(self, run_id: str) -> kfp_server_api.V2beta1Run:
+        return self._call(self.kfp_client.get_run, run_id)
+
     def get_run_status(self, run_id: str):
-        run = self.kfp_client.get_run(run_id)
-        return run.status
+        run = self._call(self.kfp_client.get_run, run_id)
+        return run.state
@@ -0,0 +1,60 @@
+import json
+import threading
+import time
+from typing import Any
+
+# kfp.client.client._FILTER_OPERATIONS["EQUALS"]
+FILTER_OPERATION_EQUALS = 1
+
+
+def display_name_filter(name: str) -> str:
+    """KFP API의 server-side filter (display_name == name)"""
+    return json.dumps(
+        {
+            "predicates": [
+                {
+                    "operation": FILTER_OPERATION_EQUALS,
+                    "key": "display_name",
+                    "stringValue": name,
+                }
+            ]
+        }
+    )
+
+
+class KubeflowResourceIndex:
+    """In-memory display_name -> KFP resource map with a TTL.
+
+    Entries are keyed by (kind, display_name), e.g. ("pipeline", "my-pipeline"), and hold the
+    resource object returned by the KFP API, so lookups by name do not need a round trip
+    until the entry expires or is invalidated by a create/delete.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: dict[tuple[str, str], tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, kind: str, name: str) -> Any | None:
+        entry = self._entries.get((kind, name))
+        if entry is None:
+            return None
+        resource, expires_at = entry
+        if expires_at <= time.monotonic():
+            with self._lock:
+                if self._entries.get((kind, name)) is entry:
+                    del self._entries[(kind, name)]
+            return None
+        return resource
+
+    def put(self, kind: str, name: str, resource: Any):
+        with self._lock:
+            self._entries[(kind, name)] = (resource, time.monotonic() + self.ttl)
+
+    def invalidate(self, kind: str, name: str | None = None):
+        with self._lock:
+            if name is not None:
+                self._entries.pop((kind, name), None)
+                return
+            for key in [key for key in self._entries if key[0] == kind]:
+                del self._entries[key]
@@ -0,0 +1,146 @@
+import asyncio
+import logging
+from functools import lru_cache
+from typing import Callable
+
+from config.db.session import AsyncSessionLocal
+from config.settings import get_settings
+from db.models import Metric
+from sqlalchemy import insert
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+
+class MetricBufferFullError(Exception):
+    pass
+
+
+class MetricWriteBuffer:
+    """In-memory buffer of metric rows written to the ``metric`` table in bulk.
+
+    Rows are flushed as one multi-row INSERT (executemany) per ``flush_size`` rows inside a single
+    transaction, either when ``flush_size`` rows are pending or every ``flush_interval`` seconds.
+    Callers that hit the flush threshold wait for it, which throttles producers to the database
+    write rate. If the database is unreachable, rows stay buffered up to ``max_pending`` (beyond that
+    ``add`` raises ``MetricBufferFullError``) and are retried for ``max_retries`` flushes before being
+    dropped. A batch rejected for its data is split in halves until the rejected rows are isolated;
+    those rows are logged and dropped so they cannot block the rows behind them.
+
+    Buffered rows are lost if the process dies before the next flush.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        flush_size: int,
+        flush_interval: float,
+        max_pending: int,
+        max_retries: int,
+    ):
+        self._session_factory = session_factory
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_retries = max_retries
+        self._failed_flushes = 0  # 연속으로 DB 에 연결하지 못한 flush 수
+        self._rows: list[dict] = []
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    async def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def add(self, rows: list[dict]):
+        if len(self._rows) + len(rows) > self.max_pending:
+            raise MetricBufferFullError(f"Metric buffer is full ({self.max_pending} points pending)")
+        self._rows.extend(rows)
+        if len(self._rows) >= self.flush_size:
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Write the pending rows. Returns the number of rows written."""
+        async with self._flush_lock:
+            rows, self._rows = self._rows, []
+            if not rows:
+                return 0
+            try:
+                await self._write(rows)
+            except Exception as e:
+                if not is_transient_error(e):
+                    logger.warning(f"Failed to write {len(rows)} metric points, isolating rejected rows: {e}")
+                    return await self._write_isolating(rows)
+                self._failed_flushes += 1
+                if self._failed_flushes > self.max_retries:
+                    logger.exception(f"Dropping {len(rows)} metric points after {self._failed_flushes} failed flushes")
+                    self._failed_flushes = 0
+                    return 0
+                logger.exception(f"Failed to write {len(rows)} metric points, retrying on next flush")
+                # 다음 flush 에서 다시 시도한다. (그 사이 들어온 row 보다 앞에 둔다)
+                self._rows[:0] = rows
+                return 0
+            self._failed_flushes = 0
+            return len(rows)
+
+    async def _write(self, rows: list[dict]):
+        async with self._session_factory() as session, session.begin():
+            for i in range(0, len(rows), self.flush_size):
+                await session.execute(insert(Metric.__table__), rows[i : i + self.flush_size])
+
+    async def _write_isolating(self, rows: list[dict]) -> int:
+        """rows 를 반씩 나눠 쓰면서 거부되는 row 만 버린다. DB 연결이 끊기면 남은 row 는 다음 flush 로 넘긴다."""
+        written = 0
+        parts = [rows]  # 마지막 항목이 가장 앞의 row
+        while parts:
+            part = parts.pop()
+            try:
+                await self._write(part)
+            except Exception as e:
+                if is_transient_error(e):
+                    logger.exception(f"Failed to write metric points, retrying {len(part)} on next flush")
+                    self._rows[:0] = [row for remaining in (part, *reversed(parts)) for row in remaining]
+                    return written
+                if len(part) == 1:
+                    logger.error(f"Dropping rejected metric point {part[0]}: {e}")
+                    continue
+                middle = len(part) // 2
+                parts += [part[middle:], part[:middle]]
+                continue
+            written += len(part)
+        return written
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+
+def is_transient_error(e: Exception) -> bool:
+    """DB 연결 문제처럼 다시 시도하면 성공할 수 있는 오류인지 (row 의 내용 때문에 거부된 것이 아닌지)"""
+    if isinstance(e, DBAPIError):
+        return e.connection_invalidated or isinstance(e, (OperationalError, InterfaceError))
+    return isinstance(e, (OSError, asyncio.TimeoutError))
+
+
+@lru_cache
+def get_metric_write_buffer() -> MetricWriteBuffer:
+    settings = get_settings()
+    return MetricWriteBuffer(
+        session_factory=AsyncSessionLocal,
+        flush_size=settings.METRIC_FLUSH_SIZE,
+        flush_interval=settings.METRIC_FLUSH_INTERVAL,
+        max_pending=settings.METRIC_BUFFER_MAX_POINTS,
+        max_retries=settings.METRIC_FLUSH_MAX_RETRIES,
+    )
@@ -0,0 +1,97 @@
+import asyncio
+import logging
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceQueueFullError(Exception):
+    pass
+
+
+class MicroBatcher:
+    """Collects concurrent requests for one model into batches that run as a single call.
+
+    An item waits at most ``max_wait`` seconds (counted from when it was queued) for others to join
+    its batch, and a batch runs as soon as it holds ``max_batch_size`` items. Batches run one at a
+    time in a worker thread, so a forward pass gets every intra-op thread instead of competing with
+    other requests. At most ``max_queue`` items may wait; beyond that ``submit`` raises
+    ``InferenceQueueFullError`` so latency stays bounded under overload instead of growing with the
+    backlog.
+    """
+
+    def __init__(
+        self,
+        predict_batch: Callable[[list[Any]], list[Any]],
+        max_batch_size: int,
+        max_wait: float,
+        max_queue: int,
+    ):
+        self._predict_batch = predict_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: asyncio.Queue[tuple[Any, asyncio.Future, float]] = asyncio.Queue(maxsize=max_queue)
+        self._task: asyncio.Task | None = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        while not self._queue.empty():
+            _, future, _ = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Model was unloaded"))
+
+    async def submit(self, item: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        try:
+            self._queue.put_nowait((item, future, loop.time()))
+        except asyncio.QueueFull:
+            raise InferenceQueueFullError(f"Inference queue is full ({self._queue.maxsize} requests waiting)")
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            item, future, queued_at = await self._queue.get()
+            batch = [(item, future)]
+            deadline = queued_at + self.max_wait
+            while len(batch) < self.max_batch_size:
+                if self._queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item, future, _ = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    item, future, _ = self._queue.get_nowait()
+                batch.append((item, future))
+
+            # 기다리는 동안 연결이 끊긴 요청은 빼고 실행한다.
+            batch = [(item, future) for item, future in batch if not future.done()]
+            if not batch:
+                continue
+            try:
+                outputs = await asyncio.to_thread(self._predict_batch, [item for item, _ in batch])
+                if len(outputs) != len(batch):
+                    raise RuntimeError(f"Model returned {len(outputs)} outputs for {len(batch)} inputs")
+            except Exception as e:
+                logger.exception(f"Failed to run a batch of {len(batch)}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, future), output in zip(batch, outputs):
+                if not future.done():
+                    future.set_result(output)
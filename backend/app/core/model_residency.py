@@ -0,0 +1,228 @@
+import asyncio
+import gc
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from config.db.session import AsyncSessionLocal
+from config.settings import get_settings
+from core.artifact_cache import fetch_registry_artifact
+from core.inference import Predictor, TransformersPredictor
+from core.micro_batcher import MicroBatcher
+from core.reference_cache import get_reference_cache
+from db.models import Model, ModelRegistry
+from schemas.reference import ReferenceName
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+
+class ModelCapacityError(Exception):
+    pass
+
+
+@dataclass
+class ResidentModel:
+    registry_id: int
+    version: int
+    task: str
+    predictor: Predictor
+    batcher: MicroBatcher
+    footprint: int  # bytes
+    pinned: bool
+    loaded_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    last_used_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    in_flight: int = 0  # 처리 중인 추론 요청 수
+
+
+class ModelResidencyManager:
+    """Keeps loaded model versions (``ModelRegistry`` rows) in memory under a RAM budget of ``max_bytes``.
+
+    A version is loaded on its first request; concurrent requests for a version that is loading
+    share that one load. Before loading, the artifact size is reserved against the budget and the
+    least recently used versions are unloaded until it fits; once loaded, the reservation is
+    replaced by the model's measured footprint. Versions in ``pinned_ids`` are loaded by
+    ``preload`` and never unloaded, and a version serving a request is not unloaded either. When
+    the pinned and busy versions leave no room, loading raises ``ModelCapacityError``.
+    """
+
+    def __init__(
+        self,
+        predictor_factory: Callable[[Path, str], Predictor],
+        session_factory: Callable[[], AsyncSession],
+        max_bytes: int,
+        pinned_ids: Iterable[int],
+        max_batch_size: int,
+        max_wait: float,
+        max_queue: int,
+    ):
+        self._predictor_factory = predictor_factory
+        self._session_factory = session_factory
+        self.max_bytes = max_bytes
+        self.pinned_ids = set(pinned_ids)
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_queue = max_queue
+        self._residents: OrderedDict[int, ResidentModel] = OrderedDict()  # registry id -> model, 오래 사용하지 않은 순
+        self._loading: dict[int, asyncio.Task] = {}
+        self._reserved = 0  # load 중인 model 에 예약한 bytes
+
+    @property
+    def used(self) -> int:
+        return sum(resident.footprint for resident in self._residents.values()) + self._reserved
+
+    @property
+    def residents(self) -> list[ResidentModel]:
+        return list(self._residents.values())
+
+    async def predict(self, registry_id: int, inputs: list[Any]) -> list[Any]:
+        resident = await self.load(registry_id)
+        resident.in_flight += 1
+        try:
+            return list(await asyncio.gather(*(resident.batcher.submit(item) for item in inputs)))
+        finally:
+            resident.in_flight -= 1
+            resident.last_used_at = datetime.now(timezone.utc)
+
+    async def load(self, registry_id: int) -> ResidentModel:
+        """model version 을 memory 에 올려 반환한다. 이미 올라와 있으면 가장 최근에 사용한 것으로 표시한다."""
+        while True:
+            resident = self._residents.get(registry_id)
+            if resident is not None:
+                self._residents.move_to_end(registry_id)
+                return resident
+            task = self._loading.get(registry_id)
+            if task is None:
+                task = self._loading[registry_id] = asyncio.create_task(self._load(registry_id))
+            # 요청이 취소되어도 같은 model 을 기다리는 다른 요청을 위해 load 는 계속한다.
+            await asyncio.shield(task)
+
+    async def unload(self, registry_id: int) -> bool:
+        resident = self._residents.pop(registry_id, None)
+        if resident is None:
+            return False
+        await self._unload(resident)
+        return True
+
+    async def preload(self):
+        """pinned model 을 올린다. 실패한 model 은 log 만 남기고 첫 요청 때 다시 load 한다."""
+        for registry_id in sorted(self.pinned_ids):
+            try:
+                await self.load(registry_id)
+            except Exception:
+                logger.exception(f"Failed to preload model registry {registry_id}")
+
+    async def stop(self):
+        for task in list(self._loading.values()):
+            task.cancel()
+        await asyncio.gather(*self._loading.values(), return_exceptions=True)
+        while self._residents:
+            _, resident = self._residents.popitem(last=False)
+            await self._unload(resident)
+
+    async def _load(self, registry_id: int) -> ResidentModel:
+        try:
+            async with self._session_factory() as db:
+                registry = await db.get(ModelRegistry, registry_id)
+                if registry is None:
+                    raise ValueError(f"Model registry {registry_id} not found")
+                model_type_id = await db.scalar(select(Model.model_type_id).where(Model.id == registry.model_id))
+                model_type = await get_reference_cache().get(db, ReferenceName.MODEL_TYPE, model_type_id)
+                if model_type is None:
+                    raise ValueError(f"Model type of model registry {registry_id} not found")
+                artifact = await fetch_registry_artifact(db, registry)
+                version = registry.version
+
+            # load 전에는 artifact 크기로 memory 사용량을 가늠한다.
+            evicted = self._reserve(artifact.size, f"model registry {registry_id}")
+            try:
+                await self._unload_all(evicted)
+                logger.info(f"Loading model registry {registry_id} ({model_type.name}) from {artifact.path}")
+                predictor = await asyncio.to_thread(self._predictor_factory, artifact.path, model_type.name)
+                footprint = predictor.memory_footprint()
+            finally:
+                self._reserved -= artifact.size
+
+            batcher = MicroBatcher(predictor.predict, self.max_batch_size, self.max_wait, self.max_queue)
+            batcher.start()
+            resident = ResidentModel(
+                registry_id=registry_id,
+                version=version,
+                task=model_type.name,
+                predictor=predictor,
+                batcher=batcher,
+                footprint=footprint,
+                pinned=registry_id in self.pinned_ids,
+            )
+            self._residents[registry_id] = resident
+            logger.info(f"Loaded model registry {registry_id} ({footprint} bytes, {self.used}/{self.max_bytes} used)")
+            # 실제 크기가 예상보다 크면 다른 model 을 더 내린다.
+            try:
+                await self._unload_all(self._reserve(0, f"model registry {registry_id}", keep=registry_id))
+            except ModelCapacityError as e:
+                logger.warning(f"Model memory budget exceeded: {e}")
+            return resident
+        finally:
+            self._loading.pop(registry_id, None)
+
+    def _reserve(self, needed: int, name: str, keep: int | None = None) -> list[ResidentModel]:
+        """needed bytes 를 예약하고, 그만큼 확보하려면 내려야 하는 model 을 LRU 순으로 (unpin, idle 상태인 것만) 반환한다.
+
+        확인과 예약 사이에 await 가 없어서 동시에 load 하는 model 들이 함께 예산을 넘지 않는다.
+        예약은 호출한 쪽에서 ``_reserved`` 에서 빼서 해제한다.
+        """
+        evictable = [
+            resident
+            for resident in self._residents.values()
+            if not resident.pinned and resident.in_flight == 0 and resident.registry_id != keep
+        ]
+        fixed = self.used - sum(resident.footprint for resident in evictable)
+        if fixed + needed > self.max_bytes:
+            raise ModelCapacityError(
+                f"Not enough model memory for {name} ({needed} bytes needed, {fixed} of {self.max_bytes} bytes"
+                " held by pinned, busy or loading models)"
+            )
+
+        evicted = []
+        for resident in evictable:
+            if self.used + needed <= self.max_bytes:
+                break
+            # 목록에서 바로 빼서 다른 요청이 내리는 중인 model 을 쓰지 않게 한다.
+            del self._residents[resident.registry_id]
+            evicted.append(resident)
+        self._reserved += needed
+        return evicted
+
+    async def _unload_all(self, residents: list[ResidentModel]):
+        for resident in residents:
+            await self._unload(resident)
+
+    async def _unload(self, resident: ResidentModel):
+        logger.info(f"Unloading model registry {resident.registry_id} ({resident.footprint} bytes)")
+        await resident.batcher.stop()
+        resident.predictor = resident.batcher = None
+        # 순환 참조로 남은 tensor 도 바로 해제한다.
+        await asyncio.to_thread(gc.collect)
+
+
+@lru_cache
+def get_model_residency_manager() -> ModelResidencyManager:
+    settings = get_settings()
+
+    def predictor_factory(model_path: Path, task: str) -> Predictor:
+        return TransformersPredictor(model_path, task, num_threads=settings.INFERENCE_NUM_THREADS)
+
+    return ModelResidencyManager(
+        predictor_factory=predictor_factory,
+        session_factory=AsyncSessionLocal,
+        max_bytes=settings.MODEL_MEMORY_BUDGET,
+        pinned_ids=settings.MODEL_PINNED_REGISTRY_IDS,
+        max_batch_size=settings.INFERENCE_MAX_BATCH_SIZE,
+        max_wait=settings.INFERENCE_MAX_WAIT,
+        max_queue=settings.INFERENCE_MAX_QUEUE,
+    )
@@ -0,0 +1,118 @@
+import copy
+from datetime import datetime, timezone
+
+import kfp_server_api
+from core.pipeline_compiler import CompiledPipeline
+from db.models import PipelineCacheInvalidation
+from schemas.pipeline import (
+    CachePolicySchema,
+    PipelineCachePolicySchema,
+    RunCacheReportSchema,
+    TaskCacheSchema,
+)
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+# cache key 를 바꾸기 위해 task 에 추가하는 입력. component 함수의 인자가 아니므로 실행에는 영향이 없다.
+CACHE_SALT_PARAMETER = "aipaas_cache_salt"
+
+CACHED_TASK_STATE = "SKIPPED"
+
+
+def invalidation_salt(db: Session, dataset_id: int | None = None, model_registry_id: int | None = None) -> str:
+    """submission 이 사용하는 dataset/model version 의 마지막 cache 무효화 기록 (무효화할 때마다 바뀐다)."""
+    parts = []
+    for column, target_id, name in (
+        (PipelineCacheInvalidation.dataset_id, dataset_id, "dataset"),
+        (PipelineCacheInvalidation.model_registry_id, model_registry_id, "model_registry"),
+    ):
+        if target_id is None:
+            continue
+        last = db.scalar(select(func.max(PipelineCacheInvalidation.id)).where(column == target_id))
+        if last is not None:
+            parts.append(f"{name}:{target_id}:{last}")
+    return ",".join(parts)
+
+
+def apply_cache_policy(
+    compiled: CompiledPipeline, policy: PipelineCachePolicySchema, salt: str = "", now: datetime | None = None
+) -> dict:
+    """Return a copy of ``pipeline_spec`` with the cache policy applied to every container task.
+
+    KFP reuses a task's outputs when a previous execution had the same cache key, which covers the
+    component and every input value. IR has no staleness or invalidation setting, so both are
+    applied through an extra constant input: ``max_staleness`` adds the current time window (an
+    entry is reused for at most that long) and ``salt`` the invalidation records of the submission.
+    Tasks without either keep their inputs untouched, so they still hit entries of earlier runs.
+    """
+    pipeline_spec = copy.deepcopy(compiled.pipeline_spec)
+    root_spec = pipeline_spec.get("pipeline_spec", pipeline_spec)
+    components = root_spec.get("components", {})
+    dags = [root_spec["root"]["dag"], *(component["dag"] for component in components.values() if "dag" in component)]
+
+    task_names = {name for dag in dags for name in dag.get("tasks", {})}
+    unknown = policy.components.keys() - task_names
+    if unknown:
+        raise ValueError(f"Unknown pipeline tasks in cache policy: {', '.join(sorted(unknown))}")
+
+    now = now or datetime.now(timezone.utc)
+    for dag in dags:
+        for task_name, task in dag.get("tasks", {}).items():
+            component = components.get(task["componentRef"]["name"], {})
+            if "executorLabel" not in component:
+                continue  # sub-DAG 은 cache 대상이 아니다.
+            task_policy = merge_policy(policy, policy.components.get(task_name))
+            caching = task.setdefault("cachingOptions", {})
+            if task_policy.enabled is not None:
+                caching["enableCache"] = task_policy.enabled
+            if not caching.get("enableCache"):
+                continue
+
+            parts = [salt] if salt else []
+            if task_policy.max_staleness is not None:
+                window = task_policy.max_staleness.total_seconds()
+                parts.append(f"staleness:{window:g}:{int(now.timestamp() // window)}")
+            if not parts:
+                continue
+            component.setdefault("inputDefinitions", {}).setdefault("parameters", {})[CACHE_SALT_PARAMETER] = {
+                "parameterType": "STRING",
+                "defaultValue": "",
+                "isOptional": True,
+            }
+            task.setdefault("inputs", {}).setdefault("parameters", {})[CACHE_SALT_PARAMETER] = {
+                "runtimeValue": {"constant": ";".join(parts)}
+            }
+    return pipeline_spec
+
+
+def merge_policy(policy: CachePolicySchema, override: CachePolicySchema | None) -> CachePolicySchema:
+    if override is None:
+        return policy
+    return CachePolicySchema(
+        enabled=override.enabled if override.enabled is not None else policy.enabled,
+        max_staleness=override.max_staleness if "max_staleness" in override.model_fields_set else policy.max_staleness,
+    )
+
+
+def run_cache_report(run: kfp_server_api.V2beta1Run) -> RunCacheReportSchema:
+    task_details = (run.run_details.task_details if run.run_details else None) or []
+    # run 자체(root DAG)는 task 목록에서 뺀다.
+    if any(task.parent_task_id for task in task_details):
+        task_details = [task for task in task_details if task.parent_task_id]
+    tasks = [
+        TaskCacheSchema(
+            task_id=task.task_id,
+            display_name=task.display_name,
+            state=task.state,
+            cached=task.state == CACHED_TASK_STATE,
+        )
+        for task in task_details
+    ]
+    cache_hits = sum(task.cached for task in tasks)
+    return RunCacheReportSchema(
+        run_id=run.run_id,
+        state=run.state,
+        tasks=tasks,
+        cache_hits=cache_hits,
+        hit_ratio=cache_hits / len(tasks) if tasks else 0.0,
+    )
@@ -0,0 +1,114 @@
+import copy
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+
+import yaml
+from config.settings import get_settings
+from google.protobuf import json_format
+from kfp.compiler import pipeline_spec_builder as builder
+from kfp.dsl import base_component
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CompiledPipeline:
+    """Compiled pipeline IR kept in memory.
+
+    ``pipeline_spec`` is shared by every user of the cache entry; copy it before modifying
+    (e.g. with ``override_caching_options``).
+    """
+
+    name: str
+    digest: str
+    pipeline_spec: dict  # V2beta1Run.pipeline_spec 형식 (platform spec이 있으면 함께 포함)
+    package: str  # Compiler().compile 결과와 같은 IR YAML
+
+    def override_caching_options(self, enable_caching: bool) -> dict:
+        """Return a copy of ``pipeline_spec`` with caching turned on/off for every root task."""
+        pipeline_spec = copy.deepcopy(self.pipeline_spec)
+        root_spec = pipeline_spec.get("pipeline_spec", pipeline_spec)
+        for task in root_spec["root"]["dag"]["tasks"].values():
+            task.setdefault("cachingOptions", {})["enableCache"] = enable_caching
+        return pipeline_spec
+
+
+class PipelineCompiler:
+    """Compiles pipelines to IR in memory and keeps the results in an LRU cache.
+
+    The cache key is a SHA-256 of the pipeline spec (which embeds every component spec and
+    executor), the platform spec and the pipeline name, so resubmitting the same pipeline
+    skips the compiler entirely while any change to a component produces a new entry.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._cache: OrderedDict[str, CompiledPipeline] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest(pipeline_func: base_component.BaseComponent, pipeline_name: str | None = None) -> str:
+        sha256 = hashlib.sha256()
+        sha256.update(pipeline_func.pipeline_spec.SerializeToString(deterministic=True))
+        sha256.update(pipeline_func.platform_spec.SerializeToString(deterministic=True))
+        sha256.update((pipeline_name or "").encode())
+        return sha256.hexdigest()
+
+    def compile(
+        self, pipeline_func: base_component.BaseComponent, pipeline_name: str | None = None
+    ) -> CompiledPipeline:
+        digest = self.digest(pipeline_func, pipeline_name)
+        with self._lock:
+            compiled = self._cache.get(digest)
+            if compiled is not None:
+                self._cache.move_to_end(digest)
+                return compiled
+
+        compiled = self._compile(pipeline_func, pipeline_name, digest)
+        with self._lock:
+            self._cache[digest] = compiled
+            self._cache.move_to_end(digest)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+        logger.info(f"Pipeline {compiled.name} compiled (digest: {digest[:12]})")
+        return compiled
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    @staticmethod
+    def _compile(
+        pipeline_func: base_component.BaseComponent, pipeline_name: str | None, digest: str
+    ) -> CompiledPipeline:
+        # kfp.compiler.Compiler.compile 과 같은 과정이지만 파일 대신 메모리에 결과를 남긴다.
+        pipeline_spec = builder.modify_pipeline_spec_with_override(
+            pipeline_spec=pipeline_func.pipeline_spec,
+            pipeline_name=pipeline_name,
+            pipeline_parameters=None,
+        )
+        platform_spec = pipeline_func.platform_spec
+
+        pipeline_spec_dict = json_format.MessageToDict(pipeline_spec)
+        documents = [pipeline_spec_dict]
+        run_pipeline_spec = pipeline_spec_dict
+        if len(platform_spec.platforms) > 0:
+            platform_spec_dict = json_format.MessageToDict(platform_spec)
+            documents.append(platform_spec_dict)
+            run_pipeline_spec = {"pipeline_spec": pipeline_spec_dict, "platform_spec": platform_spec_dict}
+
+        return CompiledPipeline(
+            name=pipeline_spec.pipeline_info.name,
+            digest=digest,
+            pipeline_spec=run_pipeline_spec,
+            package=yaml.dump_all(documents, sort_keys=True),
+        )
+
+
+@lru_cache
+def get_pipeline_compiler() -> PipelineCompiler:
+    return PipelineCompiler(max_size=get_settings().PIPELINE_COMPILE_CACHE_SIZE)
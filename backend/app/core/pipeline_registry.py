@@ -0,0 +1,112 @@
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+
+from core.pipeline_compiler import (
+    CompiledPipeline,
+    PipelineCompiler,
+    get_pipeline_compiler,
+)
+from kfp.dsl import base_component
+from pipelines import register_all
+
+logger = logging.getLogger(__name__)
+
+
+class PipelineNotFoundError(KeyError):
+    pass
+
+
+@dataclass(frozen=True)
+class RegisteredPipeline:
+    name: str
+    pipeline: base_component.BaseComponent
+    description: str = ""
+
+
+class PipelineRegistry:
+    """KFP components and pipelines by name, each compiled and hashed once.
+
+    Components and pipelines are decorated once when their module (``pipelines``) is imported and
+    registered here by name. A pipeline is compiled the first time it is used, or by ``compile_all``
+    at startup, and the result is kept for the life of the process, so a request only looks up a
+    name: nothing is decorated, built, serialized or hashed on the request path.
+    """
+
+    def __init__(self, compiler: PipelineCompiler):
+        self._compiler = compiler
+        self._components: dict[str, base_component.BaseComponent] = {}
+        self._pipelines: dict[str, RegisteredPipeline] = {}
+        self._component_digests: dict[str, str] = {}
+        self._compiled: dict[str, CompiledPipeline] = {}
+        self._lock = threading.Lock()
+
+    def add_component(self, name: str, component: base_component.BaseComponent):
+        if name in self._components:
+            raise ValueError(f"Component {name} is already registered")
+        self._components[name] = component
+
+    def add_pipeline(self, name: str, pipeline: base_component.BaseComponent, description: str = ""):
+        if name in self._pipelines:
+            raise ValueError(f"Pipeline {name} is already registered")
+        self._pipelines[name] = RegisteredPipeline(name=name, pipeline=pipeline, description=description)
+
+    def component(self, name: str) -> base_component.BaseComponent:
+        try:
+            return self._components[name]
+        except KeyError:
+            raise PipelineNotFoundError(f"Component {name} not found")
+
+    def has_pipeline(self, name: str) -> bool:
+        return name in self._pipelines
+
+    @property
+    def pipelines(self) -> list[RegisteredPipeline]:
+        return list(self._pipelines.values())
+
+    @property
+    def component_names(self) -> list[str]:
+        return list(self._components)
+
+    def compile(self, name: str) -> CompiledPipeline:
+        compiled = self._compiled.get(name)
+        if compiled is not None:
+            return compiled
+        registered = self._pipelines.get(name)
+        if registered is None:
+            raise PipelineNotFoundError(f"Pipeline {name} not found")
+        with self._lock:
+            compiled = self._compiled.get(name)
+            if compiled is None:
+                compiled = self._compiled[name] = self._compiler.compile(registered.pipeline)
+        return compiled
+
+    def component_digest(self, name: str) -> str:
+        """component spec(IR) 의 sha256"""
+        digest = self._component_digests.get(name)
+        if digest is None:
+            spec = self.component(name).pipeline_spec.SerializeToString(deterministic=True)
+            digest = self._component_digests[name] = hashlib.sha256(spec).hexdigest()
+        return digest
+
+    def compile_all(self):
+        """등록된 pipeline 과 component 를 모두 미리 build 한다. 실패한 것은 log 만 남기고 처음 사용할 때 다시 시도한다."""
+        for name in self._pipelines:
+            try:
+                self.compile(name)
+            except Exception:
+                logger.exception(f"Failed to compile pipeline {name}")
+        for name in self._components:
+            try:
+                self.component_digest(name)
+            except Exception:
+                logger.exception(f"Failed to build component {name}")
+
+
+@lru_cache
+def get_pipeline_registry() -> PipelineRegistry:
+    registry = PipelineRegistry(compiler=get_pipeline_compiler())
+    register_all(registry)
+    return registry
@@ -0,0 +1,122 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+
+from config.settings import get_settings
+from db.models import (
+    HyperparameterType,
+    ImageRegistry,
+    ModelFormat,
+    ModelProvider,
+    ModelType,
+    ReferenceVersion,
+)
+from db.models.base import BaseModel as OrmModel
+from pydantic import BaseModel
+from schemas.reference import (
+    HyperparameterTypeSchema,
+    ImageRegistrySchema,
+    ModelFormatSchema,
+    ModelProviderSchema,
+    ModelTypeSchema,
+    ReferenceName,
+)
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ReferenceTable:
+    model: type[OrmModel]
+    schema: type[BaseModel]
+
+
+REFERENCE_TABLES = {
+    ReferenceName.MODEL_FORMAT: ReferenceTable(ModelFormat, ModelFormatSchema),
+    ReferenceName.MODEL_PROVIDER: ReferenceTable(ModelProvider, ModelProviderSchema),
+    ReferenceName.MODEL_TYPE: ReferenceTable(ModelType, ModelTypeSchema),
+    ReferenceName.HYPERPARAMETER_TYPE: ReferenceTable(HyperparameterType, HyperparameterTypeSchema),
+    ReferenceName.IMAGE_REGISTRY: ReferenceTable(ImageRegistry, ImageRegistrySchema),
+}
+
+
+class ReferenceCache:
+    """Read-through, per-process cache of the small reference tables.
+
+    Each table is loaded whole on first use and kept as schema objects keyed by id. Writes go through
+    ``bump`` (in the writer's transaction), which increments the table's row in ``reference_version``
+    and drops the local copy; other workers notice the new version on their next check, at most
+    ``check_interval`` seconds later, and reload that table.
+    """
+
+    def __init__(self, check_interval: float):
+        self.check_interval = check_interval
+        self._rows: dict[ReferenceName, dict[int, BaseModel]] = {}
+        self._versions: dict[ReferenceName, int] = {}
+        self._checked_at = float("-inf")
+        self._check_lock = asyncio.Lock()
+        self._load_locks = {name: asyncio.Lock() for name in REFERENCE_TABLES}
+
+    async def get_all(self, db: AsyncSession, name: ReferenceName) -> dict[int, BaseModel]:
+        await self._check_versions(db)
+        rows = self._rows.get(name)
+        if rows is None:
+            rows = await self._load(db, name)
+        return rows
+
+    async def get(self, db: AsyncSession, name: ReferenceName, id: int) -> BaseModel | None:
+        return (await self.get_all(db, name)).get(id)
+
+    async def bump(self, db: AsyncSession, name: ReferenceName):
+        """table 변경과 같은 transaction 에서 version 을 올린다. commit 후 ``invalidate`` 를 호출한다."""
+        result = await db.execute(
+            update(ReferenceVersion)
+            .where(ReferenceVersion.name == name.value)
+            .values(version=ReferenceVersion.version + 1)
+        )
+        if result.rowcount == 0:
+            db.add(ReferenceVersion(name=name.value, version=1))
+
+    def invalidate(self, name: ReferenceName | None = None):
+        if name is None:
+            self._rows.clear()
+            self._versions.clear()
+        else:
+            self._rows.pop(name, None)
+            self._versions.pop(name, None)
+
+    async def _check_versions(self, db: AsyncSession):
+        if time.monotonic() - self._checked_at < self.check_interval:
+            return
+        async with self._check_lock:
+            if time.monotonic() - self._checked_at < self.check_interval:
+                return
+            versions = dict((await db.execute(select(ReferenceVersion.name, ReferenceVersion.version))).all())
+            for name in list(self._rows):
+                if versions.get(name.value, 0) != self._versions.get(name):
+                    logger.info(f"Reference table {name.value} changed, reloading")
+                    self.invalidate(name)
+            self._checked_at = time.monotonic()
+
+    async def _load(self, db: AsyncSession, name: ReferenceName) -> dict[int, BaseModel]:
+        async with self._load_locks[name]:
+            rows = self._rows.get(name)
+            if rows is not None:
+                return rows
+            table = REFERENCE_TABLES[name]
+            # version 을 먼저 읽어야 그 사이의 변경을 다음 check 에서 놓치지 않는다.
+            version = await db.scalar(select(ReferenceVersion.version).where(ReferenceVersion.name == name.value))
+            rows = {row.id: table.schema.model_validate(row) for row in await db.scalars(select(table.model))}
+            self._rows[name] = rows
+            self._versions[name] = version or 0
+            return rows
+
+
+@lru_cache
+def get_reference_cache() -> ReferenceCache:
+    settings = get_settings()
+    return ReferenceCache(check_interval=settings.REFERENCE_CACHE_CHECK_INTERVAL)
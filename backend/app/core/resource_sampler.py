@@ -0,0 +1,228 @@
+import logging
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Callable, Protocol
+
+from config.db.session import SessionLocal
+from config.settings import get_settings
+from db.models import ExperimentModel, ResourceUsage
+from kubernetes import client
+from kubernetes.utils import parse_quantity
+from schemas.experiment import ExperimentStatus
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+from utils.kubernetes_client import get_custom_objects_api
+
+logger = logging.getLogger(__name__)
+
+# 사용량을 수집하는 experiment 상태
+ACTIVE_STATUSES = [ExperimentStatus.PENDING.value, ExperimentStatus.RUNNING.value]
+
+
+@dataclass(frozen=True)
+class ResourceSample:
+    cpu_usage: float  # core
+    memory_usage: float  # MiB
+    gpu_usage: float = 0.0  # %
+    gpu_memory_usage: float = 0.0  # MiB
+
+
+class ResourceUsageSource(Protocol):
+    def sample(self, run_ids: list[str]) -> dict[str, ResourceSample]:
+        """run 별 현재 사용량. 사용량을 얻지 못한 run 은 결과에서 빠진다."""
+        ...
+
+
+class FakeResourceUsageSource:
+    """run 마다 random walk 로 사용량을 만드는 source (test, local 개발용)"""
+
+    def __init__(self, seed: int | None = None):
+        self._random = random.Random(seed)
+        self._last: dict[str, ResourceSample] = {}
+
+    def sample(self, run_ids: list[str]) -> dict[str, ResourceSample]:
+        samples = {}
+        for run_id in run_ids:
+            last = self._last.get(run_id, ResourceSample(1.0, 1024.0, 50.0, 4096.0))
+            samples[run_id] = self._last[run_id] = ResourceSample(
+                cpu_usage=self._walk(last.cpu_usage, 0.2),
+                memory_usage=self._walk(last.memory_usage, 64),
+                gpu_usage=min(self._walk(last.gpu_usage, 10), 100.0),
+                gpu_memory_usage=self._walk(last.gpu_memory_usage, 256),
+            )
+        return samples
+
+    def _walk(self, value: float, scale: float) -> float:
+        return max(value + self._random.uniform(-scale, scale), 0.0)
+
+
+class KubernetesMetricsSource:
+    """Pod usage from the metrics API (``metrics.k8s.io``), summed per run.
+
+    Pods are matched to runs by the ``label_key`` label, which KFP sets to the run ID on every task
+    pod. metrics-server does not report GPUs, so GPU columns are 0.
+    """
+
+    def __init__(
+        self,
+        custom_objects_api_factory: Callable[[], client.CustomObjectsApi],
+        namespace: str,
+        label_key: str = "pipeline/runid",
+        max_runs_per_request: int = 50,
+    ):
+        self._custom_objects_api_factory = custom_objects_api_factory
+        self.namespace = namespace
+        self.label_key = label_key
+        self.max_runs_per_request = max_runs_per_request
+
+    def sample(self, run_ids: list[str]) -> dict[str, ResourceSample]:
+        api = self._custom_objects_api_factory()
+        usage: dict[str, list[float]] = {}
+        # label selector 길이를 제한하기 위해 run 을 나눠서 조회한다.
+        for i in range(0, len(run_ids), self.max_runs_per_request):
+            selector = f"{self.label_key} in ({','.join(run_ids[i : i + self.max_runs_per_request])})"
+            pod_metrics = api.list_namespaced_custom_object(
+                "metrics.k8s.io", "v1beta1", self.namespace, "pods", label_selector=selector
+            )
+            for pod in pod_metrics.get("items", []):
+                run_id = (pod["metadata"].get("labels") or {}).get(self.label_key)
+                if run_id is None:
+                    continue
+                total = usage.setdefault(run_id, [0.0, 0.0])
+                for container in pod.get("containers", []):
+                    total[0] += float(parse_quantity(container["usage"]["cpu"]))
+                    total[1] += float(parse_quantity(container["usage"]["memory"])) / 2**20
+        return {run_id: ResourceSample(cpu_usage=cpu, memory_usage=memory) for run_id, (cpu, memory) in usage.items()}
+
+
+class ResourceUsageSampler:
+    """Background sampler of the resource usage of active experiments.
+
+    Every ``sample_interval`` seconds it reads the experiments that are pending or running (as kept
+    up to date by the run status sync), asks ``source`` for the usage of their runs and appends one
+    row per experiment to that experiment's ring buffer of ``ring_size`` samples. Buffers are written
+    as one multi-row INSERT every ``flush_interval`` seconds, or as soon as one of them is full. If
+    writes keep failing, each buffer keeps only its newest ``ring_size`` samples.
+    """
+
+    def __init__(
+        self,
+        source: ResourceUsageSource,
+        session_factory: Callable[[], Session],
+        sample_interval: float,
+        flush_interval: float,
+        ring_size: int,
+    ):
+        self.source = source
+        self._session_factory = session_factory
+        self.sample_interval = sample_interval
+        self.flush_interval = flush_interval
+        self.ring_size = ring_size
+        self._rings: dict[int, deque[dict]] = {}
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="resource-usage-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None):
+        """Stop sampling and flush what is buffered."""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def sample(self) -> int:
+        """Take one sample of every active experiment. Returns the number of experiments sampled."""
+        with self._session_factory() as session:
+            active = session.execute(
+                select(ExperimentModel.id, ExperimentModel.run_id).where(
+                    ExperimentModel.status.in_(ACTIVE_STATUSES), ExperimentModel.deleted_at.is_(None)
+                )
+            ).all()
+        run_ids = sorted({run_id for _, run_id in active})
+        samples = self.source.sample(run_ids) if run_ids else {}
+        sampled_at = datetime.now(timezone.utc)
+
+        sampled = 0
+        with self._lock:
+            for experiment_id, run_id in active:
+                sample = samples.get(run_id)
+                if sample is None:
+                    continue
+                ring = self._rings.setdefault(experiment_id, deque(maxlen=self.ring_size))
+                ring.append({"experiment_id": experiment_id, "sampled_at": sampled_at, **asdict(sample)})
+                sampled += 1
+            # 끝난 experiment 의 빈 buffer 는 정리한다.
+            active_ids = {experiment_id for experiment_id, _ in active}
+            for experiment_id in [key for key, ring in self._rings.items() if not ring and key not in active_ids]:
+                del self._rings[experiment_id]
+        return sampled
+
+    def flush(self) -> int:
+        """Write the buffered samples. Returns the number of rows written."""
+        with self._lock:
+            pending = {experiment_id: list(ring) for experiment_id, ring in self._rings.items() if ring}
+            for experiment_id in pending:
+                self._rings[experiment_id].clear()
+        rows = [row for ring_rows in pending.values() for row in ring_rows]
+        if not rows:
+            return 0
+
+        try:
+            with self._session_factory() as session, session.begin():
+                session.execute(insert(ResourceUsage), rows)
+        except Exception:
+            logger.exception(f"Failed to write {len(rows)} resource usage samples")
+            with self._lock:
+                # 실패한 sample 을 그 사이 쌓인 sample 앞에 되돌린다 (ring 크기를 넘는 오래된 것은 버린다).
+                for experiment_id, ring_rows in pending.items():
+                    ring = self._rings.get(experiment_id) or ()
+                    self._rings[experiment_id] = deque([*ring_rows, *ring], maxlen=self.ring_size)
+            return 0
+        return len(rows)
+
+    def _is_full(self) -> bool:
+        with self._lock:
+            return any(len(ring) >= self.ring_size for ring in self._rings.values())
+
+    def _run(self):
+        flush_at = time.monotonic() + self.flush_interval
+        while not self._stopping.wait(self.sample_interval):
+            try:
+                self.sample()
+            except Exception:
+                logger.exception("Failed to sample resource usage")
+            if self._is_full() or time.monotonic() >= flush_at:
+                self.flush()
+                flush_at = time.monotonic() + self.flush_interval
+        self.flush()
+
+
+@lru_cache
+def get_resource_usage_sampler() -> ResourceUsageSampler:
+    settings = get_settings()
+    if settings.RESOURCE_SAMPLER_SOURCE == "fake":
+        source = FakeResourceUsageSource()
+    else:
+        source = KubernetesMetricsSource(
+            custom_objects_api_factory=get_custom_objects_api, namespace=settings.KUBEFLOW_NAMESPACE
+        )
+    return ResourceUsageSampler(
+        source=source,
+        session_factory=SessionLocal,
+        sample_interval=settings.RESOURCE_SAMPLE_INTERVAL,
+        flush_interval=settings.RESOURCE_FLUSH_INTERVAL,
+        ring_size=settings.RESOURCE_RING_SIZE,
+    )
@@ -0,0 +1,236 @@
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import astuple, dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable
+
+from config.settings import get_settings
+from core.kubeflow_client_pool import get_kubeflow_client_pool
+from core.kubeflow_manager import KubeflowManager
+from core.run_watcher import TERMINAL_RUN_STATES
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+from schemas.pipeline import RunLogChunkSchema
+from utils.kubernetes_client import get_core_v1_api
+
+logger = logging.getLogger(__name__)
+
+# timestamps=true 로 읽은 log 의 줄 앞에 붙는 RFC3339 시각
+LOG_TIMESTAMP = re.compile(rb"(\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d)(?:\.\d+)?(Z|[+-]\d\d:\d\d)")
+
+
+@dataclass(frozen=True)
+class RunPod:
+    pod_name: str
+    display_name: str | None
+    finished: bool
+
+
+@dataclass
+class PodLogPosition:
+    """Where to resume reading a pod log.
+
+    The pod log API has no byte offset, so a read restarts at ``since`` (the second of the last
+    returned line, the finest ``sinceTime`` the API accepts) and skips the ``skip`` bytes of that
+    response that were already returned.
+    """
+
+    offset: int = 0  # 지금까지 반환한 log 의 bytes (timestamp 제외)
+    since: int | None = None  # 마지막으로 반환한 줄의 시각 (epoch seconds)
+    skip: int = 0  # since 부터 읽은 log (timestamp 포함) 중 이미 반환한 bytes
+    in_line: bool = False  # 마지막 줄이 page 크기 제한으로 중간에서 끊겼음
+
+    @classmethod
+    def from_cursor(cls, value: Any) -> "PodLogPosition":
+        if not isinstance(value, list) or len(value) != 4:
+            raise ValueError(f"Invalid pod log position: {value}")
+        return cls(*value)
+
+    def to_cursor(self) -> list:
+        return list(astuple(self))
+
+
+@dataclass
+class _CachedRunPods:
+    pods: list[RunPod]
+    run_finished: bool
+    fetched_at: float
+
+
+class RunLogStreamer:
+    """Incremental reader of the pod logs of a KFP run.
+
+    Callers keep a per-pod position (``{pod_name: PodLogPosition}``) and only receive the bytes
+    written after it, at most ``max_page_bytes`` per read across all pods: each pod log is requested
+    from the second of the last returned line with ``limitBytes``, so neither the log before it nor
+    the rest of a large log is transferred. Pods that are still running are read up to their last
+    complete line, so a chunk never ends in the middle of a line (or of a multi-byte character),
+    unless a single line is longer than a page.
+
+    The run's task list (pod names) is parsed once and reused between polls: for ``task_cache_ttl``
+    seconds while the run is active, and until evicted from the LRU once it has finished.
+    """
+
+    def __init__(
+        self,
+        manager_factory: Callable[[], KubeflowManager],
+        core_v1_api_factory: Callable[[], client.CoreV1Api],
+        namespace: str,
+        container: str,
+        task_cache_ttl: float,
+        max_page_bytes: int,
+        max_cached_runs: int = 256,
+    ):
+        self._manager_factory = manager_factory
+        self._core_v1_api_factory = core_v1_api_factory
+        self.namespace = namespace
+        self.container = container
+        self.task_cache_ttl = task_cache_ttl
+        self.max_page_bytes = max_page_bytes
+        self.max_cached_runs = max_cached_runs
+        self._runs: OrderedDict[str, _CachedRunPods] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def read(
+        self, run_id: str, positions: dict[str, PodLogPosition], pod_names: set[str] | None = None
+    ) -> tuple[list[RunLogChunkSchema], dict[str, PodLogPosition], bool]:
+        """Read the log bytes written after ``positions``.
+
+        Returns:
+            (chunks, new positions, finished) where ``finished`` means the run has ended and every
+            pod log was read to its end.
+        """
+        cached = self._get_run_pods(run_id)
+        positions = dict(positions)
+        chunks = []
+        budget = self.max_page_bytes
+        for pod in cached.pods:
+            if budget <= 0:
+                break
+            if pod_names is not None and pod.pod_name not in pod_names:
+                continue
+            position = positions.get(pod.pod_name, PodLogPosition())
+            limit = position.skip + budget
+            content = self._read_pod_log(pod.pod_name, position.since, limit)
+            if content is None or len(content) <= position.skip:
+                continue
+            truncated = len(content) >= limit
+            raw = content[position.skip :]
+            if truncated or not pod.finished:
+                end = raw.rfind(b"\n") + 1
+                # page 보다 긴 줄은 page 크기에서 자른다.
+                raw = raw[: end or (len(raw) if truncated else 0)]
+            if not raw:
+                continue
+            data, new_position = advance_position(position, raw)
+            chunks.append(
+                RunLogChunkSchema(
+                    pod_name=pod.pod_name,
+                    display_name=pod.display_name,
+                    offset=position.offset,
+                    data=data.decode("utf-8", errors="replace"),
+                )
+            )
+            positions[pod.pod_name] = new_position
+            budget -= len(raw)
+        return chunks, positions, cached.run_finished and not chunks
+
+    def _get_run_pods(self, run_id: str) -> _CachedRunPods:
+        now = time.monotonic()
+        with self._lock:
+            cached = self._runs.get(run_id)
+            if cached is not None and (cached.run_finished or now - cached.fetched_at < self.task_cache_ttl):
+                self._runs.move_to_end(run_id)
+                return cached
+
+        run = self._manager_factory().get_run(run_id)
+        run_finished = run.state in TERMINAL_RUN_STATES
+        pods: dict[str, RunPod] = {}
+        for task in (run.run_details.task_details if run.run_details else None) or []:
+            task_finished = run_finished or task.state in TERMINAL_RUN_STATES
+            pod_names = [task.pod_name] + [child.pod_name for child in task.child_tasks or []]
+            for pod_name in pod_names:
+                if pod_name and pod_name not in pods:
+                    pods[pod_name] = RunPod(pod_name=pod_name, display_name=task.display_name, finished=task_finished)
+
+        cached = _CachedRunPods(pods=list(pods.values()), run_finished=run_finished, fetched_at=now)
+        with self._lock:
+            self._runs[run_id] = cached
+            self._runs.move_to_end(run_id)
+            while len(self._runs) > self.max_cached_runs:
+                self._runs.popitem(last=False)
+        return cached
+
+    def _read_pod_log(self, pod_name: str, since: int | None, limit_bytes: int) -> bytes | None:
+        """since 초부터 최대 limit_bytes 의 log 를 timestamp 를 붙여 읽는다."""
+        query_params = [("container", self.container), ("timestamps", "true"), ("limitBytes", limit_bytes)]
+        if since is not None:
+            since_time = datetime.fromtimestamp(since, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+            query_params.append(("sinceTime", since_time))
+        try:
+            # python client 의 read_namespaced_pod_log 는 sinceTime 을 지원하지 않아 API 를 직접 호출한다.
+            response = self._core_v1_api_factory().api_client.call_api(
+                "/api/v1/namespaces/{namespace}/pods/{name}/log",
+                "GET",
+                path_params={"namespace": self.namespace, "name": pod_name},
+                query_params=query_params,
+                header_params={"Accept": "text/plain"},
+                auth_settings=["BearerToken"],
+                _return_http_data_only=True,
+                _preload_content=False,
+            )
+            return response.data
+        except ApiException as e:
+            # 아직 시작 전이거나 정리된 pod 는 건너뛴다.
+            if e.status in (400, 404):
+                return None
+            raise
+
+
+def advance_position(position: PodLogPosition, raw: bytes) -> tuple[bytes, PodLogPosition]:
+    """position 다음에 읽은 raw (timestamp 포함) 에서 timestamp 를 떼고, raw 다음의 position 을 계산한다."""
+    data = bytearray()
+    since, skip, in_line = position.since, position.skip, position.in_line
+    for line in re.split(rb"(?<=\n)", raw):
+        if not line:
+            continue
+        content = line
+        if not in_line:
+            match = LOG_TIMESTAMP.match(line)
+            if match is not None:
+                content = line[match.end() + 1 :]
+                second = int(
+                    datetime.fromisoformat((match[1] + match[2].replace(b"Z", b"+00:00")).decode()).timestamp()
+                )
+                if second != since:
+                    since, skip = second, 0
+        skip += len(line)
+        data += content
+        in_line = not line.endswith(b"\n")
+    return bytes(data), PodLogPosition(offset=position.offset + len(data), since=since, skip=skip, in_line=in_line)
+
+
+@lru_cache
+def get_run_log_streamer(namespace: str) -> RunLogStreamer:
+    settings = get_settings()
+
+    def manager_factory() -> KubeflowManager:
+        return get_kubeflow_client_pool().get(
+            endpoint=settings.KUBEFLOW_ENDPOINT,
+            username=settings.KUBEFLOW_USERNAME,
+            password=settings.KUBEFLOW_PASSWORD,
+            namespace=namespace,
+        )
+
+    return RunLogStreamer(
+        manager_factory=manager_factory,
+        core_v1_api_factory=get_core_v1_api,
+        namespace=namespace,
+        container=settings.RUN_LOG_CONTAINER,
+        task_cache_ttl=settings.RUN_LOG_TASK_CACHE_TTL,
+        max_page_bytes=settings.RUN_LOG_PAGE_MAX_BYTES,
+    )
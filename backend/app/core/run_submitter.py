@@ -0,0 +1,119 @@
+import logging
+import queue
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable
+
+from config.settings import get_settings
+from schemas.pipeline import SubmissionState
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Submission:
+    submission_id: str
+    state: SubmissionState = SubmissionState.QUEUED
+    run_id: str | None = None
+    error: str | None = None
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+
+
+class SubmissionQueueFullError(Exception):
+    pass
+
+
+class RunSubmitter:
+    """Bounded queue of KFP run submissions drained by a fixed pool of worker threads.
+
+    A job is a callable that performs the auth/compile/create-run sequence and returns the
+    KFP run ID. ``submit`` only enqueues it, so API latency does not depend on the cluster;
+    the outcome is tracked on the returned ``Submission``.
+
+    Args:
+        concurrency (int): Number of worker threads, i.e. submissions in flight at once.
+        max_queue_size (int): Jobs waiting beyond this raise ``SubmissionQueueFullError``.
+        max_retained (int): Number of submissions kept for status lookups (oldest dropped first).
+    """
+
+    def __init__(self, concurrency: int, max_queue_size: int, max_retained: int = 10000):
+        self.concurrency = concurrency
+        self.max_retained = max_retained
+        self._queue: queue.Queue[tuple[Submission, Callable[[], str]] | None] = queue.Queue(maxsize=max_queue_size)
+        self._submissions: OrderedDict[str, Submission] = OrderedDict()
+        self._lock = threading.Lock()
+        self._workers: list[threading.Thread] = []
+
+    def start(self):
+        if self._workers:
+            return
+        for i in range(self.concurrency):
+            worker = threading.Thread(target=self._work, name=f"run-submitter-{i}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def stop(self, timeout: float | None = None):
+        """Let the workers finish the jobs already queued, then stop them."""
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join(timeout)
+        self._workers = []
+
+    def submit(self, job: Callable[[], str]) -> Submission:
+        return self.submit_all([job])[0]
+
+    def submit_all(self, jobs: list[Callable[[], str]]) -> list[Submission]:
+        """Enqueue every job, or none of them if they do not all fit in the queue."""
+        submissions = [Submission(submission_id=uuid.uuid4().hex) for _ in jobs]
+        with self._lock:
+            # worker 는 queue 에서 꺼내기만 하므로 lock 안에서 확인한 빈 자리는 줄어들지 않는다.
+            if self._queue.maxsize > 0 and len(jobs) > self._queue.maxsize - self._queue.qsize():
+                raise SubmissionQueueFullError(f"Run submission queue is full ({self._queue.maxsize})")
+            for submission, job in zip(submissions, jobs):
+                self._submissions[submission.submission_id] = submission
+                self._queue.put_nowait((submission, job))
+            while len(self._submissions) > self.max_retained:
+                self._submissions.popitem(last=False)
+        return submissions
+
+    def get(self, submission_id: str) -> Submission | None:
+        return self._submissions.get(submission_id)
+
+    def _update(self, submission: Submission, **changes):
+        with self._lock:
+            for key, value in changes.items():
+                setattr(submission, key, value)
+            submission.updated_at = datetime.now()
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            submission, job = item
+            self._update(submission, state=SubmissionState.SUBMITTING)
+            try:
+                run_id = job()
+            except Exception as e:
+                logger.exception(f"Run submission {submission.submission_id} failed")
+                self._update(submission, state=SubmissionState.FAILED, error=str(e))
+            else:
+                self._update(submission, state=SubmissionState.SUBMITTED, run_id=run_id)
+            finally:
+                self._queue.task_done()
+
+
+@lru_cache
+def get_run_submitter() -> RunSubmitter:
+    settings = get_settings()
+    return RunSubmitter(
+        concurrency=settings.RUN_SUBMIT_CONCURRENCY,
+        max_queue_size=settings.RUN_SUBMIT_QUEUE_SIZE,
+    )
@@ -0,0 +1,165 @@
+import logging
+import threading
+import time
+from functools import lru_cache
+from typing import Callable
+
+from config.settings import get_settings
+from core.kubeflow_client_pool import get_kubeflow_client_pool
+from core.kubeflow_manager import KubeflowManager
+from schemas.pipeline import RunStatusSchema
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_RUN_STATES = frozenset({"SUCCEEDED", "SKIPPED", "FAILED", "CANCELED"})
+
+RunStatusListener = Callable[[list[RunStatusSchema]], None]
+
+
+class RunStatusWatcher:
+    """Single background poll loop over the runs of one namespace.
+
+    The loop walks ``list_runs`` page by page (newest first), diffs the states against the previous
+    poll and calls every subscribed listener with the runs that changed, so any number of dashboards
+    cost one upstream poll loop. Runs that had already finished do not change any more, so a poll
+    stops paging once it reaches finished runs older than every active run and keeps their previous
+    status. The interval starts at ``min_interval`` and doubles (up to ``max_interval``) while
+    nothing changes; a new subscriber, or a snapshot of a cache older than ``min_interval``, polls
+    right away. The loop runs while there are subscribers or somebody read a snapshot within
+    ``idle_timeout`` seconds, and stops by itself otherwise.
+
+    Listeners are called from the watcher thread and must not block.
+    """
+
+    def __init__(
+        self,
+        manager_factory: Callable[[], KubeflowManager],
+        min_interval: float,
+        max_interval: float,
+        idle_timeout: float,
+        page_size: int = 100,
+    ):
+        self._manager_factory = manager_factory
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.idle_timeout = idle_timeout
+        self.page_size = page_size
+        self._statuses: dict[str, RunStatusSchema] = {}
+        self._listeners: set[RunStatusListener] = set()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._last_access = time.monotonic()
+        self._last_poll = 0.0
+        self._synced = threading.Event()
+
+    def subscribe(self, listener: RunStatusListener) -> RunStatusListener:
+        with self._lock:
+            self._listeners.add(listener)
+        # 새 구독자가 생기면 backoff 중이더라도 바로 poll 한다.
+        self._touch(wakeup=True)
+        return listener
+
+    def unsubscribe(self, listener: RunStatusListener):
+        with self._lock:
+            self._listeners.discard(listener)
+
+    def snapshot(self, run_ids: set[str] | None = None, wait: float = 0) -> list[RunStatusSchema]:
+        """Latest known status of the given runs (all runs if ``run_ids`` is None).
+
+        ``wait`` bounds how long to wait for the first poll when the watcher was not running yet.
+        """
+        # 다른 요청이 최근에 poll 한 결과가 있으면 그대로 사용한다.
+        self._touch(wakeup=time.monotonic() - self._last_poll > self.min_interval)
+        if wait:
+            self._synced.wait(wait)
+        with self._lock:
+            if run_ids is None:
+                return list(self._statuses.values())
+            return [self._statuses[run_id] for run_id in run_ids if run_id in self._statuses]
+
+    def _touch(self, wakeup: bool):
+        with self._lock:
+            self._last_access = time.monotonic()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="run-status-watcher", daemon=True)
+                self._thread.start()
+                return
+        if wakeup:
+            self._wakeup.set()
+
+    def _run(self):
+        interval = self.min_interval
+        while True:
+            with self._lock:
+                if not self._listeners and time.monotonic() - self._last_access > self.idle_timeout:
+                    self._thread = None
+                    self._statuses = {}
+                    self._synced.clear()
+                    break
+            self._wakeup.clear()
+            try:
+                changed = self._poll()
+            except Exception as e:
+                logger.warning(f"Failed to poll run statuses: {e}")
+                changed = []
+            interval = self.min_interval if changed else min(interval * 2, self.max_interval)
+            self._wakeup.wait(interval)
+        logger.info("Run status watcher stopped (idle)")
+
+    def _poll(self) -> list[RunStatusSchema]:
+        manager = self._manager_factory()
+        with self._lock:
+            previous = self._statuses
+        # 진행 중인 run 중 가장 오래된 것보다 먼저 만들어져 이미 종료된 run 은 다시 받지 않는다.
+        active = [status.created_at for status in previous.values() if status.state not in TERMINAL_RUN_STATES]
+        active_since = min(active) if active and None not in active else None
+        statuses = {}
+        for run in manager.iter_runs(page_size=self.page_size, sort_by="created_at desc"):
+            status = statuses[run.run_id] = RunStatusSchema.model_validate(run)
+            known = previous.get(run.run_id)
+            if known is None or known.state not in TERMINAL_RUN_STATES or None in active:
+                continue
+            if active_since is None or (status.created_at is not None and status.created_at < active_since):
+                break
+        else:
+            previous = {}
+        for run_id, status in previous.items():
+            if run_id not in statuses and status.state in TERMINAL_RUN_STATES:
+                statuses[run_id] = status
+        self._last_poll = time.monotonic()
+
+        with self._lock:
+            changed = [status for run_id, status in statuses.items() if self._statuses.get(run_id) != status]
+            self._statuses = statuses
+            listeners = list(self._listeners)
+        self._synced.set()
+
+        if changed:
+            for listener in listeners:
+                try:
+                    listener(changed)
+                except Exception:
+                    logger.exception("Run status listener failed")
+        return changed
+
+
+@lru_cache
+def get_run_status_watcher(namespace: str) -> RunStatusWatcher:
+    """namespace 당 하나의 watcher (client pool 에서 해당 namespace 의 manager 를 사용)"""
+    settings = get_settings()
+
+    def manager_factory() -> KubeflowManager:
+        return get_kubeflow_client_pool().get(
+            endpoint=settings.KUBEFLOW_ENDPOINT,
+            username=settings.KUBEFLOW_USERNAME,
+            password=settings.KUBEFLOW_PASSWORD,
+            namespace=namespace,
+        )
+
+    return RunStatusWatcher(
+        manager_factory=manager_factory,
+        min_interval=settings.RUN_WATCHER_MIN_INTERVAL,
+        max_interval=settings.RUN_WATCHER_MAX_INTERVAL,
+        idle_timeout=settings.RUN_WATCHER_IDLE_TIMEOUT,
+    )
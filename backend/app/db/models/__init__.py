@@ -1,7 +1,7 @@
 from .base import Base
-from .dataset import Dataset
+from .dataset import Dataset, DatasetUpload
 from .experiment import (
-    ExperimentLog,
+    ExperimentLogChunk,
     ExperimentModel,
     HyperparameterType,
     Hyperparamter,
@@ -10,3 +10,5 @@ from .experiment import (
     ResourceUsage,
 )
 from .model import Model, ModelFormat, ModelProvider, ModelRegistry, ModelType
+from .pipeline import PipelineCacheInvalidation
+from .reference import ReferenceVersion
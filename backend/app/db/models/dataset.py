@@ -15,3 +15,20 @@ class Dataset(BaseModel, TimestampMixin):
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     url: Mapped[str] = mapped_column(String(1000), nullable=False)
     description: Mapped[str] = mapped_column(String(500), nullable=True)
+    sha256: Mapped[str | None] = mapped_column(String(64), index=True)  # 내용의 sha256 (같으면 같은 dataset)
+    size: Mapped[int | None] = mapped_column(BigInteger)  # bytes
+
+
+class DatasetUpload(BaseModel, TimestampCreateMixin, TimestampUpdateMixin):
+    __tablename__ = "dataset_upload"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    description: Mapped[str] = mapped_column(String(500), nullable=True)
+    file_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    size: Mapped[int | None] = mapped_column(BigInteger)  # client 가 알려준 전체 크기 (bytes)
+    sha256: Mapped[str | None] = mapped_column(String(64))  # client 가 알려준 sha256 (완료 시 검증)
+    status: Mapped[str] = mapped_column(String(2), nullable=False)
+    dataset_id: Mapped[int | None] = mapped_column(ForeignKey("dataset.id"))
+
+    dataset: Mapped["Dataset"] = relationship("Dataset")
@@ -1,4 +1,6 @@
+import math
 from datetime import datetime
+from typing import Any
 
 from db.models.base import BaseModel, TimestampMixin
 from db.models.dataset import Dataset
@@ -7,11 +9,14 @@ from sqlalchemy import (
     TIMESTAMP,
     BigInteger,
     Boolean,
+    Double,
     Float,
     ForeignKey,
+    Index,
     Integer,
+    LargeBinary,
     String,
-    Text,
+    UniqueConstraint,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -37,12 +42,17 @@ class ImageRegistry(BaseModel, TimestampMixin):
 
 class ExperimentModel(BaseModel, TimestampMixin):
     __tablename__ = "experiment"
+    __table_args__ = (
+        # 목록 조회의 keyset pagination (created_at, id) 순서
+        Index("ix_experiment_created_at_id", "created_at", "id"),
+        Index("ix_experiment_status_created_at_id", "status", "created_at", "id"),
+    )
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(300), nullable=False)
-    model_id: Mapped[int] = mapped_column(ForeignKey("model.id"))
+    model_id: Mapped[int] = mapped_column(ForeignKey("model.id"), index=True)
     dataset_id: Mapped[int] = mapped_column(ForeignKey("dataset.id"))
     image_registry_id: Mapped[int] = mapped_column(ForeignKey("image_registry.id"))
-    run_id: Mapped[str] = mapped_column(String(100), nullable=False)
+    run_id: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
     start_time: Mapped[datetime | None] = mapped_column(TIMESTAMP)
     end_time: Mapped[datetime | None] = mapped_column(TIMESTAMP)
     status: Mapped[str] = mapped_column(String(2), nullable=False)
@@ -53,7 +63,9 @@ class ExperimentModel(BaseModel, TimestampMixin):
 
     # TODO: backpopulate를 설정하지않아도 cascade 삭제되는지 확인 필요.
     hyper_param: Mapped[list["Hyperparamter"]] = relationship("Hyperparamter", cascade="all, delete-orphan")
-    experiment_log: Mapped[list["ExperimentLog"]] = relationship("ExperimentLog", cascade="all, delete-orphan")
+    experiment_log_chunk: Mapped[list["ExperimentLogChunk"]] = relationship(
+        "ExperimentLogChunk", cascade="all, delete-orphan"
+    )
     metric: Mapped[list["Metric"]] = relationship("Metric", cascade="all, delete-orphan")
     resource_usage: Mapped[list["ResourceUsage"]] = relationship("ResourceUsage", cascade="all, delete-orphan")
 
@@ -67,34 +79,88 @@ class HyperparameterType(BaseModel, TimestampMixin):
 
 class Hyperparamter(BaseModel, TimestampMixin):
     __tablename__ = "hyperparameter"
+    __table_args__ = (
+        # 범위/값 검색 결과의 experiment_id 까지 index 에서 읽는다.
+        Index("ix_hyperparameter_param_type_id_numeric_value", "param_type_id", "numeric_value", "experiment_id"),
+        Index(
+            "ix_hyperparameter_param_type_id_categorical_value", "param_type_id", "categorical_value", "experiment_id"
+        ),
+    )
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
-    experiment_id: Mapped[int] = mapped_column(ForeignKey("experiment.id"))
+    experiment_id: Mapped[int] = mapped_column(ForeignKey("experiment.id"), index=True)
     param_type_id: Mapped[int] = mapped_column(ForeignKey("hyperparameter_type.id"))
     param_value: Mapped[str] = mapped_column(String(1000), nullable=False)
+    numeric_value: Mapped[float | None] = mapped_column(Double)  # 숫자로 해석되는 값
+    categorical_value: Mapped[str | None] = mapped_column(String(255))  # 그 외의 값 (bool 포함)
 
     param_type: Mapped["HyperparameterType"] = relationship("HyperparameterType")
 
-
-class ExperimentLog(BaseModel, TimestampMixin):
-    __tablename__ = "experiment_log"
+    def assign_value(self, value: Any):
+        """param_value 와 검색용 typed column 을 함께 채운다."""
+        self.param_value = str(value)
+        self.numeric_value, self.categorical_value = split_hyperparameter_value(value)
+
+
+def split_hyperparameter_value(value: Any) -> tuple[float | None, str | None]:
+    """hyperparameter 값을 (numeric_value, categorical_value) 로 나눈다."""
+    if isinstance(value, bool):
+        return None, str(value)
+    if isinstance(value, (int, float)) and math.isfinite(value):
+        return float(value), None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None, str(value)[:255]
+    if math.isfinite(number):
+        return number, None
+    return None, str(value)[:255]
+
+
+class ExperimentLogChunk(BaseModel, TimestampMixin):
+    """experiment log 를 순서대로 나눈 zlib 압축 chunk.
+
+    offset 은 압축 전 기준이며 chunk 경계가 줄 중간일 수 있다.
+    """
+
+    __tablename__ = "experiment_log_chunk"
+    __table_args__ = (
+        UniqueConstraint("experiment_id", "seq", name="uq_experiment_log_chunk_experiment_id_seq"),
+        # byte/line 위치로 시작 chunk 를 찾는다.
+        Index("ix_experiment_log_chunk_experiment_id_byte_offset", "experiment_id", "byte_offset"),
+        Index("ix_experiment_log_chunk_experiment_id_line_offset", "experiment_id", "line_offset", "seq"),
+    )
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     experiment_id: Mapped[int] = mapped_column(ForeignKey("experiment.id"))
-    content: Mapped[str] = mapped_column(Text, nullable=False)
+    seq: Mapped[int] = mapped_column(BigInteger, nullable=False)  # experiment 별 0 부터
+    byte_offset: Mapped[int] = mapped_column(BigInteger, nullable=False)  # chunk 앞까지의 byte 수
+    line_offset: Mapped[int] = mapped_column(BigInteger, nullable=False)  # chunk 앞까지의 줄바꿈 수
+    byte_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    line_count: Mapped[int] = mapped_column(Integer, nullable=False)  # chunk 안의 줄바꿈 수
+    content: Mapped[bytes] = mapped_column(LargeBinary(length=16777215), nullable=False, deferred=True)
 
 
 class Metric(BaseModel, TimestampMixin):
     __tablename__ = "metric"
+    __table_args__ = (
+        Index("ix_metric_experiment_id_metric_name_step", "experiment_id", "metric_name", "step"),
+        # experiment 별 MIN/MAX(metric_value) 를 index 만으로 구한다 (leaderboard)
+        Index("ix_metric_experiment_id_metric_name_value", "experiment_id", "metric_name", "metric_value"),
+    )
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     experiment_id: Mapped[int] = mapped_column(ForeignKey("experiment.id"))
     metric_name: Mapped[str] = mapped_column(String(100), nullable=False)
     metric_value: Mapped[str] = mapped_column(Float, nullable=False)
+    step: Mapped[int | None] = mapped_column(BigInteger)
+    logged_at: Mapped[datetime | None] = mapped_column(TIMESTAMP)
 
 
 class ResourceUsage(BaseModel, TimestampMixin):
     __tablename__ = "resource_usage"
+    __table_args__ = (Index("ix_resource_usage_experiment_id_sampled_at", "experiment_id", "sampled_at"),)
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     experiment_id: Mapped[int] = mapped_column(ForeignKey("experiment.id"))
     cpu_usage: Mapped[str] = mapped_column(Float, nullable=False)
     memory_usage: Mapped[str] = mapped_column(Float, nullable=False)
     gpu_usage: Mapped[str] = mapped_column(Float, nullable=False)
     gpu_memory_usage: Mapped[str] = mapped_column(Float, nullable=False)
+    sampled_at: Mapped[datetime | None] = mapped_column(TIMESTAMP)  # sampler 가 사용량을 수집한 시각
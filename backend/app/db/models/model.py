@@ -32,6 +32,7 @@ class ModelRegistry(BaseModel, TimestampCreateMixin, TimestampUpdateMixin):
     version: Mapped[int] = mapped_column(Integer, nullable=False)
     artifact_path: Mapped[str] = mapped_column(String(1024), nullable=False)
     model_uri: Mapped[str] = mapped_column(String(1024), nullable=False)
+    artifact_sha256: Mapped[str | None] = mapped_column(String(64))  # artifact cache key (처음 받을 때 기록)
     model_id: Mapped[int] = mapped_column(ForeignKey("model.id", ondelete="CASCADE"))
 
     model: Mapped["Model"] = relationship("Model", back_populates="model_registry", passive_deletes=True)
@@ -0,0 +1,16 @@
+from db.models.base import BaseModel, TimestampCreateMixin
+from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class PipelineCacheInvalidation(BaseModel, TimestampCreateMixin):
+    """KFP step cache 무효화 기록. 이후 같은 dataset/model version 으로 제출한 run 은 cache 를 다시 만든다."""
+
+    __tablename__ = "pipeline_cache_invalidation"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    dataset_id: Mapped[int | None] = mapped_column(ForeignKey("dataset.id", ondelete="CASCADE"), index=True)
+    model_registry_id: Mapped[int | None] = mapped_column(
+        ForeignKey("model_registry.id", ondelete="CASCADE"), index=True
+    )
+    reason: Mapped[str | None] = mapped_column(String(500))
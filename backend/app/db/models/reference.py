@@ -0,0 +1,15 @@
+from datetime import datetime
+
+from db.models.base import BaseModel
+from sqlalchemy import TIMESTAMP, BigInteger, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class ReferenceVersion(BaseModel):
+    """reference table 별 변경 번호. 쓰기마다 증가시켜 여러 worker 의 cache 를 갱신한다."""
+
+    __tablename__ = "reference_version"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at: Mapped[datetime | None] = mapped_column(TIMESTAMP, onupdate=func.now(), default=func.now())
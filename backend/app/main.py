@@ -1,8 +1,43 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+from config.settings import get_settings
+from core.experiment_sync import get_experiment_run_sync
+from core.metric_writer import get_metric_write_buffer
+from core.model_residency import get_model_residency_manager
+from core.pipeline_registry import get_pipeline_registry
+from core.resource_sampler import get_resource_usage_sampler
+from core.run_submitter import get_run_submitter
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from routers import api_router
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # pipeline 은 시작할 때 한 번 compile 해 두고 요청에서는 이름으로 찾기만 한다.
+    await asyncio.to_thread(get_pipeline_registry().compile_all)
+    run_submitter = get_run_submitter()
+    run_submitter.start()
+    experiment_run_sync = get_experiment_run_sync()
+    if get_settings().EXPERIMENT_SYNC_ENABLED:
+        experiment_run_sync.start()
+    metric_write_buffer = get_metric_write_buffer()
+    await metric_write_buffer.start()
+    resource_usage_sampler = get_resource_usage_sampler()
+    if get_settings().RESOURCE_SAMPLER_ENABLED:
+        resource_usage_sampler.start()
+    model_residency_manager = get_model_residency_manager()
+    await model_residency_manager.preload()
+    yield
+    await model_residency_manager.stop()
+    resource_usage_sampler.stop(timeout=30)
+    await metric_write_buffer.stop()
+    experiment_run_sync.stop(timeout=30)
+    run_submitter.stop(timeout=30)
+
+
+app = FastAPI(lifespan=lifespan)
 
 # CORS 설정
 origins = [
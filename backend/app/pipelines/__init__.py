@@ -0,0 +1,14 @@
+from typing import TYPE_CHECKING
+
+from pipelines import sample
+
+if TYPE_CHECKING:
+    from core.pipeline_registry import PipelineRegistry
+
+# pipeline 정의 module 을 추가하면 여기에 등록한다.
+MODULES = [sample]
+
+
+def register_all(registry: "PipelineRegistry"):
+    for module in MODULES:
+        module.register(registry)
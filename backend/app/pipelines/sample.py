@@ -0,0 +1,29 @@
+from typing import TYPE_CHECKING
+
+from kfp import dsl
+
+if TYPE_CHECKING:
+    from core.pipeline_registry import PipelineRegistry
+
+
+@dsl.container_component
+def say_hello(name: str):
+    return dsl.ContainerSpec(image="alpine", command=["echo"], args=[f"Hello, {name}!"])
+
+
+@dsl.component
+def say_bye(name: str) -> str:
+    return f"Bye, {name}!!"
+
+
+@dsl.pipeline
+def sample_pipeline(name: str = "World") -> str:
+    # say_hello(name=name)
+    bye_task = say_bye(name=name)
+    return bye_task.output
+
+
+def register(registry: "PipelineRegistry"):
+    registry.add_component("say-hello", say_hello)
+    registry.add_component("say-bye", say_bye)
+    registry.add_pipeline("sample-pipeline", sample_pipeline, description="say_bye 로 인사말을 만드는 sample pipeline")
@@ -1,6 +1,18 @@
 from fastapi import APIRouter
 
+from .dataset import router as dataset_router
+from .experiment import router as experiment_router
+from .inference import router as inference_router
+from .katib import router as katib_router
+from .model import router as model_router
 from .pipeline import router as pipeline_router
+from .reference import router as reference_router
 
 api_router = APIRouter(prefix="/api/v1")
 api_router.include_router(pipeline_router)
+api_router.include_router(experiment_router)
+api_router.include_router(katib_router)
+api_router.include_router(reference_router)
+api_router.include_router(model_router)
+api_router.include_router(inference_router)
+api_router.include_router(dataset_router)
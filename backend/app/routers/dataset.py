@@ -0,0 +1,136 @@
+import logging
+
+from config.db.connect import AsyncSessionDepends
+from core.artifact_cache import ArtifactIntegrityError
+from core.dataset_store import (
+    DatasetUploadOffsetError,
+    complete_upload,
+    fetch_dataset,
+    get_dataset_upload_area,
+)
+from db.models import Dataset, DatasetUpload
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from schemas.dataset import (
+    SHA256_PATTERN,
+    DatasetCreateSchema,
+    DatasetSchema,
+    DatasetUploadCreateSchema,
+    DatasetUploadSchema,
+    DatasetUploadStatus,
+)
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+router = APIRouter(prefix="/dataset", tags=["Dataset"])
+
+logger = logging.getLogger(__name__)
+
+
+def to_upload_schema(upload: DatasetUpload) -> DatasetUploadSchema:
+    item = DatasetUploadSchema.model_validate(upload)
+    item.offset = get_dataset_upload_area().offset(upload.id)
+    return item
+
+
+async def get_upload(db: AsyncSession, upload_id: int, uploading: bool = False) -> DatasetUpload:
+    upload = await db.get(DatasetUpload, upload_id)
+    if upload is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Dataset upload {upload_id} not found")
+    if uploading and upload.status != DatasetUploadStatus.UPLOADING.value:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Dataset upload {upload_id} is {DatasetUploadStatus(upload.status).name}",
+        )
+    return upload
+
+
+@router.get("", response_model=list[DatasetSchema])
+async def list_datasets(
+    sha256: str | None = Query(default=None, pattern=SHA256_PATTERN), db: AsyncSession = AsyncSessionDepends
+):
+    """dataset 목록. sha256 을 주면 내용이 같은 dataset 만 조회한다."""
+    query = select(Dataset).where(Dataset.deleted_at.is_(None)).order_by(Dataset.id)
+    if sha256 is not None:
+        query = query.where(Dataset.sha256 == sha256)
+    return (await db.scalars(query)).all()
+
+
+@router.get("/{dataset_id}", response_model=DatasetSchema)
+async def get_dataset(dataset_id: int, db: AsyncSession = AsyncSessionDepends):
+    dataset = await db.get(Dataset, dataset_id)
+    if dataset is None or dataset.deleted_at is not None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Dataset {dataset_id} not found")
+    return dataset
+
+
+@router.post("", status_code=status.HTTP_201_CREATED, response_model=DatasetSchema)
+async def register_dataset(request: DatasetCreateSchema, db: AsyncSession = AsyncSessionDepends):
+    """url 의 dataset 을 등록한다. 내용을 한 번 받아 local cache 에 두고 sha256/size 를 기록한다."""
+    dataset = Dataset(name=request.name, url=request.url, description=request.description, sha256=request.sha256)
+    db.add(dataset)
+    try:
+        await fetch_dataset(db, dataset)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except ArtifactIntegrityError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except OSError as e:
+        logger.exception(f"Failed to fetch dataset {request.url}")
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=f"Failed to fetch dataset: {e}")
+    await db.refresh(dataset)
+    return dataset
+
+
+@router.post("/uploads", status_code=status.HTTP_201_CREATED, response_model=DatasetUploadSchema)
+async def create_upload(request: DatasetUploadCreateSchema, db: AsyncSession = AsyncSessionDepends):
+    """이어 올리기가 가능한 dataset upload 를 시작한다.
+
+    PATCH /dataset/uploads/{upload_id}?offset= 로 내용을 나눠 보내고 POST .../complete 로 dataset 을 등록한다.
+    """
+    upload = DatasetUpload(**request.model_dump(), status=DatasetUploadStatus.UPLOADING.value)
+    db.add(upload)
+    await db.commit()
+    return to_upload_schema(upload)
+
+
+@router.get("/uploads/{upload_id}", response_model=DatasetUploadSchema)
+async def get_upload_status(upload_id: int, db: AsyncSession = AsyncSessionDepends):
+    """upload 상태. 연결이 끊겼으면 offset 부터 이어서 보낸다."""
+    return to_upload_schema(await get_upload(db, upload_id))
+
+
+@router.patch("/uploads/{upload_id}", response_model=DatasetUploadSchema)
+async def append_upload(
+    upload_id: int, request: Request, offset: int = Query(ge=0), db: AsyncSession = AsyncSessionDepends
+):
+    """request body 를 offset 위치에 이어 쓴다. offset 이 지금까지 받은 크기와 다르면 409 를 반환한다."""
+    upload = await get_upload(db, upload_id, uploading=True)
+    try:
+        await get_dataset_upload_area().append(db, upload, offset, request.stream())
+    except DatasetUploadOffsetError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e))
+    finally:
+        await db.commit()
+    return to_upload_schema(upload)
+
+
+@router.post("/uploads/{upload_id}/complete", status_code=status.HTTP_201_CREATED, response_model=DatasetSchema)
+async def complete_dataset_upload(upload_id: int, db: AsyncSession = AsyncSessionDepends):
+    """받은 내용을 hash 해서 dataset store 에 저장하고 dataset 을 등록한다."""
+    upload = await get_upload(db, upload_id, uploading=True)
+    try:
+        return await complete_upload(db, upload)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except ArtifactIntegrityError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+
+@router.delete("/uploads/{upload_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def abort_upload(upload_id: int, db: AsyncSession = AsyncSessionDepends):
+    upload = await get_upload(db, upload_id, uploading=True)
+    upload.status = DatasetUploadStatus.ABORTED.value
+    await db.commit()
+    get_dataset_upload_area().discard(upload_id)
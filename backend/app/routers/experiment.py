@@ -0,0 +1,440 @@
+import asyncio
+import logging
+import operator
+from datetime import datetime
+
+import numpy as np
+from config.db.connect import AsyncSessionDepends
+from config.settings import get_settings
+from core.experiment_log_store import get_experiment_log_store
+from core.metric_writer import MetricBufferFullError, get_metric_write_buffer
+from core.reference_cache import get_reference_cache
+from db.models import ExperimentModel, Hyperparamter, Metric, ResourceUsage
+from db.models.experiment import split_hyperparameter_value
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from schemas.experiment import (
+    ExperimentDetailSchema,
+    ExperimentInclude,
+    ExperimentListItemSchema,
+    ExperimentLogInfoSchema,
+    ExperimentPageSchema,
+    ExperimentSchema,
+    ExperimentSearchSchema,
+    ExperimentStatus,
+    HyperparameterFilterSchema,
+    HyperparameterOperator,
+    LeaderboardEntrySchema,
+    RankOrder,
+)
+from schemas.metric import (
+    DownsamplingMethod,
+    MetricBatchSchema,
+    MetricIngestResultSchema,
+    MetricSeriesSchema,
+)
+from schemas.reference import ReferenceName
+from schemas.resource_usage import ResourceName, ResourceUsageSeriesSchema
+from sqlalchemy import ColumnElement, and_, false, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from utils.cursor import decode_cursor, encode_cursor
+from utils.downsampling import lttb, min_max_buckets
+
+router = APIRouter(prefix="/experiment", tags=["Experiment"])
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+RANGE_OPERATORS = {
+    HyperparameterOperator.LT: operator.lt,
+    HyperparameterOperator.LE: operator.le,
+    HyperparameterOperator.GT: operator.gt,
+    HyperparameterOperator.GE: operator.ge,
+}
+
+
+def experiment_load_options(include: set[ExperimentInclude]) -> list:
+    """조회할 relationship 만 eager load 하고 나머지는 접근 시 에러가 나도록 막는다 (N+1 방지)."""
+    options = [
+        # many-to-one 은 같은 query 에서 JOIN 으로
+        joinedload(ExperimentModel.model),
+        joinedload(ExperimentModel.dataset),
+        joinedload(ExperimentModel.image_registry),
+    ]
+    if ExperimentInclude.HYPERPARAMETERS in include:
+        # one-to-many 는 page 단위 IN query 하나로
+        options.append(selectinload(ExperimentModel.hyper_param))
+    options.append(raiseload("*"))
+    return options
+
+
+async def hyperparameter_names(db: AsyncSession) -> dict[int, str]:
+    """hyperparameter_type id -> param_name (reference cache)"""
+    param_types = await get_reference_cache().get_all(db, ReferenceName.HYPERPARAMETER_TYPE)
+    return {param_type_id: param_type.param_name for param_type_id, param_type in param_types.items()}
+
+
+def to_experiment_schema(
+    experiment: ExperimentModel,
+    include: set[ExperimentInclude],
+    schema: type[ExperimentListItemSchema],
+    param_names: dict[int, str],
+) -> ExperimentListItemSchema:
+    item = schema.model_validate(experiment)
+    if ExperimentInclude.HYPERPARAMETERS in include:
+        item.hyperparameters = {
+            param_names.get(hyper_param.param_type_id, str(hyper_param.param_type_id)): hyper_param.param_value
+            for hyper_param in experiment.hyper_param
+        }
+    return item
+
+
+@router.get("", response_model=ExperimentPageSchema)
+async def list_experiments(
+    status_: list[ExperimentStatus] | None = Query(default=None, alias="status"),
+    include: list[ExperimentInclude] = Query(default=[]),
+    cursor: str | None = None,
+    limit: int = Query(default=100, ge=1, le=1000),
+    db: AsyncSession = AsyncSessionDepends,
+):
+    """experiment 목록을 최신순으로 조회한다.
+
+    (created_at, id) 기준 keyset pagination 이므로 page 위치와 관계없이 비용이 같다.
+    status 는 run status sync 가 KFP 상태를 반영해 둔 값이므로 cluster 를 호출하지 않는다.
+    """
+    includes = set(include) - {ExperimentInclude.LOGS}
+    query = select(ExperimentModel).where(ExperimentModel.deleted_at.is_(None))
+    if status_:
+        query = query.where(ExperimentModel.status.in_([s.value for s in status_]))
+    if cursor:
+        try:
+            created_at, last_id = decode_cursor(cursor)
+            created_at = datetime.fromisoformat(created_at)
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid cursor: {cursor}")
+        query = query.where(
+            or_(
+                ExperimentModel.created_at < created_at,
+                and_(ExperimentModel.created_at == created_at, ExperimentModel.id < last_id),
+            )
+        )
+    query = (
+        query.options(*experiment_load_options(includes))
+        .order_by(ExperimentModel.created_at.desc(), ExperimentModel.id.desc())
+        .limit(limit + 1)
+    )
+    experiments = (await db.scalars(query)).unique().all()
+
+    next_cursor = None
+    if len(experiments) > limit:
+        experiments = experiments[:limit]
+        last = experiments[-1]
+        next_cursor = encode_cursor([last.created_at.isoformat(), last.id])
+    param_names = await hyperparameter_names(db) if ExperimentInclude.HYPERPARAMETERS in includes else {}
+    return ExperimentPageSchema(
+        items=[
+            to_experiment_schema(experiment, includes, ExperimentListItemSchema, param_names)
+            for experiment in experiments
+        ],
+        next_cursor=next_cursor,
+    )
+
+
+@router.post("/{experiment_id}/metrics", status_code=status.HTTP_202_ACCEPTED, response_model=MetricIngestResultSchema)
+async def ingest_metrics(experiment_id: int, batch: MetricBatchSchema, db: AsyncSession = AsyncSessionDepends):
+    """학습 job 이 기록한 metric point 를 한 번에 받아 buffer 에 추가한다.
+
+    DB 에는 buffer 가 flush 될 때 multi-row INSERT 로 반영된다.
+    """
+    if len(batch.points) > settings.METRIC_BATCH_MAX_POINTS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Batch has {len(batch.points)} points (limit: {settings.METRIC_BATCH_MAX_POINTS})",
+        )
+    if await db.get(ExperimentModel, experiment_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Experiment {experiment_id} not found")
+
+    rows = [
+        {
+            "experiment_id": experiment_id,
+            "metric_name": point.name,
+            "metric_value": point.value,
+            "step": point.step,
+            "logged_at": point.timestamp,
+        }
+        for point in batch.points
+    ]
+    try:
+        await get_metric_write_buffer().add(rows)
+    except MetricBufferFullError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+    return MetricIngestResultSchema(accepted=len(rows))
+
+
+@router.get("/metrics/series", response_model=list[MetricSeriesSchema])
+async def get_metric_series(
+    experiment_id: list[int] = Query(),
+    metric_name: str = Query(),
+    points: int = Query(default=1000, ge=3),
+    method: DownsamplingMethod = DownsamplingMethod.LTTB,
+    step_from: int | None = None,
+    step_to: int | None = None,
+    db: AsyncSession = AsyncSessionDepends,
+):
+    """experiment 별 metric series 를 step 순으로 조회하고 points 개 이하로 downsampling 한다.
+
+    step 이 없는 point 는 series 에 포함하지 않는다.
+    """
+    if points > settings.METRIC_SERIES_MAX_POINTS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Requested {points} points (limit: {settings.METRIC_SERIES_MAX_POINTS})",
+        )
+    downsample = lttb if method == DownsamplingMethod.LTTB else min_max_buckets
+
+    series = []
+    for exp_id in dict.fromkeys(experiment_id):
+        # (experiment_id, metric_name, step) index 의 range scan
+        query = select(Metric.step, Metric.metric_value).where(
+            Metric.experiment_id == exp_id, Metric.metric_name == metric_name, Metric.step.is_not(None)
+        )
+        if step_from is not None:
+            query = query.where(Metric.step >= step_from)
+        if step_to is not None:
+            query = query.where(Metric.step <= step_to)
+        rows = (await db.execute(query.order_by(Metric.step))).all()
+
+        data = np.array(rows, dtype=np.float64).reshape(-1, 2)
+        steps, values = await asyncio.to_thread(downsample, data[:, 0].astype(np.int64), data[:, 1], points)
+        series.append(
+            MetricSeriesSchema(
+                experiment_id=exp_id,
+                metric_name=metric_name,
+                total_points=len(rows),
+                steps=steps.tolist(),
+                values=values.tolist(),
+            )
+        )
+    return series
+
+
+@router.get("/leaderboard", response_model=list[LeaderboardEntrySchema])
+async def get_leaderboard(
+    model_id: int,
+    metric_name: str,
+    order: RankOrder = RankOrder.DESC,
+    k: int = Query(default=10, ge=1, le=100),
+    db: AsyncSession = AsyncSessionDepends,
+):
+    """model 의 experiment 를 metric 의 best 값으로 정렬해 상위 k 개와 hyperparameter 를 반환한다."""
+    aggregate = func.max if order == RankOrder.DESC else func.min
+    # experiment 마다 (experiment_id, metric_name, metric_value) index 로 MIN/MAX 를 바로 구한다.
+    score = (
+        select(aggregate(Metric.metric_value))
+        .where(Metric.experiment_id == ExperimentModel.id, Metric.metric_name == metric_name)
+        .correlate(ExperimentModel)
+        .scalar_subquery()
+        .label("score")
+    )
+    query = (
+        select(ExperimentModel, score)
+        .where(ExperimentModel.model_id == model_id, ExperimentModel.deleted_at.is_(None), score.is_not(None))
+        .order_by(score.desc() if order == RankOrder.DESC else score.asc(), ExperimentModel.id)
+        .limit(k)
+    )
+    ranked = (await db.execute(query)).all()
+    if not ranked:
+        return []
+
+    hyperparameters: dict[int, dict[str, str]] = {experiment.id: {} for experiment, _ in ranked}
+    param_names = await hyperparameter_names(db)
+    rows = await db.execute(
+        select(Hyperparamter.experiment_id, Hyperparamter.param_type_id, Hyperparamter.param_value).where(
+            Hyperparamter.experiment_id.in_(hyperparameters.keys())
+        )
+    )
+    for experiment_id, param_type_id, param_value in rows:
+        hyperparameters[experiment_id][param_names.get(param_type_id, str(param_type_id))] = param_value
+
+    return [
+        LeaderboardEntrySchema(
+            rank=rank,
+            experiment_id=experiment.id,
+            name=experiment.name,
+            run_id=experiment.run_id,
+            status=experiment.status,
+            score=score_value,
+            hyperparameters=hyperparameters[experiment.id],
+        )
+        for rank, (experiment, score_value) in enumerate(ranked, start=1)
+    ]
+
+
+def hyperparameter_condition(param_type_ids: list[int], hp_filter: HyperparameterFilterSchema) -> ColumnElement:
+    """filter 를 만족하는 experiment_id 의 subquery 조건.
+
+    (param_type_id, numeric_value | categorical_value, experiment_id) index 의 seek 로 처리된다.
+    """
+    if not param_type_ids:
+        return false()
+
+    if hp_filter.op in RANGE_OPERATORS:
+        value_condition = RANGE_OPERATORS[hp_filter.op](Hyperparamter.numeric_value, hp_filter.value)
+    else:
+        candidates = hp_filter.values if hp_filter.op == HyperparameterOperator.IN else [hp_filter.value]
+        numeric_values, categorical_values = [], []
+        for candidate in candidates:
+            numeric_value, categorical_value = split_hyperparameter_value(candidate)
+            if numeric_value is not None:
+                numeric_values.append(numeric_value)
+            else:
+                categorical_values.append(categorical_value)
+        value_condition = or_(
+            Hyperparamter.numeric_value.in_(numeric_values), Hyperparamter.categorical_value.in_(categorical_values)
+        )
+
+    return ExperimentModel.id.in_(
+        select(Hyperparamter.experiment_id).where(Hyperparamter.param_type_id.in_(param_type_ids), value_condition)
+    )
+
+
+@router.post("/search", response_model=list[ExperimentSchema])
+async def search_experiments(search: ExperimentSearchSchema, db: AsyncSession = AsyncSessionDepends):
+    """hyperparameter 값/범위 조건을 모두 만족하는 experiment 를 검색한다."""
+    param_type_ids: dict[str, list[int]] = {hp_filter.name: [] for hp_filter in search.filters}
+    if param_type_ids:
+        for param_type_id, param_name in (await hyperparameter_names(db)).items():
+            if param_name in param_type_ids:
+                param_type_ids[param_name].append(param_type_id)
+
+    query = select(ExperimentModel).where(ExperimentModel.deleted_at.is_(None))
+    if search.model_id is not None:
+        query = query.where(ExperimentModel.model_id == search.model_id)
+    if search.status:
+        query = query.where(ExperimentModel.status.in_([s.value for s in search.status]))
+    for hp_filter in search.filters:
+        query = query.where(hyperparameter_condition(param_type_ids[hp_filter.name], hp_filter))
+    query = query.order_by(ExperimentModel.id.desc()).limit(search.limit).offset(search.offset)
+    return (await db.scalars(query)).all()
+
+
+@router.get("/{experiment_id}", response_model=ExperimentDetailSchema)
+async def get_experiment(
+    experiment_id: int,
+    include: list[ExperimentInclude] = Query(default=[ExperimentInclude.HYPERPARAMETERS]),
+    db: AsyncSession = AsyncSessionDepends,
+):
+    """experiment 상세 조회. include=logs 이면 log 크기 정보를 함께 반환한다."""
+    includes = set(include)
+    query = select(ExperimentModel).where(ExperimentModel.id == experiment_id, ExperimentModel.deleted_at.is_(None))
+    experiment = (await db.scalars(query.options(*experiment_load_options(includes)))).unique().one_or_none()
+    if experiment is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Experiment {experiment_id} not found")
+    param_names = await hyperparameter_names(db) if ExperimentInclude.HYPERPARAMETERS in includes else {}
+    item = to_experiment_schema(experiment, includes, ExperimentDetailSchema, param_names)
+    if ExperimentInclude.LOGS in includes:
+        item.log = await get_experiment_log_store().info(db, experiment_id)
+    return item
+
+
+@router.post("/{experiment_id}/logs", response_model=ExperimentLogInfoSchema)
+async def append_experiment_log(experiment_id: int, request: Request, db: AsyncSession = AsyncSessionDepends):
+    """request body(text) 를 experiment log 끝에 이어 붙인다.
+
+    body 는 받는 대로 chunk 단위로 압축해 저장하므로 크기와 관계없이 메모리 사용량이 일정하다.
+    """
+    if await db.get(ExperimentModel, experiment_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Experiment {experiment_id} not found")
+    info = await get_experiment_log_store().append(db, experiment_id, request.stream())
+    await db.commit()
+    return info
+
+
+@router.get("/{experiment_id}/logs", response_class=StreamingResponse)
+async def read_experiment_log(
+    experiment_id: int,
+    byte_start: int | None = Query(default=None, ge=0),
+    byte_end: int | None = Query(default=None, ge=0),
+    line_start: int | None = Query(default=None, ge=0),
+    line_end: int | None = Query(default=None, ge=0),
+    tail: int | None = Query(default=None, ge=0),
+    db: AsyncSession = AsyncSessionDepends,
+):
+    """experiment log 의 byte 범위, 줄 범위(0 부터, end 미포함) 또는 마지막 tail 줄을 text 로 streaming 한다.
+
+    조건이 없으면 전체 log 를 반환한다. 응답의 X-Log-Range(start-end), X-Log-Total-Bytes header 로
+    이어서 읽을 위치를 알 수 있다 (byte_start=end).
+    """
+    by_byte = byte_start is not None or byte_end is not None
+    by_line = line_start is not None or line_end is not None
+    if by_byte + by_line + (tail is not None) > 1:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Use only one of byte range, line range or tail"
+        )
+    if await db.get(ExperimentModel, experiment_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Experiment {experiment_id} not found")
+
+    store = get_experiment_log_store()
+    start, end, total = await store.locate(db, experiment_id, byte_start, byte_end, line_start, line_end, tail)
+    return StreamingResponse(
+        store.iter_bytes(experiment_id, start, end),
+        media_type="text/plain; charset=utf-8",
+        headers={"Content-Length": str(end - start), "X-Log-Range": f"{start}-{end}", "X-Log-Total-Bytes": str(total)},
+    )
+
+
+@router.get("/{experiment_id}/resource-usage", response_model=list[ResourceUsageSeriesSchema])
+async def get_resource_usage(
+    experiment_id: int,
+    points: int = Query(default=500, ge=3),
+    method: DownsamplingMethod = DownsamplingMethod.MIN_MAX,
+    sampled_from: datetime | None = None,
+    sampled_to: datetime | None = None,
+    db: AsyncSession = AsyncSessionDepends,
+):
+    """experiment 의 resource 사용량을 수집 시각 순으로 조회하고 resource 별로 points 개 이하로 downsampling 한다.
+
+    sampler 의 buffer 에 있는 최근 sample 은 flush 된 뒤에 조회된다.
+    """
+    if points > settings.METRIC_SERIES_MAX_POINTS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Requested {points} points (limit: {settings.METRIC_SERIES_MAX_POINTS})",
+        )
+    if await db.get(ExperimentModel, experiment_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Experiment {experiment_id} not found")
+    downsample = lttb if method == DownsamplingMethod.LTTB else min_max_buckets
+
+    # (experiment_id, sampled_at) index 의 range scan
+    columns = [getattr(ResourceUsage, resource.value) for resource in ResourceName]
+    query = select(ResourceUsage.sampled_at, *columns).where(
+        ResourceUsage.experiment_id == experiment_id, ResourceUsage.sampled_at.is_not(None)
+    )
+    if sampled_from is not None:
+        query = query.where(ResourceUsage.sampled_at >= sampled_from)
+    if sampled_to is not None:
+        query = query.where(ResourceUsage.sampled_at <= sampled_to)
+    rows = (await db.execute(query.order_by(ResourceUsage.sampled_at))).all()
+
+    timestamps = [row[0] for row in rows]
+    # 수집 시각(초)을 x 로 downsampling 하고, 선택된 x 의 위치로 timestamp 를 다시 찾는다.
+    x = np.array([timestamp.timestamp() for timestamp in timestamps], dtype=np.float64)
+    values = np.array([row[1:] for row in rows], dtype=np.float64).reshape(-1, len(columns))
+
+    def downsample_all() -> list[tuple[np.ndarray, np.ndarray]]:
+        return [downsample(x, values[:, i], points) for i in range(len(columns))]
+
+    series = []
+    for resource, (xs, ys) in zip(ResourceName, await asyncio.to_thread(downsample_all)):
+        series.append(
+            ResourceUsageSeriesSchema(
+                experiment_id=experiment_id,
+                resource=resource,
+                total_points=len(rows),
+                timestamps=[timestamps[i] for i in np.searchsorted(x, xs)],
+                values=ys.tolist(),
+            )
+        )
+    return series
@@ -0,0 +1,75 @@
+import logging
+
+from config.db.connect import AsyncSessionDepends
+from config.settings import get_settings
+from core.artifact_cache import ArtifactIntegrityError
+from core.micro_batcher import InferenceQueueFullError
+from core.model_residency import ModelCapacityError, get_model_residency_manager
+from db.models import ModelRegistry
+from fastapi import APIRouter, HTTPException, status
+from schemas.inference import (
+    InferenceRequestSchema,
+    InferenceResponseSchema,
+    ModelResidencySchema,
+    ResidentModelSchema,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+router = APIRouter(prefix="/inference", tags=["Inference"])
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+
+@router.get("/models", response_model=ModelResidencySchema)
+async def get_resident_models():
+    """추론용으로 memory 에 올라와 있는 model 목록과 memory 사용량"""
+    manager = get_model_residency_manager()
+    return ModelResidencySchema(
+        max_bytes=manager.max_bytes,
+        used_bytes=manager.used,
+        models=[
+            ResidentModelSchema(
+                registry_id=resident.registry_id,
+                version=resident.version,
+                task=resident.task,
+                footprint=resident.footprint,
+                pinned=resident.pinned,
+                in_flight=resident.in_flight,
+                loaded_at=resident.loaded_at,
+                last_used_at=resident.last_used_at,
+            )
+            for resident in manager.residents
+        ],
+    )
+
+
+@router.post("/{registry_id}", response_model=InferenceResponseSchema)
+async def predict(registry_id: int, request: InferenceRequestSchema, db: AsyncSession = AsyncSessionDepends):
+    """model version 으로 추론한다.
+
+    동시에 들어온 요청의 입력은 최대 INFERENCE_MAX_WAIT 초 동안 모아 한 번의 forward 로 처리한다.
+    대기 중인 입력이 INFERENCE_MAX_QUEUE 를 넘거나, MODEL_MEMORY_BUDGET 안에 model 을 올릴 수 없으면 503 을 반환한다.
+    """
+    if len(request.inputs) > settings.INFERENCE_REQUEST_MAX_INPUTS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Request has {len(request.inputs)} inputs (limit: {settings.INFERENCE_REQUEST_MAX_INPUTS})",
+        )
+    registry = await db.get(ModelRegistry, registry_id)
+    if registry is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Model registry {registry_id} not found")
+
+    try:
+        outputs = await get_model_residency_manager().predict(registry_id, request.inputs)
+    except (InferenceQueueFullError, ModelCapacityError) as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+    except (ValueError, KeyError) as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except ArtifactIntegrityError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except OSError as e:
+        logger.exception(f"Failed to load model registry {registry_id}")
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=f"Failed to load model: {e}")
+    return InferenceResponseSchema(registry_id=registry_id, outputs=outputs)
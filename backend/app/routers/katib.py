@@ -0,0 +1,102 @@
+import json
+import logging
+
+from config.db.connect import SessionDepends
+from core.katib_manager import get_katib_manager
+from db.models import ExperimentModel
+from fastapi import APIRouter, HTTPException, status
+from kubernetes.client.rest import ApiException
+from schemas.katib import (
+    KatibBudgetSchema,
+    KatibExperimentRequestSchema,
+    KatibExperimentSchema,
+    KatibTrialSchema,
+)
+from sqlalchemy.orm import Session
+
+router = APIRouter(prefix="/katib", tags=["Katib"])
+
+logger = logging.getLogger(__name__)
+
+# Kubernetes API 응답 -> client 에 반환할 상태 (CRD 나 experiment 가 없음, 이름 중복, 잘못된 spec)
+KUBERNETES_ERROR_STATUS = {
+    status.HTTP_404_NOT_FOUND: status.HTTP_404_NOT_FOUND,
+    status.HTTP_409_CONFLICT: status.HTTP_409_CONFLICT,
+    status.HTTP_400_BAD_REQUEST: status.HTTP_422_UNPROCESSABLE_ENTITY,
+    status.HTTP_422_UNPROCESSABLE_ENTITY: status.HTTP_422_UNPROCESSABLE_ENTITY,
+}
+
+
+def katib_error(e: Exception) -> HTTPException:
+    """KatibClient 의 오류를 HTTPException 으로 바꾼다. KatibClient 는 ApiException 을 RuntimeError 로 감싸서 낸다."""
+    if isinstance(e, TimeoutError):
+        return HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail=str(e))
+    api_error = e if isinstance(e, ApiException) else e.__cause__ or e.__context__
+    if not isinstance(api_error, ApiException):
+        logger.exception("Katib request failed")
+        return HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(e))
+    try:
+        message = json.loads(api_error.body)["message"]
+    except (TypeError, ValueError, KeyError):
+        message = api_error.reason
+    status_code = KUBERNETES_ERROR_STATUS.get(api_error.status, status.HTTP_502_BAD_GATEWAY)
+    return HTTPException(status_code=status_code, detail=message if e is api_error else f"{e}: {message}")
+
+
+@router.post("/experiments", status_code=status.HTTP_201_CREATED, response_model=KatibExperimentSchema)
+def create_katib_experiment(request: KatibExperimentRequestSchema, db: Session = SessionDepends):
+    """Katib hyperparameter 탐색을 시작하고, trial 결과를 experiment/hyperparameter/metric 에 기록한다."""
+    if db.get(ExperimentModel, request.experiment_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Experiment {request.experiment_id} not found"
+        )
+
+    katib = get_katib_manager()
+    try:
+        experiment = katib.create_experiment(request)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except (RuntimeError, TimeoutError, ApiException) as e:
+        raise katib_error(e)
+    katib.watch(request.name, request.experiment_id)
+    return KatibExperimentSchema(
+        name=experiment.metadata.name,
+        namespace=experiment.metadata.namespace,
+        experiment_id=request.experiment_id,
+        parallel_trial_count=experiment.spec.parallel_trial_count,
+        max_trial_count=experiment.spec.max_trial_count,
+        max_failed_trial_count=experiment.spec.max_failed_trial_count,
+    )
+
+
+@router.patch("/experiments/{name}/budget", status_code=status.HTTP_204_NO_CONTENT)
+def edit_katib_experiment_budget(name: str, budget: KatibBudgetSchema):
+    """실행 중인 탐색의 병렬 trial 수와 최대 trial 수를 변경한다."""
+    if budget.model_dump(exclude_none=True) == {}:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="No budget to change")
+    try:
+        get_katib_manager().edit_budget(name, budget)
+    except (RuntimeError, TimeoutError, ApiException) as e:
+        raise katib_error(e)
+
+
+@router.get("/experiments/{name}/trials", response_model=list[KatibTrialSchema])
+def get_katib_trials(name: str):
+    """trial 목록을 조회하면서 결과를 DB 에 반영한다."""
+    katib = get_katib_manager()
+    try:
+        base_experiment_id = katib.get_base_experiment_id(name)
+    except (RuntimeError, TimeoutError, ApiException) as e:
+        raise katib_error(e)
+    if base_experiment_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Katib experiment {name} is not linked to an experiment"
+        )
+    # 서버 재시작 등으로 watcher 가 없으면 다시 시작한다.
+    katib.watch(name, base_experiment_id)
+    try:
+        return katib.sync_trials(name, base_experiment_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except (RuntimeError, TimeoutError, ApiException) as e:
+        raise katib_error(e)
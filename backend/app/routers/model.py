@@ -0,0 +1,37 @@
+import logging
+
+from config.db.connect import AsyncSessionDepends
+from core.artifact_cache import ArtifactIntegrityError, fetch_registry_artifact
+from db.models import ModelRegistry
+from fastapi import APIRouter, HTTPException, status
+from schemas.model import ModelArtifactSchema
+from sqlalchemy.ext.asyncio import AsyncSession
+
+router = APIRouter(prefix="/model", tags=["Model"])
+
+logger = logging.getLogger(__name__)
+
+
+async def get_registry(db: AsyncSession, registry_id: int) -> ModelRegistry:
+    registry = await db.get(ModelRegistry, registry_id)
+    if registry is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Model registry {registry_id} not found")
+    return registry
+
+
+@router.post("/registry/{registry_id}/artifact", response_model=ModelArtifactSchema)
+async def cache_model_artifact(registry_id: int, db: AsyncSession = AsyncSessionDepends):
+    """model version 의 artifact 를 local cache 에 받아 둔다 (이미 있으면 바로 반환)."""
+    registry = await get_registry(db, registry_id)
+    try:
+        artifact = await fetch_registry_artifact(db, registry)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except ArtifactIntegrityError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except OSError as e:
+        logger.exception(f"Failed to fetch artifact of model registry {registry_id}")
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=f"Failed to fetch artifact: {e}")
+    return ModelArtifactSchema(
+        registry_id=registry_id, sha256=artifact.sha256, size=artifact.size, path=str(artifact.path)
+    )
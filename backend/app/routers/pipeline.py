@@ -1,9 +1,41 @@
+import asyncio
 import logging
+from typing import Any, Callable
 
+import kfp_server_api
+from config.db.connect import SessionDepends
 from config.settings import get_settings
+from core.experiment_sync import get_experiment_run_sync
+from core.kubeflow_client_pool import KubeflowManagerDepends, get_kubeflow_manager
 from core.kubeflow_manager import KubeflowManager
-from fastapi import APIRouter
-from kfp import dsl
+from core.pipeline_cache import apply_cache_policy, invalidation_salt, run_cache_report
+from core.pipeline_registry import PipelineNotFoundError, get_pipeline_registry
+from core.run_log_streamer import PodLogPosition, get_run_log_streamer
+from core.run_submitter import SubmissionQueueFullError, get_run_submitter
+from core.run_watcher import TERMINAL_RUN_STATES, get_run_status_watcher
+from db.models import Dataset, ExperimentModel, ModelRegistry, PipelineCacheInvalidation
+from fastapi import APIRouter, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from kfp_server_api import ApiException
+from schemas.pipeline import (
+    CacheInvalidationCreateSchema,
+    CacheInvalidationSchema,
+    PipelineRegistrySchema,
+    RegisteredComponentSchema,
+    RegisteredPipelineSchema,
+    RunCacheReportSchema,
+    RunLogPageSchema,
+    RunRequestSchema,
+    RunStatusSchema,
+    SubmissionSchema,
+    SweepRequestSchema,
+    SweepResultSchema,
+    SweepRunSchema,
+)
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from utils.cursor import decode_cursor, encode_cursor
+from utils.sse import SSE_KEEP_ALIVE, format_sse
 
 router = APIRouter(prefix="/pipeline", tags=["Pipeline"])
 
@@ -12,43 +44,311 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+def check_experiments_exist(db: Session, experiment_ids: list[int]):
+    if not experiment_ids:
+        return
+    found = set(db.scalars(select(ExperimentModel.id).where(ExperimentModel.id.in_(experiment_ids))))
+    missing = [experiment_id for experiment_id in experiment_ids if experiment_id not in found]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Experiment {', '.join(map(str, missing))} not found"
+        )
+
+
+def record_run(run: kfp_server_api.V2beta1Run, experiment_id: int | None) -> str:
+    """생성한 run 을 experiment 행에 기록하고 run_id 를 반환한다."""
+    if experiment_id is not None:
+        try:
+            get_experiment_run_sync().attach(experiment_id, RunStatusSchema.model_validate(run))
+        except Exception:
+            # run 은 이미 생성되었으므로 제출은 실패로 처리하지 않는다.
+            logger.exception(f"Failed to record run {run.run_id} on experiment {experiment_id}")
+    return run.run_id
+
+
 # TODO: 작업 세분화 필요.
-@router.post("/all-step")
-def all_step():
-    print(f"{settings.KUBEFLOW_ENDPOINT}")
+@router.post("/all-step", status_code=status.HTTP_202_ACCEPTED, response_model=SubmissionSchema)
+def all_step(request: RunRequestSchema | None = None, db: Session = SessionDepends):
+    """registry 에 등록된 pipeline(request.pipeline) 의 run 을 제출한다.
 
+    request.cache 로 run 전체와 task 별 step cache 사용 여부, 최대 재사용 기간을 정한다.
+    입력이 같은 step 은 이전 run 의 결과를 재사용하므로, 마지막 step 만 바뀌면 앞 step 은 다시 실행하지 않는다.
+    """
+    request = request or RunRequestSchema()
+    try:
+        compiled = get_pipeline_registry().compile(request.pipeline)
+    except PipelineNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Pipeline {request.pipeline} not found")
+    cache_salt = invalidation_salt(db, request.dataset_id, request.model_registry_id)
+    try:
+        pipeline_spec = apply_cache_policy(compiled, request.cache, cache_salt)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    if request.experiment_id is not None:
+        check_experiments_exist(db, [request.experiment_id])
     experiment_name = "aipaas-ml-workflow"
-    # pipeline_name = "ml-workflow-sample-pipeline"
 
-    kf = KubeflowManager(
-        endpoint=settings.KUBEFLOW_ENDPOINT,
-        username=settings.KUBEFLOW_USERNAME,
-        password=settings.KUBEFLOW_PASSWORD,
-        namespace=settings.KUBEFLOW_NAMESPACE,
-    )
+    # 인증, run 생성은 worker thread에서 수행하고 요청은 submission ID만 받아 즉시 반환한다.
+    def submit_run() -> str:
+        kf = get_kubeflow_manager()
+        experiment = kf.get_experiment_by_name(experiment_name=experiment_name)
+        if experiment is None:
+            raise ValueError(f"Experiment {experiment_name} not found")
+        run = kf.create_run(
+            compiled,
+            experiment_id=experiment.experiment_id,
+            arguments=request.arguments,
+            pipeline_spec=pipeline_spec,
+        )
+        return record_run(run, request.experiment_id)
+
+    try:
+        submission = get_run_submitter().submit(submit_run)
+    except SubmissionQueueFullError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+    return SubmissionSchema.model_validate(submission)
+
+
+@router.get("/registry", response_model=PipelineRegistrySchema)
+def get_registry():
+    """실행할 수 있는 pipeline 과 component 목록"""
+    registry = get_pipeline_registry()
+    pipelines = []
+    for registered in registry.pipelines:
+        compiled = registry.compile(registered.name)
+        root_spec = compiled.pipeline_spec.get("pipeline_spec", compiled.pipeline_spec)
+        pipelines.append(
+            RegisteredPipelineSchema(
+                name=registered.name,
+                description=registered.description,
+                pipeline_name=compiled.name,
+                digest=compiled.digest,
+                parameters=root_spec["root"].get("inputDefinitions", {}).get("parameters", {}),
+            )
+        )
+    components = [
+        RegisteredComponentSchema(name=name, digest=registry.component_digest(name))
+        for name in registry.component_names
+    ]
+    return PipelineRegistrySchema(pipelines=pipelines, components=components)
+
+
+@router.get("/submissions/{submission_id}", response_model=SubmissionSchema)
+def get_submission(submission_id: str):
+    submission = get_run_submitter().get(submission_id)
+    if submission is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Submission {submission_id} not found")
+    return SubmissionSchema.model_validate(submission)
 
-    @dsl.container_component
-    def say_hello(name: str):
-        return dsl.ContainerSpec(image="alpine", command=["echo"], args=[f"Hello, {name}!"])
 
-    @dsl.component
-    def say_bye(name: str) -> str:
-        return f"Bye, {name}!!"
+@router.post("/sweep", status_code=status.HTTP_202_ACCEPTED, response_model=SweepResultSchema)
+def sweep(request: SweepRequestSchema, kf: KubeflowManager = KubeflowManagerDepends, db: Session = SessionDepends):
+    """pipeline을 한 번만 compile 하고, argument set 마다 run 생성을 submission queue 에 넣는다.
 
-    @dsl.pipeline
-    def sample_pipeline(name: str = "World") -> str:
-        # say_hello(name=name)
-        bye_task = say_bye(name=name)
-        return bye_task.output
+    run 은 RUN_SUBMIT_CONCURRENCY 개의 worker 가 병렬로 생성하고, 요청은 submission ID 목록만 받아 즉시 반환한다.
+    queue 에 모든 run 이 들어갈 자리가 없으면 아무것도 제출하지 않고 503 을 반환한다.
+    """
+    if request.run_count() > settings.SWEEP_MAX_RUNS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Sweep would create {request.run_count()} runs (limit: {settings.SWEEP_MAX_RUNS})",
+        )
 
-    client = kf.get_kfp_client()
+    experiment = kf.get_experiment_by_name(experiment_name=request.experiment_name)
+    if experiment is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Experiment {request.experiment_name} not found"
+        )
 
-    experiment = kf.get_experiment_by_name(experiment_name=experiment_name)
-    # kf.create_pipeline(sample_pipeline, pipeline_name )
+    try:
+        compiled = get_pipeline_registry().compile(request.pipeline)
+    except PipelineNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Pipeline {request.pipeline} not found")
+    cache_salt = invalidation_salt(db, request.dataset_id, request.model_registry_id)
+    try:
+        pipeline_spec = apply_cache_policy(compiled, request.cache_policy(), cache_salt)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    check_experiments_exist(db, request.experiment_ids)
+    argument_sets = request.argument_sets()
+    experiment_ids = request.experiment_ids or [None] * len(argument_sets)
+    prefix = request.run_name_prefix or compiled.name
 
-    client.create_run_from_pipeline_func(
-        sample_pipeline,
-        # enable_caching=True,  # overrides the above disabling of caching
+    def create_run_job(index: int, arguments: dict[str, Any], experiment_id: int | None) -> Callable[[], str]:
+        def create_run() -> str:
+            run = kf.create_run(
+                compiled,
+                experiment_id=experiment.experiment_id,
+                run_name=f"{prefix}-{index:04d}",
+                arguments=arguments,
+                pipeline_spec=pipeline_spec,
+            )
+            return record_run(run, experiment_id)
+
+        return create_run
+
+    try:
+        submissions = get_run_submitter().submit_all(
+            [
+                create_run_job(index, arguments, experiment_id)
+                for index, (arguments, experiment_id) in enumerate(zip(argument_sets, experiment_ids))
+            ]
+        )
+    except SubmissionQueueFullError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+    return SweepResultSchema(
         experiment_id=experiment.experiment_id,
-        arguments={"name": "KFP!"},
+        pipeline_digest=compiled.digest,
+        runs=[
+            SweepRunSchema(arguments=arguments, submission=SubmissionSchema.model_validate(submission))
+            for arguments, submission in zip(argument_sets, submissions)
+        ],
     )
+
+
+@router.post("/cache/invalidations", status_code=status.HTTP_201_CREATED, response_model=CacheInvalidationSchema)
+def invalidate_cache(request: CacheInvalidationCreateSchema, db: Session = SessionDepends):
+    """dataset 또는 model version 의 step cache 를 무효화한다.
+
+    이후 같은 dataset_id/model_registry_id 로 제출한 run 은 이전 결과를 재사용하지 않고 다시 실행한다.
+    """
+    if request.dataset_id is not None and db.get(Dataset, request.dataset_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Dataset {request.dataset_id} not found")
+    if request.model_registry_id is not None and db.get(ModelRegistry, request.model_registry_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Model registry {request.model_registry_id} not found"
+        )
+    invalidation = PipelineCacheInvalidation(**request.model_dump())
+    db.add(invalidation)
+    db.commit()
+    db.refresh(invalidation)
+    return invalidation
+
+
+@router.get("/cache/invalidations", response_model=list[CacheInvalidationSchema])
+def list_cache_invalidations(
+    dataset_id: int | None = None, model_registry_id: int | None = None, db: Session = SessionDepends
+):
+    query = select(PipelineCacheInvalidation).order_by(PipelineCacheInvalidation.id.desc())
+    if dataset_id is not None:
+        query = query.where(PipelineCacheInvalidation.dataset_id == dataset_id)
+    if model_registry_id is not None:
+        query = query.where(PipelineCacheInvalidation.model_registry_id == model_registry_id)
+    return db.scalars(query).all()
+
+
+@router.get("/runs/{run_id}/cache", response_model=RunCacheReportSchema)
+def get_run_cache_report(run_id: str, kf: KubeflowManager = KubeflowManagerDepends):
+    """run 의 task 별 cache 사용 여부와 cache hit 수"""
+    try:
+        run = kf.get_run(run_id)
+    except ApiException as e:
+        if e.status == status.HTTP_404_NOT_FOUND:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Run {run_id} not found")
+        raise
+    return run_cache_report(run)
+
+
+@router.get("/runs/status", response_model=list[RunStatusSchema])
+def get_run_statuses(run_id: list[str] | None = Query(default=None)):
+    """namespace watcher 가 마지막으로 poll 한 run 상태를 반환 (KFP API 를 run 마다 호출하지 않는다)"""
+    watcher = get_run_status_watcher(settings.KUBEFLOW_NAMESPACE)
+    return watcher.snapshot(set(run_id) if run_id else None, wait=settings.RUN_WATCHER_MAX_INTERVAL)
+
+
+@router.get("/runs/events")
+async def stream_run_events(run_id: list[str] | None = Query(default=None)):
+    """run 상태 변경을 Server-Sent Events 로 push 한다.
+
+    지정한 run 이 모두 종료 상태가 되면 stream 을 닫는다.
+    """
+    run_ids = set(run_id) if run_id else None
+    watcher = get_run_status_watcher(settings.KUBEFLOW_NAMESPACE)
+
+    async def event_stream():
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[list[RunStatusSchema]] = asyncio.Queue()
+
+        def on_change(statuses: list[RunStatusSchema]):
+            if run_ids is not None:
+                statuses = [status for status in statuses if status.run_id in run_ids]
+            if statuses:
+                loop.call_soon_threadsafe(queue.put_nowait, statuses)
+
+        listener = watcher.subscribe(on_change)
+        try:
+            latest = {}
+            statuses = await asyncio.to_thread(watcher.snapshot, run_ids, settings.RUN_WATCHER_MAX_INTERVAL)
+            while True:
+                for run_status in statuses:
+                    latest[run_status.run_id] = run_status.state
+                    yield format_sse(run_status.model_dump_json(), event="run-status")
+                if (
+                    run_ids is not None
+                    and run_ids <= latest.keys()
+                    and all(latest[run] in TERMINAL_RUN_STATES for run in run_ids)
+                ):
+                    return
+                try:
+                    statuses = await asyncio.wait_for(queue.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    statuses = []
+                    yield SSE_KEEP_ALIVE
+        finally:
+            watcher.unsubscribe(listener)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
+def encode_log_cursor(positions: dict[str, PodLogPosition]) -> str:
+    return encode_cursor({name: position.to_cursor() for name, position in positions.items()})
+
+
+@router.get("/runs/{run_id}/logs", response_model=RunLogPageSchema)
+async def get_run_logs(
+    run_id: str,
+    cursor: str | None = None,
+    pod_name: list[str] | None = Query(default=None),
+    follow: bool = False,
+    last_event_id: str | None = Header(default=None),
+):
+    """pod 별로 이전에 읽은 위치 이후의 run log 만 반환한다. (1회에 RUN_LOG_PAGE_MAX_BYTES 까지)
+
+    응답의 cursor 를 다음 요청에 전달하면 새로 쓰인 log 만 받는다.
+    follow=true 이면 run 이 끝날 때까지 Server-Sent Events 로 log 를 push 하고,
+    event id 가 cursor 이므로 재연결 시 Last-Event-ID 로 이어서 받는다.
+    """
+    try:
+        value = decode_cursor(last_event_id or cursor) if (last_event_id or cursor) else {}
+        if not isinstance(value, dict):
+            raise ValueError(f"Invalid cursor: {cursor}")
+        positions = {name: PodLogPosition.from_cursor(position) for name, position in value.items()}
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    pod_names = set(pod_name) if pod_name else None
+    streamer = get_run_log_streamer(settings.KUBEFLOW_NAMESPACE)
+
+    if not follow:
+        chunks, positions, finished = await asyncio.to_thread(streamer.read, run_id, positions, pod_names)
+        return RunLogPageSchema(chunks=chunks, cursor=encode_log_cursor(positions), finished=finished)
+
+    async def event_stream():
+        nonlocal positions
+        idle = 0.0
+        while True:
+            chunks, positions, finished = await asyncio.to_thread(streamer.read, run_id, positions, pod_names)
+            if chunks:
+                idle = 0.0
+                page = RunLogPageSchema(chunks=chunks, cursor=encode_log_cursor(positions), finished=finished)
+                yield format_sse(page.model_dump_json(), event="log", event_id=page.cursor)
+            if finished:
+                yield format_sse("{}", event="end", event_id=encode_log_cursor(positions))
+                return
+            await asyncio.sleep(settings.RUN_LOG_POLL_INTERVAL)
+            idle += settings.RUN_LOG_POLL_INTERVAL
+            if idle >= 15:
+                idle = 0.0
+                yield SSE_KEEP_ALIVE
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
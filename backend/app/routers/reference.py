@@ -0,0 +1,89 @@
+import logging
+
+from config.db.connect import AsyncSessionDepends
+from core.reference_cache import REFERENCE_TABLES, get_reference_cache
+from fastapi import APIRouter, HTTPException, status
+from pydantic import BaseModel
+from schemas.reference import (
+    HyperparameterTypeCreateSchema,
+    ImageRegistryCreateSchema,
+    ModelFormatCreateSchema,
+    ModelProviderCreateSchema,
+    ModelTypeCreateSchema,
+    ReferenceName,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+router = APIRouter(prefix="/reference", tags=["Reference"])
+
+logger = logging.getLogger(__name__)
+
+CREATE_SCHEMAS: dict[ReferenceName, type[BaseModel]] = {
+    ReferenceName.MODEL_FORMAT: ModelFormatCreateSchema,
+    ReferenceName.MODEL_PROVIDER: ModelProviderCreateSchema,
+    ReferenceName.MODEL_TYPE: ModelTypeCreateSchema,
+    ReferenceName.HYPERPARAMETER_TYPE: HyperparameterTypeCreateSchema,
+    ReferenceName.IMAGE_REGISTRY: ImageRegistryCreateSchema,
+}
+
+
+def add_reference_routes(name: ReferenceName):
+    """reference table 하나에 대한 CRUD. 조회는 cache 에서, 쓰기는 version 을 올려 cache 를 무효화한다."""
+    table = REFERENCE_TABLES[name]
+    schema = table.schema
+    create_schema = CREATE_SCHEMAS[name]
+    path = f"/{name.value.replace('_', '-')}"
+
+    async def get_row(db: AsyncSession, id: int):
+        row = await db.get(table.model, id)
+        if row is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{name.value} {id} not found")
+        return row
+
+    async def commit(db: AsyncSession):
+        """변경과 version 증가를 한 transaction 으로 commit 하고, 이 worker 의 cache 를 바로 비운다."""
+        cache = get_reference_cache()
+        await cache.bump(db, name)
+        try:
+            await db.commit()
+        except IntegrityError as e:
+            await db.rollback()
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e.orig))
+        cache.invalidate(name)
+
+    @router.get(path, response_model=list[schema], name=f"list_{name.value}")
+    async def list_rows(db: AsyncSession = AsyncSessionDepends):
+        return list((await get_reference_cache().get_all(db, name)).values())
+
+    @router.get(path + "/{id}", response_model=schema, name=f"get_{name.value}")
+    async def get(id: int, db: AsyncSession = AsyncSessionDepends):
+        row = await get_reference_cache().get(db, name, id)
+        if row is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"{name.value} {id} not found")
+        return row
+
+    @router.post(path, status_code=status.HTTP_201_CREATED, response_model=schema, name=f"create_{name.value}")
+    async def create(body: create_schema, db: AsyncSession = AsyncSessionDepends):
+        row = table.model(**body.model_dump())
+        db.add(row)
+        await commit(db)
+        return schema.model_validate(row)
+
+    @router.put(path + "/{id}", response_model=schema, name=f"update_{name.value}")
+    async def update(id: int, body: create_schema, db: AsyncSession = AsyncSessionDepends):
+        row = await get_row(db, id)
+        for key, value in body.model_dump().items():
+            setattr(row, key, value)
+        await commit(db)
+        return schema.model_validate(row)
+
+    @router.delete(path + "/{id}", status_code=status.HTTP_204_NO_CONTENT, name=f"delete_{name.value}")
+    async def delete(id: int, db: AsyncSession = AsyncSessionDepends):
+        # 참조 중인 행은 FK 제약으로 409
+        await db.delete(await get_row(db, id))
+        await commit(db)
+
+
+for reference_name in ReferenceName:
+    add_reference_routes(reference_name)
@@ -0,0 +1,54 @@
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel, ConfigDict, Field
+
+SHA256_PATTERN = r"^[0-9a-f]{64}$"
+
+
+class DatasetUploadStatus(str, Enum):
+    """dataset_upload.status 에 저장하는 2자리 상태 코드"""
+
+    UPLOADING = "UP"
+    COMPLETED = "CO"
+    ABORTED = "AB"
+
+
+class DatasetSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    url: str
+    description: str | None = None
+    sha256: str | None = None
+    size: int | None = None  # bytes
+    created_at: datetime | None = None
+
+
+class DatasetCreateSchema(BaseModel):
+    name: str = Field(max_length=100)
+    url: str = Field(max_length=1000)  # http(s):// 또는 file:// (PVC 등 mount 된 경로)
+    description: str | None = Field(default=None, max_length=500)
+    sha256: str | None = Field(default=None, pattern=SHA256_PATTERN)  # 주어지면 받은 내용과 비교한다.
+
+
+class DatasetUploadCreateSchema(BaseModel):
+    name: str = Field(max_length=100)
+    file_name: str = Field(max_length=255, pattern=r"^\w[\w.\- ]*$")
+    description: str | None = Field(default=None, max_length=500)
+    size: int | None = Field(default=None, ge=0)  # 주어지면 넘게 받지 않고, 완료 시 크기를 확인한다.
+    sha256: str | None = Field(default=None, pattern=SHA256_PATTERN)
+
+
+class DatasetUploadSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    file_name: str
+    size: int | None = None
+    sha256: str | None = None
+    status: DatasetUploadStatus
+    offset: int = 0  # 지금까지 받은 bytes (이어서 보낼 위치)
+    dataset_id: int | None = None
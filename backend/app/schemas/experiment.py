@@ -0,0 +1,146 @@
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+
+class ExperimentStatus(str, Enum):
+    """experiment.status 에 저장하는 2자리 상태 코드"""
+
+    PENDING = "PE"
+    RUNNING = "RU"
+    SUCCEEDED = "SU"
+    SKIPPED = "SK"
+    FAILED = "FA"
+    EARLY_STOPPED = "ES"  # Katib early stopping 으로 중단된 trial
+    CANCELING = "CI"
+    CANCELED = "CA"
+    PAUSED = "PA"
+    UNKNOWN = "UN"
+
+    @classmethod
+    def from_run_state(cls, state: str | None) -> "ExperimentStatus":
+        """KFP V2beta1RuntimeState 를 상태 코드로 변환"""
+        try:
+            return cls[state]
+        except KeyError:
+            return cls.UNKNOWN
+
+
+class ExperimentSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    model_id: int
+    dataset_id: int
+    image_registry_id: int
+    run_id: str
+    status: ExperimentStatus
+    start_time: datetime | None = None
+    end_time: datetime | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
+
+class ExperimentInclude(str, Enum):
+    HYPERPARAMETERS = "hyperparameters"
+    LOGS = "logs"  # 상세 조회에서만 사용 (log 크기 정보, 본문은 GET /experiment/{id}/logs)
+
+
+class ModelSummarySchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+
+
+class DatasetSummarySchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+
+
+class ImageRegistrySummarySchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    train_image_name: str
+    train_tag: str
+
+
+class ExperimentLogInfoSchema(BaseModel):
+    chunks: int
+    total_bytes: int
+    line_count: int  # 줄바꿈 수
+    updated_at: datetime | None = None  # 마지막 append 시각
+
+
+class ExperimentListItemSchema(ExperimentSchema):
+    model: ModelSummarySchema | None = None
+    dataset: DatasetSummarySchema | None = None
+    image_registry: ImageRegistrySummarySchema | None = None
+    hyperparameters: dict[str, str] | None = None  # include=hyperparameters 일 때만
+
+
+class ExperimentDetailSchema(ExperimentListItemSchema):
+    log: ExperimentLogInfoSchema | None = None  # include=logs 일 때만
+
+
+class ExperimentPageSchema(BaseModel):
+    items: list[ExperimentListItemSchema]
+    next_cursor: str | None  # 다음 page 조회 시 전달 (마지막 page 이면 None)
+
+
+class RankOrder(str, Enum):
+    ASC = "asc"  # 값이 작을수록 좋은 metric (loss 등)
+    DESC = "desc"  # 값이 클수록 좋은 metric (accuracy 등)
+
+
+class LeaderboardEntrySchema(BaseModel):
+    rank: int
+    experiment_id: int
+    name: str
+    run_id: str
+    status: ExperimentStatus
+    score: float  # experiment 의 best metric 값 (order 기준 MIN 또는 MAX)
+    hyperparameters: dict[str, str]
+
+
+class HyperparameterOperator(str, Enum):
+    EQ = "eq"
+    LT = "lt"
+    LE = "le"
+    GT = "gt"
+    GE = "ge"
+    IN = "in"
+
+
+class HyperparameterFilterSchema(BaseModel):
+    name: str  # hyperparameter_type.param_name
+    op: HyperparameterOperator
+    value: float | str | None = None  # eq/lt/le/gt/ge 의 비교 값 (범위 비교는 숫자만)
+    values: list[float | str] | None = None  # in 의 후보 값
+
+    @model_validator(mode="after")
+    def check_operand(self) -> "HyperparameterFilterSchema":
+        if self.op == HyperparameterOperator.IN:
+            if not self.values:
+                raise ValueError(f"'{self.name}': 'in' filter requires non-empty 'values'")
+        elif self.value is None:
+            raise ValueError(f"'{self.name}': '{self.op.value}' filter requires 'value'")
+        elif self.op != HyperparameterOperator.EQ:
+            try:
+                self.value = float(self.value)
+            except ValueError:
+                raise ValueError(f"'{self.name}': '{self.op.value}' filter requires a numeric 'value'")
+        return self
+
+
+class ExperimentSearchSchema(BaseModel):
+    filters: list[HyperparameterFilterSchema] = Field(default_factory=list)  # 모두 만족(AND)하는 experiment 검색
+    model_id: int | None = None
+    status: list[ExperimentStatus] | None = None
+    limit: int = Field(default=100, ge=1, le=1000)
+    offset: int = Field(default=0, ge=0)
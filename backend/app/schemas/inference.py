@@ -0,0 +1,30 @@
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class InferenceRequestSchema(BaseModel):
+    inputs: list[Any] = Field(min_length=1)  # model 입력 목록 (text-classification 이면 문장)
+
+
+class InferenceResponseSchema(BaseModel):
+    registry_id: int
+    outputs: list[Any]  # inputs 와 같은 순서
+
+
+class ResidentModelSchema(BaseModel):
+    registry_id: int
+    version: int
+    task: str
+    footprint: int  # bytes
+    pinned: bool
+    in_flight: int
+    loaded_at: datetime
+    last_used_at: datetime
+
+
+class ModelResidencySchema(BaseModel):
+    max_bytes: int
+    used_bytes: int
+    models: list[ResidentModelSchema]  # 오래 사용하지 않은 순
@@ -0,0 +1,65 @@
+from typing import Any
+
+from pydantic import BaseModel, Field, model_validator
+from schemas.experiment import RankOrder
+
+
+class SearchSpaceSchema(BaseModel):
+    name: str  # hyperparameter_type.param_name
+    min: float | None = None  # int/double 범위
+    max: float | None = None
+    step: float | None = None
+    values: list[str] | None = None  # categorical 후보 값
+
+    @model_validator(mode="after")
+    def check_space(self) -> "SearchSpaceSchema":
+        if self.values is None and (self.min is None or self.max is None):
+            raise ValueError(f"'{self.name}': either 'values' or both 'min' and 'max' are required")
+        if self.min is not None and self.max is not None and self.min > self.max:
+            raise ValueError(f"'{self.name}': 'min' must not be greater than 'max'")
+        return self
+
+
+class EarlyStoppingSchema(BaseModel):
+    min_trials_required: int = Field(default=3, ge=1)  # median 계산에 필요한 완료 trial 수
+    start_step: int = Field(default=4, ge=1)  # 이 step 이후부터 median 과 비교
+
+
+class KatibExperimentRequestSchema(BaseModel):
+    name: str = Field(pattern=r"^[a-z0-9]([-a-z0-9]*[a-z0-9])?$", max_length=63)  # Katib Experiment 이름
+    experiment_id: int  # trial 결과를 기록할 때 model/dataset/image 를 가져올 experiment
+    objective_metric: str
+    objective_order: RankOrder = RankOrder.DESC  # desc: maximize, asc: minimize
+    objective_goal: float | None = None
+    additional_metrics: list[str] = Field(default_factory=list)
+    search_space: list[SearchSpaceSchema] = Field(min_length=1)
+    algorithm: str = "random"
+    parallel_trial_count: int = Field(default=3, ge=1)
+    max_trial_count: int = Field(default=12, ge=1)
+    max_failed_trial_count: int = Field(default=3, ge=0)
+    early_stopping: EarlyStoppingSchema | None = Field(default_factory=EarlyStoppingSchema)  # None: 사용 안 함
+    primary_container_name: str = "training-container"
+    trial_spec: dict[str, Any]  # trial 로 실행할 Kubernetes Job 등의 manifest (${trialParameters.<name>} 사용)
+
+
+class KatibBudgetSchema(BaseModel):
+    parallel_trial_count: int | None = Field(default=None, ge=1)
+    max_trial_count: int | None = Field(default=None, ge=1)
+    max_failed_trial_count: int | None = Field(default=None, ge=0)
+
+
+class KatibTrialSchema(BaseModel):
+    name: str
+    status: str | None  # 마지막 trial condition (Running, Succeeded, EarlyStopped, ...)
+    parameters: dict[str, str]
+    metrics: dict[str, float]  # metric 별 latest 값
+    experiment_id: int | None = None  # 결과가 기록된 experiment
+
+
+class KatibExperimentSchema(BaseModel):
+    name: str
+    namespace: str
+    experiment_id: int
+    parallel_trial_count: int
+    max_trial_count: int
+    max_failed_trial_count: int
@@ -0,0 +1,32 @@
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+
+class MetricPointSchema(BaseModel):
+    name: str = Field(max_length=100)
+    value: float = Field(allow_inf_nan=False)
+    step: int | None = None  # training step (epoch, iteration 등)
+    timestamp: datetime | None = None  # 학습 job 에서 기록한 시각
+
+
+class MetricBatchSchema(BaseModel):
+    points: list[MetricPointSchema] = Field(min_length=1)
+
+
+class MetricIngestResultSchema(BaseModel):
+    accepted: int  # buffer 에 추가된 point 수 (DB 반영은 flush 시점)
+
+
+class DownsamplingMethod(str, Enum):
+    LTTB = "lttb"  # Largest-Triangle-Three-Buckets: 곡선 모양 유지
+    MIN_MAX = "minmax"  # bucket 별 min/max: spike 유지
+
+
+class MetricSeriesSchema(BaseModel):
+    experiment_id: int
+    metric_name: str
+    total_points: int  # downsampling 전 point 수
+    steps: list[int]
+    values: list[float]
@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class ModelArtifactSchema(BaseModel):
+    registry_id: int
+    sha256: str
+    size: int  # bytes
+    path: str  # cache 안의 artifact 경로 (file 또는 directory)
@@ -0,0 +1,172 @@
+import itertools
+import math
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+
+class SubmissionState(str, Enum):
+    QUEUED = "queued"
+    SUBMITTING = "submitting"
+    SUBMITTED = "submitted"
+    FAILED = "failed"
+
+
+class SubmissionSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    submission_id: str
+    state: SubmissionState  # queued / submitting / submitted / failed
+    run_id: str | None  # KFP run ID (state가 submitted 일 때)
+    error: str | None  # 실패 사유 (state가 failed 일 때)
+    created_at: datetime
+    updated_at: datetime
+
+
+class CachePolicySchema(BaseModel):
+    enabled: bool | None = None  # None 이면 component 에 지정된 설정 (kfp 기본값: 사용)
+    max_staleness: timedelta | None = Field(default=None, gt=timedelta(0))  # ISO 8601 (P7D) 또는 seconds
+
+
+class PipelineCachePolicySchema(CachePolicySchema):
+    """run 전체의 cache policy 와 task 별 policy (task 에 없는 항목은 run 의 값을 따른다)"""
+
+    components: dict[str, CachePolicySchema] = {}  # pipeline task 이름 -> policy
+
+
+class RunRequestSchema(BaseModel):
+    pipeline: str = "sample-pipeline"  # pipeline registry 에 등록된 이름 (GET /pipeline/registry)
+    arguments: dict[str, Any] = {"name": "KFP!"}
+    cache: PipelineCachePolicySchema = PipelineCachePolicySchema()
+    dataset_id: int | None = None  # 이 dataset 의 cache 무효화 기록을 반영한다
+    model_registry_id: int | None = None  # 이 model version 의 cache 무효화 기록을 반영한다
+    experiment_id: int | None = None  # 제출한 run 의 상태를 기록할 experiment 행 id
+
+
+class SweepRequestSchema(BaseModel):
+    experiment_name: str = "aipaas-ml-workflow"
+    pipeline: str = "sample-pipeline"  # pipeline registry 에 등록된 이름
+    arguments: list[dict[str, Any]] = []  # 개별 argument set 목록
+    grid: dict[str, list[Any]] = {}  # parameter 이름 -> 후보 값 목록 (모든 조합을 실행)
+    run_name_prefix: str | None = None
+    enable_caching: bool | None = None  # cache.enabled 와 같다 (cache 가 없을 때만 사용)
+    cache: PipelineCachePolicySchema | None = None
+    dataset_id: int | None = None
+    model_registry_id: int | None = None
+    experiment_ids: list[int] = []  # argument set 순서대로 각 run 의 상태를 기록할 experiment 행 id
+
+    @model_validator(mode="after")
+    def check_argument_sets(self):
+        if not self.arguments and not self.grid:
+            raise ValueError("Either arguments or grid is required")
+        if any(len(values) == 0 for values in self.grid.values()):
+            raise ValueError("Every grid parameter needs at least one value")
+        if self.experiment_ids and len(self.experiment_ids) != self.run_count():
+            raise ValueError(f"experiment_ids needs one id per run ({self.run_count()})")
+        if len(set(self.experiment_ids)) != len(self.experiment_ids):
+            raise ValueError("experiment_ids must not repeat")
+        return self
+
+    def cache_policy(self) -> PipelineCachePolicySchema:
+        return self.cache or PipelineCachePolicySchema(enabled=self.enable_caching)
+
+    def run_count(self) -> int:
+        return len(self.arguments) + (math.prod(len(values) for values in self.grid.values()) if self.grid else 0)
+
+    def argument_sets(self) -> list[dict[str, Any]]:
+        """arguments 에 grid 의 모든 조합을 이어붙인 argument set 목록"""
+        names = list(self.grid)
+        grid_sets = [dict(zip(names, values)) for values in itertools.product(*self.grid.values())] if names else []
+        return [*self.arguments, *grid_sets]
+
+
+class SweepRunSchema(BaseModel):
+    arguments: dict[str, Any]
+    submission: SubmissionSchema  # run 생성 결과는 GET /pipeline/submissions/{submission_id} 로 확인한다
+
+
+class SweepResultSchema(BaseModel):
+    experiment_id: str
+    pipeline_digest: str
+    runs: list[SweepRunSchema]
+
+
+class RunStatusSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    run_id: str
+    display_name: str | None = None
+    experiment_id: str | None = None
+    state: str | None = None  # KFP V2beta1RuntimeState (PENDING, RUNNING, SUCCEEDED, FAILED, ...)
+    created_at: datetime | None = None
+    finished_at: datetime | None = None
+
+
+class RunLogChunkSchema(BaseModel):
+    pod_name: str
+    display_name: str | None  # pipeline task 이름
+    offset: int  # data 가 시작하는 byte offset
+    data: str
+
+
+class RunLogPageSchema(BaseModel):
+    chunks: list[RunLogChunkSchema]
+    cursor: str  # 다음 요청에 전달하면 이후의 log 만 받는다
+    finished: bool  # run 이 종료되었고 더 읽을 log 가 없음
+
+
+class CacheInvalidationCreateSchema(BaseModel):
+    dataset_id: int | None = None
+    model_registry_id: int | None = None
+    reason: str | None = Field(default=None, max_length=500)
+
+    @model_validator(mode="after")
+    def check_target(self):
+        if (self.dataset_id is None) == (self.model_registry_id is None):
+            raise ValueError("Exactly one of dataset_id and model_registry_id is required")
+        return self
+
+
+class CacheInvalidationSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    dataset_id: int | None = None
+    model_registry_id: int | None = None
+    reason: str | None = None
+    created_at: datetime | None = None
+
+
+class TaskCacheSchema(BaseModel):
+    task_id: str | None = None
+    display_name: str | None = None
+    state: str | None = None
+    cached: bool  # KFP 는 cache 에서 결과를 가져온 task 를 SKIPPED 로 보고한다
+
+
+class RunCacheReportSchema(BaseModel):
+    run_id: str
+    state: str | None = None
+    tasks: list[TaskCacheSchema]
+    cache_hits: int
+    hit_ratio: float  # cache_hits / task 수 (task 가 없으면 0)
+
+
+class RegisteredPipelineSchema(BaseModel):
+    name: str
+    description: str
+    pipeline_name: str  # IR 의 pipelineInfo.name
+    digest: str  # compile 결과의 sha256 (pipeline 이나 component 가 바뀌면 달라진다)
+    parameters: dict[str, Any]  # 입력 parameter 이름 -> IR parameter 정의 (type, default)
+
+
+class RegisteredComponentSchema(BaseModel):
+    name: str
+    digest: str  # component spec 의 sha256
+
+
+class PipelineRegistrySchema(BaseModel):
+    pipelines: list[RegisteredPipelineSchema]
+    components: list[RegisteredComponentSchema]
@@ -0,0 +1,81 @@
+from enum import Enum
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ReferenceName(str, Enum):
+    """cache 하는 reference table (값은 table 이름)"""
+
+    MODEL_FORMAT = "model_format"
+    MODEL_PROVIDER = "model_provider"
+    MODEL_TYPE = "model_type"
+    HYPERPARAMETER_TYPE = "hyperparameter_type"
+    IMAGE_REGISTRY = "image_registry"
+
+
+class ModelFormatCreateSchema(BaseModel):
+    name: str = Field(max_length=50)
+    description: str | None = Field(default=None, max_length=500)
+
+
+class ModelFormatSchema(ModelFormatCreateSchema):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+
+
+class ModelProviderCreateSchema(BaseModel):
+    name: str = Field(max_length=50)
+    link: str = Field(max_length=256)
+    description: str | None = Field(default=None, max_length=500)
+
+
+class ModelProviderSchema(ModelProviderCreateSchema):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+
+
+class ModelTypeCreateSchema(BaseModel):
+    name: str = Field(max_length=50)
+    description: str | None = Field(default=None, max_length=500)
+
+
+class ModelTypeSchema(ModelTypeCreateSchema):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+
+
+class HyperparameterTypeCreateSchema(BaseModel):
+    param_name: str = Field(max_length=100)
+    param_type: str = Field(max_length=100)  # int, float, str, bool ...
+
+
+class HyperparameterTypeSchema(HyperparameterTypeCreateSchema):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+
+
+class ImageRegistryCreateSchema(BaseModel):
+    train_image_name: str = Field(max_length=300)
+    train_description: str | None = Field(default=None, max_length=500)
+    train_harbor_url: str = Field(max_length=1000)
+    train_tag: str = Field(max_length=100)
+    train_size: int
+    train_sha256_hash: str = Field(max_length=256)
+    train_base_image: str = Field(max_length=300)
+    var_image_name: str = Field(max_length=300)
+    var_description: str | None = Field(default=None, max_length=500)
+    var_harbor_url: str = Field(max_length=1000)
+    var_tag: str = Field(max_length=100)
+    var_size: int
+    var_sha256_hash: str = Field(max_length=256)
+    var_base_image: str = Field(max_length=300)
+
+
+class ImageRegistrySchema(ImageRegistryCreateSchema):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
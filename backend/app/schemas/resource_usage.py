@@ -0,0 +1,21 @@
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel
+
+
+class ResourceName(str, Enum):
+    """resource_usage 의 사용량 column (값은 column 이름)"""
+
+    CPU = "cpu_usage"  # core
+    MEMORY = "memory_usage"  # MiB
+    GPU = "gpu_usage"  # %
+    GPU_MEMORY = "gpu_memory_usage"  # MiB
+
+
+class ResourceUsageSeriesSchema(BaseModel):
+    experiment_id: int
+    resource: ResourceName
+    total_points: int  # downsampling 전 sample 수
+    timestamps: list[datetime]
+    values: list[float]
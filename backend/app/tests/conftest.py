@@ -0,0 +1,56 @@
+import asyncio
+import os
+
+import pytest
+from sqlalchemy import BigInteger, create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# config.settings 의 필수 값 (test 는 DB 와 Kubeflow 에 연결하지 않는다)
+for key, value in {
+    "KUBEFLOW_ENDPOINT": "http://kubeflow.test",
+    "KUBEFLOW_USERNAME": "test",
+    "KUBEFLOW_PASSWORD": "test",
+    "KUBEFLOW_NAMESPACE": "test",
+    "DB_TYPE": "mysql+pymysql",
+    "DB_ASYNC_TYPE": "sqlite+aiosqlite",
+    "DB_NAME": ":memory:",
+    "DB_USER": "test",
+    "DB_PASSWORD": "test",
+    "DB_HOST": "localhost",
+    "DB_PORT": "3306",
+}.items():
+    os.environ.setdefault(key, value)
+
+
+@compiles(BigInteger, "sqlite")
+def compile_big_integer(type_, compiler, **kw):
+    # sqlite 는 INTEGER PRIMARY KEY 만 autoincrement 한다.
+    return "INTEGER"
+
+
+@pytest.fixture
+def session_factory():
+    from db.models import Base
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine, autoflush=False)
+    engine.dispose()
+
+
+@pytest.fixture
+def async_session_factory():
+    from db.models import Base
+
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+
+    async def create_all():
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create_all())
+    yield async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    asyncio.run(engine.dispose())
@@ -0,0 +1,172 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from core.kubeflow_manager import KubeflowManager
+from kfp_server_api import ApiException
+from schemas.authentication import AuthenticationSessionSchema
+from utils.authentication import IstioAuthSessionCache
+
+URL = "http://kubeflow.test"
+
+
+class StubLogin:
+    """get_istio_auth_session 대신 호출 횟수를 세고 매번 새 cookie 를 발급한다."""
+
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.calls = 0
+        self.called_at: list[float] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, url: str, username: str, password: str) -> AuthenticationSessionSchema:
+        time.sleep(self.delay)
+        with self._lock:
+            self.calls += 1
+            self.called_at.append(time.monotonic())
+            cookie = f"authservice_session=session-{self.calls}"
+        return AuthenticationSessionSchema(
+            endpoint_url=url, redirect_url=url, dex_login_url="", is_secured=True, session_cookie=cookie
+        )
+
+
+def wait_until(condition, timeout: float = 5) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return condition()
+
+
+@pytest.fixture
+def make_cache():
+    caches = []
+
+    def make(login, ttl: float = 3600, refresh_margin: float = 300) -> IstioAuthSessionCache:
+        cache = IstioAuthSessionCache(ttl=ttl, refresh_margin=refresh_margin, login=login)
+        caches.append(cache)
+        return cache
+
+    yield make
+    for cache in caches:
+        cache.close()
+
+
+def test_concurrent_gets_share_one_login(make_cache):
+    login = StubLogin(delay=0.2)
+    cache = make_cache(login)
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        sessions = list(executor.map(lambda _: cache.get(URL, "user", "password"), range(16)))
+
+    assert login.calls == 1
+    assert {session.session_cookie for session in sessions} == {"authservice_session=session-1"}
+
+
+def test_refresh_logs_in_once_per_stale_cookie(make_cache):
+    login = StubLogin()
+    cache = make_cache(login)
+    stale = cache.get(URL, "user", "password").session_cookie
+
+    refreshed = cache.refresh(URL, "user", "password", stale_cookie=stale)
+    assert login.calls == 2
+    assert refreshed.session_cookie != stale
+
+    # 다른 caller 가 이미 갱신한 cookie 로 다시 요청하면 새로 로그인하지 않는다.
+    again = cache.refresh(URL, "user", "password", stale_cookie=stale)
+    assert login.calls == 2
+    assert again.session_cookie == refreshed.session_cookie
+
+
+def test_background_refresh_runs_before_expiry(make_cache):
+    login = StubLogin()
+    cache = make_cache(login, ttl=3, refresh_margin=1.5)
+    first = cache.get(URL, "user", "password")
+    expires_at = cache._sessions[(URL, "user")].expires_at
+
+    assert wait_until(lambda: login.calls >= 2)
+    assert login.called_at[1] < expires_at
+    assert cache.get(URL, "user", "password").session_cookie != first.session_cookie
+    assert login.calls == 2
+
+
+def test_idle_session_is_dropped_after_ttl(make_cache):
+    login = StubLogin()
+    cache = make_cache(login, ttl=3, refresh_margin=1)
+    cache.get(URL, "user", "password")
+    cache._sessions[(URL, "user")].last_used -= 4  # 한 TTL 넘게 사용하지 않은 session
+
+    assert wait_until(lambda: (URL, "user") not in cache._sessions)
+    assert login.calls == 1
+
+
+class FakeKubeflowHandler(BaseHTTPRequestHandler):
+    """authservice 처럼 유효한 cookie 가 없는 요청을 거절하는 KFP API"""
+
+    valid_cookie = ""
+    rejection = "redirect"  # redirect: Dex 로 302, unauthorized: 401
+
+    def do_GET(self):
+        if self.path.startswith("/dex/"):
+            self._send(200, b"<html>Log in to Your Account</html>", "text/html")
+        elif self.headers.get("Cookie") == self.valid_cookie:
+            self._send(200, json.dumps({"runs": [{"run_id": "run-1", "state": "RUNNING"}]}).encode())
+        elif self.rejection == "redirect":
+            self.send_response(302)
+            self.send_header("Location", "/dex/auth?client_id=kubeflow-oidc-authservice")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        else:
+            self._send(401, b"")
+
+    def _send(self, status_code: int, body: bytes, content_type: str = "application/json"):
+        self.send_response(status_code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def kubeflow_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeKubeflowHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("rejection", ["redirect", "unauthorized"])
+def test_call_reauthenticates_once_when_the_session_is_rejected(make_cache, kubeflow_server, monkeypatch, rejection):
+    login = StubLogin()
+    cache = make_cache(login)
+    manager = KubeflowManager(kubeflow_server, "user", "password", "test", auth_session_cache=cache)
+    # 서버는 두 번째 로그인의 cookie 만 받는다 (첫 cookie 는 만료된 것으로 본다).
+    monkeypatch.setattr(FakeKubeflowHandler, "valid_cookie", "authservice_session=session-2")
+    monkeypatch.setattr(FakeKubeflowHandler, "rejection", rejection)
+
+    response = manager._call(manager.kfp_client.list_runs)
+
+    assert [run.run_id for run in response.runs] == ["run-1"]
+    assert login.calls == 2
+    assert manager.auth_session.session_cookie == "authservice_session=session-2"
+
+
+def test_redirect_to_dex_is_an_auth_failure():
+    redirect = ApiException(status=302)
+    redirect.headers = {"Location": "https://kubeflow.test/dex/auth?client_id=kubeflow-oidc-authservice"}
+    other_redirect = ApiException(status=302)
+    other_redirect.headers = {"Location": "https://kubeflow.test/pipeline/"}
+
+    assert KubeflowManager._is_auth_failure(ApiException(status=401))
+    assert KubeflowManager._is_auth_failure(redirect)
+    assert not KubeflowManager._is_auth_failure(other_redirect)
+    assert not KubeflowManager._is_auth_failure(ApiException(status=404))
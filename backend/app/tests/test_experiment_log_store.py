@@ -0,0 +1,277 @@
+import asyncio
+import importlib.machinery
+import importlib.util
+import os
+import sys
+import zlib
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+import sqlalchemy as sa
+from core.experiment_log_store import ExperimentLogStore
+from db.models import ExperimentLogChunk, ExperimentModel
+from schemas.experiment import ExperimentStatus
+from sqlalchemy import select
+
+APP_DIR = Path(__file__).resolve().parents[1]
+MIGRATION = APP_DIR / "alembic" / "versions" / "b3f7e1a9c5d2_chunk_experiment_log.py"
+
+
+async def stream(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+def make_store(session_factory, chunk_size: int, *experiment_ids: int) -> ExperimentLogStore:
+    async def create_experiments():
+        async with session_factory() as session:
+            session.add_all(
+                [
+                    ExperimentModel(
+                        id=experiment_id,
+                        name=f"experiment-{experiment_id}",
+                        model_id=1,
+                        dataset_id=1,
+                        image_registry_id=1,
+                        run_id="",
+                        status=ExperimentStatus.RUNNING.value,
+                    )
+                    for experiment_id in experiment_ids or (1,)
+                ]
+            )
+            await session.commit()
+
+    asyncio.run(create_experiments())
+    return ExperimentLogStore(session_factory=session_factory, chunk_size=chunk_size)
+
+
+async def append(store: ExperimentLogStore, *parts: bytes, experiment_id: int = 1):
+    async with store._session_factory() as session:
+        info = await store.append(session, experiment_id, stream(*parts))
+        await session.commit()
+    return info
+
+
+async def load_chunks(store: ExperimentLogStore, experiment_id: int = 1) -> list[tuple]:
+    async with store._session_factory() as session:
+        rows = (
+            await session.execute(
+                select(
+                    ExperimentLogChunk.seq,
+                    ExperimentLogChunk.byte_offset,
+                    ExperimentLogChunk.line_offset,
+                    ExperimentLogChunk.byte_count,
+                    ExperimentLogChunk.line_count,
+                    ExperimentLogChunk.content,
+                )
+                .where(ExperimentLogChunk.experiment_id == experiment_id)
+                .order_by(ExperimentLogChunk.seq)
+            )
+        ).all()
+    return [(*row[:5], zlib.decompress(row.content)) for row in rows]
+
+
+async def read(store: ExperimentLogStore, experiment_id: int = 1, **query) -> bytes:
+    async with store._session_factory() as session:
+        start, end, _ = await store.locate(session, experiment_id, **query)
+    return b"".join([data async for data in store.iter_bytes(experiment_id, start, end)])
+
+
+def test_append_rewrites_partial_chunk_across_the_chunk_boundary(async_session_factory):
+    chunk_size = 256 * 1024
+    store = make_store(async_session_factory, chunk_size)
+    head = b"x" * (chunk_size - 11) + b"\n"  # 마지막 chunk 에 10 byte 가 남는다.
+    tail = b"boundary\nnext line\n"
+
+    async def scenario():
+        first = await append(store, head)
+        before = await load_chunks(store)
+        second = await append(store, tail[:4], tail[4:])
+        return first, before, second, await load_chunks(store)
+
+    first, before, second, chunks = asyncio.run(scenario())
+
+    assert (first.chunks, first.total_bytes, first.line_count) == (1, chunk_size - 10, 1)
+    assert [chunk[:5] for chunk in before] == [(0, 0, 0, chunk_size - 10, 1)]
+    assert (second.chunks, second.total_bytes, second.line_count) == (2, len(head) + len(tail), 3)
+    # 덜 찬 chunk 0 은 chunk_size 까지 다시 쓰고 나머지는 chunk 1 로 들어간다.
+    assert [chunk[:5] for chunk in chunks] == [
+        (0, 0, 0, chunk_size, 2),
+        (1, chunk_size, 2, len(head) + len(tail) - chunk_size, 1),
+    ]
+    assert b"".join(chunk[5] for chunk in chunks) == head + tail
+
+
+def test_append_to_a_full_last_chunk_starts_a_new_chunk(async_session_factory):
+    store = make_store(async_session_factory, 8)
+
+    async def scenario():
+        await append(store, b"1234567\n")
+        await append(store, b"")
+        await append(store, b"ab\ncd")
+        return await load_chunks(store)
+
+    assert asyncio.run(scenario()) == [(0, 0, 0, 8, 1, b"1234567\n"), (1, 8, 1, 5, 1, b"ab\ncd")]
+
+
+LOG = b"first\nsecond line\n\nfourth line is longer\nfifth\n"
+
+
+@pytest.mark.parametrize("chunk_size", [4, 7, 1024])
+def test_byte_and_line_range_reads(async_session_factory, chunk_size):
+    store = make_store(async_session_factory, chunk_size)
+    lines = LOG.splitlines(keepends=True)
+
+    async def scenario():
+        # append 호출 경계와 chunk 경계가 줄 경계와 어긋나게 나눈다.
+        await append(store, LOG[:9], LOG[9:13])
+        await append(store, LOG[13:])
+        return {
+            "bytes": await read(store, byte_start=3, byte_end=20),
+            "open_bytes": await read(store, byte_start=40),
+            "past_end": await read(store, byte_start=100, byte_end=200),
+            "lines": await read(store, line_start=1, line_end=4),
+            "from_line": await read(store, line_start=3),
+            "to_line": await read(store, line_end=1),
+            "empty_line": await read(store, line_start=2, line_end=3),
+            "lines_past_end": await read(store, line_start=5, line_end=9),
+            "whole": await read(store),
+        }
+
+    result = asyncio.run(scenario())
+
+    assert result["bytes"] == LOG[3:20]
+    assert result["open_bytes"] == LOG[40:]
+    assert result["past_end"] == b""
+    assert result["lines"] == b"".join(lines[1:4])
+    assert result["from_line"] == b"".join(lines[3:])
+    assert result["to_line"] == lines[0]
+    assert result["empty_line"] == b"\n"
+    assert result["lines_past_end"] == b""
+    assert result["whole"] == LOG
+
+
+@pytest.mark.parametrize("chunk_size", [3, 1024])
+@pytest.mark.parametrize(
+    "log, tails",
+    [
+        (b"a\nbb\nccc\n", {0: b"", 1: b"ccc\n", 2: b"bb\nccc\n", 10: b"a\nbb\nccc\n"}),
+        # 줄바꿈으로 끝나지 않은 마지막 줄도 한 줄로 센다.
+        (b"a\nbb\nccc", {0: b"", 1: b"ccc", 2: b"bb\nccc", 10: b"a\nbb\nccc"}),
+    ],
+)
+def test_tail_reads(async_session_factory, chunk_size, log, tails):
+    store = make_store(async_session_factory, chunk_size, 1, 2)
+
+    async def scenario():
+        await append(store, log)
+        result = {tail: await read(store, tail=tail) for tail in tails}
+        async with store._session_factory() as session:
+            empty = await store.locate(session, 2, tail=3)
+        return result, empty
+
+    result, empty = asyncio.run(scenario())
+
+    assert result == tails
+    assert empty == (0, 0, 0)
+
+
+def load_migration(monkeypatch):
+    # backend/app/alembic (migration 디렉터리) 이 sys.path 에서 alembic 라이브러리를 가리므로 라이브러리를 직접 불러온다.
+    search_path = [path for path in sys.path if Path(path or os.getcwd()).resolve() != APP_DIR]
+    spec = importlib.machinery.PathFinder.find_spec("alembic", search_path)
+    alembic = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, "alembic", alembic)
+    spec.loader.exec_module(alembic)
+
+    spec = importlib.util.spec_from_file_location("chunk_experiment_log", MIGRATION)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    return migration
+
+
+def test_migration_backfills_chunks_in_log_id_order(monkeypatch):
+    migration = load_migration(monkeypatch)
+    from alembic.operations import Operations
+    from alembic.runtime.migration import MigrationContext
+
+    monkeypatch.setattr(migration, "CHUNK_SIZE", 8)
+    monkeypatch.setattr(migration, "BACKFILL_BATCH_SIZE", 2)
+
+    metadata = sa.MetaData()
+    sa.Table("experiment", metadata, sa.Column("id", sa.Integer, primary_key=True))
+    experiment_log = sa.Table(
+        "experiment_log",
+        metadata,
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("experiment_id", sa.Integer, index=True),
+        sa.Column("content", sa.Text),
+        sa.Column("created_at", sa.TIMESTAMP),
+        sa.Column("updated_at", sa.TIMESTAMP),
+    )
+    # experiment 별 log 를 섞어서, id 순서와 다르게 insert 한다.
+    rows = [
+        (5, 1, "line four\n", 5),
+        (2, 2, "other experiment\n", 2),
+        (1, 1, "line one\nline", 1),
+        (4, 1, " two\nline three\n", 4),
+        (3, 2, "tail without newline", 3),
+        (6, 1, "end", 6),
+    ]
+    engine = sa.create_engine("sqlite://")
+    with engine.begin() as connection:
+        metadata.create_all(connection)
+        connection.execute(sa.insert(metadata.tables["experiment"]), [{"id": 1}, {"id": 2}])
+        for log_id, experiment_id, content, minute in rows:
+            connection.execute(
+                experiment_log.insert().values(
+                    id=log_id,
+                    experiment_id=experiment_id,
+                    content=content,
+                    created_at=datetime(2024, 5, 1, 9, minute),
+                    updated_at=datetime(2024, 5, 1, 10, minute),
+                )
+            )
+        with Operations.context(MigrationContext.configure(connection)):
+            migration.upgrade()
+
+        chunk = migration.experiment_log_chunk
+        migrated = {}
+        for experiment_id in (1, 2):
+            migrated[experiment_id] = connection.execute(
+                sa.select(
+                    chunk.c.seq,
+                    chunk.c.byte_offset,
+                    chunk.c.line_offset,
+                    chunk.c.byte_count,
+                    chunk.c.line_count,
+                    chunk.c.content,
+                    chunk.c.created_at,
+                    chunk.c.updated_at,
+                )
+                .where(chunk.c.experiment_id == experiment_id)
+                .order_by(chunk.c.seq)
+            ).all()
+        tables = sa.inspect(connection).get_table_names()
+    engine.dispose()
+
+    assert "experiment_log" not in tables
+    for experiment_id, expected in [
+        (1, b"line one\nline two\nline three\nline four\nend"),
+        (2, b"other experiment\ntail without newline"),
+    ]:
+        chunks = migrated[experiment_id]
+        assert b"".join(zlib.decompress(row.content) for row in chunks) == expected
+        assert [row.seq for row in chunks] == list(range(len(chunks)))
+        assert all(row.byte_count == 8 for row in chunks[:-1]) and 0 < chunks[-1].byte_count <= 8
+        byte_offset = line_offset = 0
+        for row in chunks:
+            data = zlib.decompress(row.content)
+            assert (row.byte_offset, row.line_offset) == (byte_offset, line_offset)
+            assert (row.byte_count, row.line_count) == (len(data), data.count(b"\n"))
+            byte_offset += row.byte_count
+            line_offset += row.line_count
+    # created_at 은 첫 log row, updated_at 은 chunk 에 마지막으로 더해진 log row 를 따른다.
+    assert migrated[1][0].created_at == datetime(2024, 5, 1, 9, 1)
+    assert migrated[1][-1].updated_at == datetime(2024, 5, 1, 10, 6)
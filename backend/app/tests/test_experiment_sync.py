@@ -0,0 +1,92 @@
+from datetime import datetime
+
+import pytest
+from core.experiment_sync import ExperimentRunSync
+from db.models import ExperimentModel
+from schemas.experiment import ExperimentStatus
+from schemas.pipeline import RunStatusSchema
+
+CREATED_AT = datetime(2024, 5, 1, 9, 0)
+FINISHED_AT = datetime(2024, 5, 1, 9, 30)
+
+
+class FakeRunStatusWatcher:
+    def __init__(self):
+        self.listeners = set()
+        self.statuses: dict[str, RunStatusSchema] = {}
+
+    def subscribe(self, listener):
+        self.listeners.add(listener)
+        return listener
+
+    def unsubscribe(self, listener):
+        self.listeners.discard(listener)
+
+    def snapshot(self, run_ids=None, wait=0):
+        return [self.statuses[run_id] for run_id in run_ids or self.statuses if run_id in self.statuses]
+
+    def report(self, *statuses: RunStatusSchema):
+        for run_status in statuses:
+            self.statuses[run_status.run_id] = run_status
+        for listener in list(self.listeners):
+            listener(list(statuses))
+
+
+@pytest.fixture
+def experiment(session_factory):
+    with session_factory() as session:
+        session.add(
+            ExperimentModel(
+                id=1,
+                name="experiment-1",
+                model_id=1,
+                dataset_id=1,
+                image_registry_id=1,
+                run_id="",
+                status=ExperimentStatus.UNKNOWN.value,
+            )
+        )
+        session.commit()
+
+
+def make_sync(session_factory, watcher) -> ExperimentRunSync:
+    return ExperimentRunSync(watcher=watcher, session_factory=session_factory, batch_size=10, flush_interval=0)
+
+
+def load_experiment(session_factory) -> ExperimentModel:
+    with session_factory() as session:
+        return session.get(ExperimentModel, 1)
+
+
+def test_watcher_change_reaches_attached_experiment(session_factory, experiment):
+    watcher = FakeRunStatusWatcher()
+    sync = make_sync(session_factory, watcher)
+    watcher.subscribe(sync._on_change)
+
+    sync.attach(1, RunStatusSchema(run_id="run-a", state="PENDING", created_at=CREATED_AT))
+    row = load_experiment(session_factory)
+    assert (row.run_id, row.status, row.start_time) == ("run-a", ExperimentStatus.PENDING.value, CREATED_AT)
+
+    watcher.report(
+        RunStatusSchema(run_id="run-a", state="SUCCEEDED", created_at=CREATED_AT, finished_at=FINISHED_AT),
+        RunStatusSchema(run_id="run-other", state="RUNNING", created_at=CREATED_AT),
+    )
+    assert sync.flush() == 2
+
+    row = load_experiment(session_factory)
+    assert (row.status, row.start_time, row.end_time) == (ExperimentStatus.SUCCEEDED.value, CREATED_AT, FINISHED_AT)
+
+
+def test_attach_applies_a_change_reported_before_the_row_was_linked(session_factory, experiment):
+    watcher = FakeRunStatusWatcher()
+    sync = make_sync(session_factory, watcher)
+    sync.start()
+    # 행에 run_id 가 기록되기 전에 watcher 가 보고한 변경 (UPDATE 가 아무 행도 바꾸지 못한다)
+    watcher.report(RunStatusSchema(run_id="run-a", state="RUNNING", created_at=CREATED_AT))
+    sync.flush()
+
+    sync.attach(1, RunStatusSchema(run_id="run-a", state="PENDING", created_at=CREATED_AT))
+    sync.stop(timeout=5)
+
+    row = load_experiment(session_factory)
+    assert (row.run_id, row.status) == ("run-a", ExperimentStatus.RUNNING.value)
@@ -0,0 +1,174 @@
+from datetime import datetime
+
+import pytest
+from core.katib_manager import EXPERIMENT_ID_LABEL, KatibManager
+from db.models import ExperimentModel, HyperparameterType, Hyperparamter, Metric
+from kubeflow.katib import (
+    V1beta1Metric,
+    V1beta1Observation,
+    V1beta1ParameterAssignment,
+    V1beta1Trial,
+    V1beta1TrialCondition,
+    V1beta1TrialSpec,
+    V1beta1TrialStatus,
+)
+from kubernetes.client import V1ObjectMeta
+from schemas.experiment import ExperimentStatus
+from schemas.katib import KatibExperimentRequestSchema, SearchSpaceSchema
+from sqlalchemy import select
+
+STARTED_AT = datetime(2024, 5, 1, 9, 0)
+FINISHED_AT = datetime(2024, 5, 1, 9, 30)
+
+
+class FakeKatibClient:
+    def __init__(self):
+        self.experiments = {}
+        self.trials: list[V1beta1Trial] = []
+
+    def create_experiment(self, experiment, namespace=None):
+        self.experiments[experiment.metadata.name] = experiment
+
+    def get_experiment(self, name, namespace=None):
+        return self.experiments[name]
+
+    def list_trials(self, name, namespace=None):
+        return list(self.trials)
+
+
+def make_trial(name: str, condition: str, parameters: dict[str, str], metrics: dict[str, str]) -> V1beta1Trial:
+    finished = condition in ("Succeeded", "EarlyStopped", "Failed")
+    return V1beta1Trial(
+        metadata=V1ObjectMeta(name=name),
+        spec=V1beta1TrialSpec(
+            parameter_assignments=[
+                V1beta1ParameterAssignment(name=key, value=value) for key, value in parameters.items()
+            ]
+        ),
+        status=V1beta1TrialStatus(
+            conditions=[V1beta1TrialCondition(type=condition, status="True")],
+            observation=V1beta1Observation(
+                metrics=[V1beta1Metric(name=key, latest=value) for key, value in metrics.items()]
+            ),
+            start_time=STARTED_AT,
+            completion_time=FINISHED_AT if finished else None,
+        ),
+    )
+
+
+@pytest.fixture
+def katib_client():
+    return FakeKatibClient()
+
+
+@pytest.fixture
+def manager(session_factory, katib_client):
+    with session_factory() as session:
+        session.add_all(
+            [
+                HyperparameterType(id=1, param_name="lr", param_type="float"),
+                HyperparameterType(id=2, param_name="layers", param_type="int"),
+                HyperparameterType(id=3, param_name="optimizer", param_type="str"),
+                ExperimentModel(
+                    id=1,
+                    name="base",
+                    model_id=1,
+                    dataset_id=1,
+                    image_registry_id=1,
+                    run_id="run-base",
+                    status=ExperimentStatus.SUCCEEDED.value,
+                ),
+            ]
+        )
+        session.commit()
+    return KatibManager(namespace="test", katib_client=katib_client, session_factory=session_factory)
+
+
+def make_request(**changes) -> KatibExperimentRequestSchema:
+    values = {
+        "name": "search",
+        "experiment_id": 1,
+        "objective_metric": "accuracy",
+        "search_space": [
+            SearchSpaceSchema(name="lr", min=0.001, max=0.1),
+            SearchSpaceSchema(name="layers", min=2, max=8, step=2),
+            SearchSpaceSchema(name="optimizer", values=["adam", "sgd"]),
+        ],
+        "trial_spec": {"apiVersion": "batch/v1", "kind": "Job"},
+    }
+    return KatibExperimentRequestSchema(**{**values, **changes})
+
+
+def test_build_parameters_follows_hyperparameter_types(manager, session_factory):
+    with session_factory() as session:
+        lr, layers, optimizer = manager.build_parameters(session, make_request().search_space)
+        discrete = manager.build_parameters(session, [SearchSpaceSchema(name="layers", values=["2", "4"])])
+
+    assert (lr.parameter_type, lr.feasible_space.min, lr.feasible_space.max) == ("double", "0.001", "0.1")
+    assert (layers.parameter_type, layers.feasible_space.min, layers.feasible_space.step) == ("int", "2", "2")
+    assert (optimizer.parameter_type, optimizer.feasible_space.list) == ("categorical", ["adam", "sgd"])
+    assert discrete[0].parameter_type == "discrete"
+
+
+def test_build_parameters_rejects_unknown_and_unbounded_categorical(manager, session_factory):
+    with session_factory() as session:
+        with pytest.raises(ValueError, match="Unknown hyperparameter types: dropout"):
+            manager.build_parameters(session, [SearchSpaceSchema(name="dropout", min=0, max=1)])
+        with pytest.raises(ValueError, match="categorical"):
+            manager.build_parameters(session, [SearchSpaceSchema(name="optimizer", min=0, max=1)])
+
+
+def test_create_experiment_spec(manager, katib_client):
+    manager.create_experiment(make_request(parallel_trial_count=4, max_trial_count=20, max_failed_trial_count=2))
+
+    experiment = katib_client.experiments["search"]
+    spec = experiment.spec
+    assert experiment.metadata.labels == {EXPERIMENT_ID_LABEL: "1"}
+    assert (spec.parallel_trial_count, spec.max_trial_count, spec.max_failed_trial_count) == (4, 20, 2)
+    assert (spec.objective.type, spec.objective.objective_metric_name) == ("maximize", "accuracy")
+    assert spec.early_stopping.algorithm_name == "medianstop"
+    assert {setting.name: setting.value for setting in spec.early_stopping.algorithm_settings} == {
+        "min_trials_required": "3",
+        "start_step": "4",
+    }
+    assert [parameter.name for parameter in spec.trial_template.trial_parameters] == ["lr", "layers", "optimizer"]
+
+    manager.create_experiment(make_request(name="no-early-stop", early_stopping=None))
+    assert katib_client.experiments["no-early-stop"].spec.early_stopping is None
+
+
+def test_sync_trials_writes_metrics_once_when_a_trial_finishes(manager, katib_client, session_factory):
+    parameters = {"lr": "0.01", "layers": "4", "optimizer": "adam"}
+    katib_client.trials = [make_trial("search-a", "Running", parameters, {"accuracy": "0.5"})]
+    (running,) = manager.sync_trials("search", 1)
+
+    katib_client.trials = [make_trial("search-a", "Succeeded", parameters, {"accuracy": "0.9"})]
+    manager.sync_trials("search", 1)
+    (succeeded,) = manager.sync_trials("search", 1)
+
+    assert running.experiment_id == succeeded.experiment_id
+    with session_factory() as session:
+        row = session.get(ExperimentModel, succeeded.experiment_id)
+        assert (row.run_id, row.status, row.end_time) == ("search-a", ExperimentStatus.SUCCEEDED.value, FINISHED_AT)
+        metrics = session.execute(
+            select(Metric.metric_name, Metric.metric_value).where(Metric.experiment_id == row.id)
+        ).all()
+        assert metrics == [("accuracy", 0.9)]
+        values = session.execute(
+            select(Hyperparamter.param_type_id, Hyperparamter.numeric_value, Hyperparamter.categorical_value)
+            .where(Hyperparamter.experiment_id == row.id)
+            .order_by(Hyperparamter.param_type_id)
+        ).all()
+        assert values == [(1, 0.01, None), (2, 4.0, None), (3, None, "adam")]
+
+
+def test_sync_trials_skips_parameters_without_a_type(manager, katib_client, session_factory):
+    katib_client.trials = [make_trial("search-a", "Running", {"lr": "0.01", "renamed": "1"}, {})]
+
+    (trial,) = manager.sync_trials("search", 1)
+
+    with session_factory() as session:
+        param_type_ids = session.scalars(
+            select(Hyperparamter.param_type_id).where(Hyperparamter.experiment_id == trial.experiment_id)
+        ).all()
+    assert param_type_ids == [1]
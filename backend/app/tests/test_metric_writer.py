@@ -0,0 +1,144 @@
+import asyncio
+
+import pytest
+from core.metric_writer import MetricBufferFullError, MetricWriteBuffer
+from db.models import Metric
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+
+
+class FlakyAsyncSessionFactory:
+    def __init__(self, session_factory):
+        self.session_factory = session_factory
+        self.down = False
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.down:
+            raise OperationalError("INSERT INTO metric", {}, ConnectionRefusedError("database is down"))
+        return self.session_factory()
+
+
+def make_buffer(session_factory, flush_size: int = 100, max_pending: int = 1000, max_retries: int = 3):
+    return MetricWriteBuffer(
+        session_factory=session_factory,
+        flush_size=flush_size,
+        flush_interval=60,
+        max_pending=max_pending,
+        max_retries=max_retries,
+    )
+
+
+def make_rows(count: int, rejected: tuple[int, ...] = ()) -> list[dict]:
+    # metric_name 은 NOT NULL 이므로 None 인 row 는 DB 가 거부한다.
+    return [
+        {
+            "experiment_id": 1,
+            "metric_name": None if step in rejected else "loss",
+            "metric_value": float(step),
+            "step": step,
+            "logged_at": None,
+        }
+        for step in range(count)
+    ]
+
+
+def stored_steps(session_factory) -> list[int]:
+    async def load():
+        async with session_factory() as session:
+            return list(await session.scalars(select(Metric.step).order_by(Metric.id)))
+
+    return asyncio.run(load())
+
+
+def test_flush_drops_only_rejected_rows(async_session_factory):
+    buffer = make_buffer(async_session_factory)
+
+    async def ingest():
+        await buffer.add(make_rows(10, rejected=(3, 7)))
+        return await buffer.flush()
+
+    assert asyncio.run(ingest()) == 8
+    assert stored_steps(async_session_factory) == [0, 1, 2, 4, 5, 6, 8, 9]
+    assert buffer._rows == []
+
+
+def test_rows_are_kept_during_an_outage_and_written_once_it_ends(async_session_factory):
+    database = FlakyAsyncSessionFactory(async_session_factory)
+    buffer = make_buffer(database, max_retries=3)
+
+    async def ingest():
+        database.down = True
+        await buffer.add(make_rows(5))
+        assert await buffer.flush() == 0
+        assert await buffer.flush() == 0
+        assert len(buffer._rows) == 5
+        database.down = False
+        return await buffer.flush()
+
+    assert asyncio.run(ingest()) == 5
+    assert stored_steps(async_session_factory) == [0, 1, 2, 3, 4]
+
+
+def test_rows_are_dropped_after_max_retries(async_session_factory):
+    database = FlakyAsyncSessionFactory(async_session_factory)
+    buffer = make_buffer(database, max_retries=2)
+
+    async def ingest():
+        database.down = True
+        await buffer.add(make_rows(5))
+        for _ in range(2):
+            assert await buffer.flush() == 0
+            assert len(buffer._rows) == 5
+        assert await buffer.flush() == 0
+        assert buffer._rows == []
+        database.down = False
+        # 다음 row 는 처음부터 다시 max_retries 만큼 시도한다.
+        await buffer.add(make_rows(2))
+        return await buffer.flush()
+
+    assert asyncio.run(ingest()) == 2
+    assert stored_steps(async_session_factory) == [0, 1]
+
+
+def test_outage_while_isolating_keeps_the_remaining_rows(async_session_factory):
+    database = FlakyAsyncSessionFactory(async_session_factory)
+    buffer = make_buffer(database)
+    write = buffer._write
+
+    async def write_then_fail(rows):
+        # 거부된 row 를 찾는 중에 DB 연결이 끊긴다.
+        if database.calls >= 3:
+            database.down = True
+        await write(rows)
+
+    buffer._write = write_then_fail
+
+    async def ingest():
+        await buffer.add(make_rows(8, rejected=(6,)))
+        assert await buffer.flush() == 4
+        assert [row["step"] for row in buffer._rows] == [4, 5, 6, 7]
+        database.down = False
+        buffer._write = write
+        return await buffer.flush()
+
+    assert asyncio.run(ingest()) == 3
+    assert stored_steps(async_session_factory) == [0, 1, 2, 3, 4, 5, 7]
+
+
+def test_add_raises_when_the_buffer_is_full(async_session_factory):
+    database = FlakyAsyncSessionFactory(async_session_factory)
+    buffer = make_buffer(database, flush_size=4, max_pending=6)
+
+    async def ingest():
+        database.down = True
+        await buffer.add(make_rows(4))  # flush_size 에 도달해 flush 하지만 DB 가 끊겨 buffer 에 남는다.
+        assert len(buffer._rows) == 4
+        with pytest.raises(MetricBufferFullError):
+            await buffer.add(make_rows(3))
+        assert len(buffer._rows) == 4
+        await buffer.add(make_rows(2))
+
+    asyncio.run(ingest())
+    assert len(buffer._rows) == 6
@@ -0,0 +1,91 @@
+import pytest
+from core.resource_sampler import FakeResourceUsageSource, ResourceUsageSampler
+from db.models import ExperimentModel, ResourceUsage
+from schemas.experiment import ExperimentStatus
+from sqlalchemy import select
+
+
+@pytest.fixture
+def experiments(session_factory):
+    with session_factory() as session:
+        for experiment_id, status in (
+            (1, ExperimentStatus.RUNNING),
+            (2, ExperimentStatus.PENDING),
+            (3, ExperimentStatus.SUCCEEDED),
+        ):
+            session.add(
+                ExperimentModel(
+                    id=experiment_id,
+                    name=f"experiment-{experiment_id}",
+                    model_id=1,
+                    dataset_id=1,
+                    image_registry_id=1,
+                    run_id=f"run-{experiment_id}",
+                    status=status.value,
+                )
+            )
+        session.commit()
+
+
+class FlakySessionFactory:
+    def __init__(self, session_factory):
+        self.session_factory = session_factory
+        self.down = False
+
+    def __call__(self):
+        if self.down:
+            raise ConnectionError("database is down")
+        return self.session_factory()
+
+
+def make_sampler(session_factory, ring_size: int = 10) -> ResourceUsageSampler:
+    return ResourceUsageSampler(
+        source=FakeResourceUsageSource(seed=0),
+        session_factory=session_factory,
+        sample_interval=1,
+        flush_interval=60,
+        ring_size=ring_size,
+    )
+
+
+def stored_rows(session_factory) -> list[ResourceUsage]:
+    with session_factory() as session:
+        return session.scalars(
+            select(ResourceUsage).order_by(ResourceUsage.experiment_id, ResourceUsage.sampled_at)
+        ).all()
+
+
+def test_sample_and_flush_active_experiments(session_factory, experiments):
+    sampler = make_sampler(session_factory)
+
+    assert sampler.sample() == 2
+    assert sampler.sample() == 2
+    assert sampler.flush() == 4
+    assert sampler.flush() == 0
+
+    rows = stored_rows(session_factory)
+    assert [row.experiment_id for row in rows] == [1, 1, 2, 2]
+    assert all(row.cpu_usage >= 0 and row.memory_usage >= 0 for row in rows)
+
+
+def test_ring_keeps_newest_samples_while_writes_fail(session_factory, experiments):
+    database = FlakySessionFactory(session_factory)
+    sampler = make_sampler(database, ring_size=3)
+    for _ in range(2):
+        sampler.sample()
+    database.down = True
+    assert sampler.flush() == 0
+
+    database.down = False
+    for _ in range(3):
+        sampler.sample()
+    assert sampler._is_full()
+    newest = {experiment_id: [row["sampled_at"] for row in ring] for experiment_id, ring in sampler._rings.items()}
+    assert all(len(sampled_at) == 3 for sampled_at in newest.values())
+
+    assert sampler.flush() == 6
+    rows = stored_rows(session_factory)
+    for experiment_id in (1, 2):
+        assert [row.sampled_at for row in rows if row.experiment_id == experiment_id] == [
+            sampled_at.replace(tzinfo=None) for sampled_at in newest[experiment_id]
+        ]
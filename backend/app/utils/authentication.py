@@ -1,9 +1,18 @@
+import logging
 import re
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable
 from urllib.parse import urlsplit
 
 import requests
+from config.settings import get_settings
 from schemas.authentication import AuthenticationSessionSchema
 
+logger = logging.getLogger(__name__)
+
 
 # TODO: LDAP 타입도 받을수 있도록 추가 작업 필요.
 def get_istio_auth_session(url: str, username: str, password: str) -> AuthenticationSessionSchema:
@@ -61,7 +70,7 @@ def get_istio_auth_session(url: str, username: str, password: str) -> Authentica
         # if we were NOT redirected, then the endpoint is UNSECURED
         if len(resp.history) == 0:
             auth_session["is_secured"] = False
-            return auth_session
+            return AuthenticationSessionSchema(**auth_session)
         else:
             auth_session["is_secured"] = True
 
@@ -136,3 +145,144 @@ def get_istio_auth_session(url: str, username: str, password: str) -> Authentica
         auth_session["session_cookie"] = "; ".join([f"{c.name}={c.value}" for c in s.cookies])
 
     return AuthenticationSessionSchema(**auth_session)
+
+
+@dataclass
+class _CachedAuthSession:
+    session: AuthenticationSessionSchema
+    password: str
+    expires_at: float
+    last_used: float
+
+
+class IstioAuthSessionCache:
+    """
+    Cache of Istio/Dex authentication sessions keyed by (url, username).
+
+    - Sessions are reused until ``ttl`` seconds after login.
+    - A background thread logs in again ``refresh_margin`` seconds before a session expires,
+      so callers normally never wait for a login. Sessions unused for a whole ``ttl`` are dropped instead.
+    - Logins for the same key are single-flight: concurrent callers wait for the login in progress
+      and share its result instead of logging in in parallel.
+
+    Args:
+        ttl (float): Lifetime of a session cookie in seconds.
+        refresh_margin (float): How long before expiry the background refresh kicks in.
+        login (Callable): Login function, ``get_istio_auth_session`` by default.
+            Point ``url`` at a local fake Dex server (or pass a stub) to test without a cluster.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        refresh_margin: float,
+        login: Callable[..., AuthenticationSessionSchema] = get_istio_auth_session,
+    ):
+        self.ttl = ttl
+        self.refresh_margin = min(refresh_margin, ttl / 2)
+        self._login_func = login
+        self._sessions: dict[tuple[str, str], _CachedAuthSession] = {}
+        self._key_locks: dict[tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._refresher: threading.Thread | None = None
+
+    def get(self, url: str, username: str, password: str) -> AuthenticationSessionSchema:
+        """Return a valid session, logging in only if there is no usable cached one."""
+        cached = self._sessions.get((url, username))
+        now = time.monotonic()
+        if cached is not None and cached.password == password and cached.expires_at > now:
+            cached.last_used = now
+            return cached.session
+        return self._login(url=url, username=username, password=password, stale=cached)
+
+    def refresh(self, url: str, username: str, password: str, stale_cookie: str) -> AuthenticationSessionSchema:
+        """
+        Re-authenticate after the server rejected ``stale_cookie`` (401 / redirect to Dex).
+
+        If another caller already replaced that cookie, the newer session is returned without a new login.
+        """
+        cached = self._sessions.get((url, username))
+        if cached is not None and cached.session.session_cookie != stale_cookie:
+            return self.get(url=url, username=username, password=password)
+        return self._login(url=url, username=username, password=password, stale=cached)
+
+    def invalidate(self, url: str, username: str):
+        with self._lock:
+            self._sessions.pop((url, username), None)
+
+    def close(self):
+        """Stop the background refresh thread."""
+        self._stop_event.set()
+        if self._refresher is not None:
+            self._refresher.join()
+            self._refresher = None
+
+    def _login(
+        self, url: str, username: str, password: str, stale: _CachedAuthSession | None, background: bool = False
+    ) -> AuthenticationSessionSchema:
+        key = (url, username)
+        with self._key_lock(key):
+            cached = self._sessions.get(key)
+            # 대기하는 동안 다른 thread가 이미 로그인을 끝낸 경우 그 결과를 사용한다.
+            if (
+                cached is not None
+                and cached is not stale
+                and cached.password == password
+                and cached.expires_at > time.monotonic()
+            ):
+                return cached.session
+
+            session = self._login_func(url=url, username=username, password=password)
+            with self._lock:
+                now = time.monotonic()
+                self._sessions[key] = _CachedAuthSession(
+                    session=session,
+                    password=password,
+                    expires_at=now + self.ttl,
+                    last_used=stale.last_used if background and stale is not None else now,
+                )
+            logger.info(f"Authenticated against {url} as {username}")
+            self._ensure_refresher()
+            return session
+
+    def _key_lock(self, key: tuple[str, str]) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _ensure_refresher(self):
+        with self._lock:
+            if self._refresher is not None and self._refresher.is_alive():
+                return
+            self._stop_event.clear()
+            self._refresher = threading.Thread(target=self._refresh_loop, name="istio-auth-refresher", daemon=True)
+            self._refresher.start()
+
+    def _refresh_loop(self):
+        interval = max(self.refresh_margin / 2, 1)
+        while not self._stop_event.wait(interval):
+            now = time.monotonic()
+            with self._lock:
+                # 한 TTL 동안 사용되지 않은 session은 갱신하지 않고 버린다.
+                for key in [key for key, cached in self._sessions.items() if now - cached.last_used > self.ttl]:
+                    del self._sessions[key]
+                expiring = [
+                    (key, cached)
+                    for key, cached in self._sessions.items()
+                    if cached.expires_at - now <= self.refresh_margin
+                ]
+            for (url, username), cached in expiring:
+                try:
+                    self._login(url=url, username=username, password=cached.password, stale=cached, background=True)
+                except Exception as e:
+                    # 갱신에 실패해도 만료 전까지는 기존 session을 그대로 사용한다.
+                    logger.warning(f"Failed to refresh auth session for {url} ({username}): {e}")
+
+
+@lru_cache
+def get_istio_auth_session_cache() -> IstioAuthSessionCache:
+    settings = get_settings()
+    return IstioAuthSessionCache(
+        ttl=settings.KUBEFLOW_AUTH_SESSION_TTL,
+        refresh_margin=settings.KUBEFLOW_AUTH_SESSION_REFRESH_MARGIN,
+    )
@@ -0,0 +1,16 @@
+import base64
+import json
+from typing import Any
+
+
+def encode_cursor(value: Any) -> str:
+    """JSON 으로 직렬화 가능한 값을 URL-safe 한 opaque cursor 문자열로 변환"""
+    return base64.urlsafe_b64encode(json.dumps(value, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Any:
+    """encode_cursor 의 역변환. 잘못된 cursor 는 ValueError"""
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
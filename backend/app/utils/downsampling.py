@@ -0,0 +1,55 @@
+import numpy as np
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> tuple[np.ndarray, np.ndarray]:
+    """Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last points and, from each of the ``n_out - 2`` buckets in between, the
+    point forming the largest triangle with the previously selected point and the mean of the next
+    bucket. ``x`` must be sorted. Returns the input unchanged when it already has ``n_out`` points or
+    fewer.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    x_f = x.astype(np.float64)
+    y_f = y.astype(np.float64)
+    # bucket 경계 (첫/마지막 point 는 항상 포함)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    # 다음 bucket 의 평균점은 선택 결과와 무관하므로 한 번에 계산한다.
+    counts = np.diff(edges)
+    next_x = np.append(np.add.reduceat(x_f[1 : n - 1], edges[:-1] - 1) / counts, x_f[-1])
+    next_y = np.append(np.add.reduceat(y_f[1 : n - 1], edges[:-1] - 1) / counts, y_f[-1])
+
+    prev = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        bx, by = x_f[start:end], y_f[start:end]
+        area = np.abs((x_f[prev] - next_x[i + 1]) * (by - y_f[prev]) - (x_f[prev] - bx) * (next_y[i + 1] - y_f[prev]))
+        prev = start + int(np.argmax(area))
+        selected[i + 1] = prev
+    return x[selected], y[selected]
+
+
+def min_max_buckets(x: np.ndarray, y: np.ndarray, n_out: int) -> tuple[np.ndarray, np.ndarray]:
+    """Min/max bucketing: split into ``n_out // 2`` buckets and keep each bucket's min and max point.
+
+    Preserves spikes that averaging would hide. ``x`` must be sorted; the output stays in x order.
+    """
+    n = len(x)
+    n_buckets = n_out // 2
+    if n_out >= n or n_buckets < 1:
+        return x, y
+
+    starts = np.linspace(0, n, n_buckets + 1).astype(np.int64)[:-1]
+    bucket = np.repeat(np.arange(n_buckets), np.diff(np.append(starts, n)))
+    # bucket 별 (y, index) 정렬 후 각 bucket 의 처음/마지막이 min/max
+    order = np.lexsort((y, bucket))
+    ends = np.append(starts[1:], n) - 1
+    picked = np.unique(np.concatenate([order[starts], order[ends]]))
+    return x[picked], y[picked]
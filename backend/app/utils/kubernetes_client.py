@@ -0,0 +1,22 @@
+from functools import lru_cache
+
+from kubernetes import client, config
+
+
+@lru_cache
+def load_kubernetes_config():
+    """cluster 내부에서는 ServiceAccount, 외부에서는 kubeconfig 설정을 사용"""
+    try:
+        config.load_incluster_config()
+    except config.ConfigException:
+        config.load_kube_config()
+
+
+def get_core_v1_api() -> client.CoreV1Api:
+    load_kubernetes_config()
+    return client.CoreV1Api()
+
+
+def get_custom_objects_api() -> client.CustomObjectsApi:
+    load_kubernetes_config()
+    return client.CustomObjectsApi()
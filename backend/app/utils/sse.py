@@ -0,0 +1,12 @@
+def format_sse(data: str, event: str | None = None, event_id: str | None = None) -> str:
+    """Server-Sent Events 형식의 message 문자열을 만든다."""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if event is not None:
+        lines.append(f"event: {event}")
+    lines.extend(f"data: {line}" for line in data.splitlines() or [""])
+    return "\n".join(lines) + "\n\n"
+
+
+SSE_KEEP_ALIVE = ": keep-alive\n\n"